@@ -0,0 +1,133 @@
+import asyncio
+import json
+import sys
+from field import afield
+from gen_random import agen_random
+from unique import AsyncUnique
+from cm_timer import cm_timer_1
+
+# Маркер конца потока в очереди между стадиями
+_END = object()
+
+
+class _Failure:
+    # Ошибка стадии, передаваемая по очереди следующей стадии
+    def __init__(self, exc):
+        self.exc = exc
+
+
+async def _from_queue(queue):
+    while True:
+        item = await queue.get()
+        if item is _END:
+            return
+        if isinstance(item, _Failure):
+            raise item.exc
+        yield item
+
+
+async def _to_queue(items, queue):
+    try:
+        async for item in items:
+            await queue.put(item)
+    except Exception as exc:
+        await queue.put(_Failure(exc))
+        return
+    await queue.put(_END)
+
+
+async def pipeline(source, *stages, maxsize=100):
+    # Каждая стадия - асинхронный генератор, читающий из ограниченной очереди
+    # предыдущей стадии. Если следующая стадия не успевает, put() ждет.
+    queue = asyncio.Queue(maxsize)
+    tasks = [asyncio.create_task(_to_queue(source, queue))]
+    for stage in stages:
+        out = asyncio.Queue(maxsize)
+        tasks.append(asyncio.create_task(_to_queue(stage(_from_queue(queue)), out)))
+        queue = out
+    try:
+        async for item in _from_queue(queue):
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def iter_json_lines(reader):
+    # Читает записи из потока (например, сокета) по одной JSON-строке
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        if line.strip():
+            yield json.loads(line)
+
+
+async def af1(items):
+    # Сортировка требует всех значений, поэтому здесь стадия накапливает поток
+    jobs = [job async for job in AsyncUnique(afield(items, 'job-name'), ignore_case=True)]
+    for job in sorted(jobs, key=lambda x: x.lower()):
+        yield job
+
+
+async def af2(items):
+    async for item in items:
+        if item.lower().startswith('программист'):
+            yield item
+
+
+async def af3(items):
+    async for item in items:
+        yield f"{item} с опытом Python"
+
+
+async def af4(items):
+    async for item in items:
+        async for salary in agen_random(1, 100000, 200000):
+            yield f"{item}, зарплата {salary} руб."
+
+
+async def process_stream(source, maxsize=100):
+    return [item async for item in pipeline(source, af1, af2, af3, af4, maxsize=maxsize)]
+
+
+async def main(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    # Локальный сокет как источник данных: сервер отдает записи JSON-строками
+    async def handle(reader, writer):
+        for item in data:
+            writer.write(json.dumps(item, ensure_ascii=False).encode('utf-8') + b'\n')
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        result = await process_stream(iter_json_lines(reader), maxsize=2)
+        writer.close()
+        await writer.wait_closed()
+
+    print('process_stream')
+    for item in result:
+        print(item)
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else 'data_light.json'
+    with cm_timer_1():
+        asyncio.run(main(path))
+
+
+#afield, AsyncUnique, agen_random - асинхронные варианты field, Unique, gen_random
+
+#pipeline(source, *stages, maxsize) - соединяет стадии ограниченными очередями asyncio.Queue,
+#каждая стадия работает в своей задаче, медленная стадия притормаживает предыдущие
+
+#af1..af4 - те же стадии, что f1..f4 в process_data.py, но над асинхронным потоком
+
+#main() - поднимает локальный сокет-сервер с данными из json и прогоняет их через конвейер
\ No newline at end of file
@@ -1,38 +1,74 @@
-def field(items, *args):
-    assert len(args) > 0
-
-    if len(args) == 1:
-        # Если передан один аргумент - возвращаем только значения
-        key = args[0]
-        for item in items:
-            if key in item and item[key] is not None:
-                yield item[key]
-    else:
-        # Если передано несколько аргументов - возвращаем словари
-        for item in items:
-            result = {}
-            has_values = False
-            for key in args:
-                if key in item and item[key] is not None:
-                    result[key] = item[key]
-                    has_values = True
-            if has_values:
-                yield result
-
-
-if __name__ == "__main__":
-    # Тестовые данные
-    goods = [
-        {'title': 'Ковер', 'price': 2000, 'color': 'green'},
-        {'title': 'Диван для отдыха', 'color': 'black'}
-    ]
-
-    print("Test 1 - один аргумент:")
-    for value in field(goods, 'title'):
-        print(value)
-
-    print("\nTest 2 - несколько аргументов:")
-    for value in field(goods, 'title', 'price'):
-        print(value)
-
-#Сделать генератор, который из списка словарей достает либо значения полей, либо под-словари.
+def field(items, *args):
+    assert len(args) > 0
+
+    if len(args) == 1:
+        # Если передан один аргумент - возвращаем только значения
+        key = args[0]
+        for item in items:
+            if key in item and item[key] is not None:
+                yield item[key]
+    else:
+        # Если передано несколько аргументов - возвращаем словари
+        for item in items:
+            result = {}
+            has_values = False
+            for key in args:
+                if key in item and item[key] is not None:
+                    result[key] = item[key]
+                    has_values = True
+            if has_values:
+                yield result
+
+
+async def afield(items, *args):
+    # Асинхронный вариант field для источников с async for
+    assert len(args) > 0
+
+    if len(args) == 1:
+        key = args[0]
+        async for item in items:
+            if key in item and item[key] is not None:
+                yield item[key]
+    else:
+        async for item in items:
+            result = {}
+            has_values = False
+            for key in args:
+                if key in item and item[key] is not None:
+                    result[key] = item[key]
+                    has_values = True
+            if has_values:
+                yield result
+
+
+if __name__ == "__main__":
+    # Тестовые данные
+    goods = [
+        {'title': 'Ковер', 'price': 2000, 'color': 'green'},
+        {'title': 'Диван для отдыха', 'color': 'black'}
+    ]
+
+    print("Test 1 - один аргумент:")
+    for value in field(goods, 'title'):
+        print(value)
+
+    print("\nTest 2 - несколько аргументов:")
+    for value in field(goods, 'title', 'price'):
+        print(value)
+
+    print("\nTest 3 - асинхронный источник:")
+
+    async def source():
+        for item in goods:
+            yield item
+
+    async def collect():
+        return [value async for value in afield(source(), 'title', 'price')]
+
+    import asyncio
+    for value in asyncio.run(collect()):
+        print(value)
+
+#Сделать генератор, который из списка словарей достает либо значения полей, либо под-словари.
+
+#afield - то же самое для асинхронных итераторов (async for)
\ No newline at end of file
@@ -1,14 +1,31 @@
-import random
-
-def gen_random(num_count, begin, end):
-    for _ in range(num_count):
-        yield random.randint(begin, end)
-
-
-if __name__ == "__main__":
-    print("Test gen_random:")
-    for num in gen_random(5, 1, 3):
-        print(num, end=" ")
-    print()
-
-#Создать генератор, который выдает N случайных чисел в заданном диапазоне.
\ No newline at end of file
+import asyncio
+import random
+
+def gen_random(num_count, begin, end):
+    for _ in range(num_count):
+        yield random.randint(begin, end)
+
+
+async def agen_random(num_count, begin, end):
+    # Асинхронный вариант: отдает управление циклу событий после каждого числа
+    for _ in range(num_count):
+        yield random.randint(begin, end)
+        await asyncio.sleep(0)
+
+
+if __name__ == "__main__":
+    print("Test gen_random:")
+    for num in gen_random(5, 1, 3):
+        print(num, end=" ")
+    print()
+
+    print("Test agen_random:")
+
+    async def collect():
+        return [num async for num in agen_random(5, 1, 3)]
+
+    print(*asyncio.run(collect()))
+
+#Создать генератор, который выдает N случайных чисел в заданном диапазоне.
+
+#agen_random - то же самое для async for
\ No newline at end of file
@@ -1,62 +1,99 @@
-import json
-import sys
-from field import field
-from gen_random import gen_random
-from unique import Unique
-from print_result import print_result
-from cm_timer import cm_timer_1
-
-path = sys.argv[1] if len(sys.argv) > 1 else 'data_light.json'
-
-with open(path, encoding='utf-8') as f:
-    data = json.load(f)
-
-@print_result
-def f1(arg):
-    return sorted(list(Unique(field(arg, 'job-name'), ignore_case=True)), key=lambda x: x.lower())
-
-@print_result
-def f2(arg):
-    return list(filter(lambda x: x.lower().startswith('программист'), arg))
-
-@print_result
-def f3(arg):
-    return list(map(lambda x: f"{x} с опытом Python", arg))
-
-@print_result
-def f4(arg):
-    salaries = list(gen_random(len(arg), 100000, 200000))
-    return list(map(lambda x: f"{x[0]}, зарплата {x[1]} руб.", zip(arg, salaries)))
-
-
-if __name__ == '__main__':
-    with cm_timer_1():
-        f4(f3(f2(f1(data))))
-
-
-
-
-
-#f1() - Уникальные профессии:
-
-#field(data, 'job-name') - достаем названия профессий
-
-#Unique(..., ignore_case=True) - убираем дубликаты (игнорируя регистр)
-
-#sorted(..., key=lambda x: x.lower()) - сортируем без учета регистра
-
-#f2() - Фильтр программистов:
-
-#filter(lambda x: x.lower().startswith('программист'), ...) - оставляем только программистов
-
-#f3() - Добавляем Python опыт:
-
-#map(lambda x: f"{x} с опытом Python", ...) - к каждой профессии добавляем текст
-
-#f4() - Добавляем зарплаты:
-
-#gen_random(len(arg), 100000, 200000) - генерируем случайные зарплаты
-
-#zip(arg, salaries) - объединяем профессии и зарплаты
-
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from field import field
+from gen_random import gen_random
+from unique import Unique
+from print_result import print_result
+from cm_timer import cm_timer_1
+
+
+def expand_paths(args):
+    # Файл, каталог с *.json или glob-шаблон -> отсортированный список файлов
+    paths = []
+    for arg in args:
+        if os.path.isdir(arg):
+            paths.extend(sorted(glob.glob(os.path.join(arg, '*.json'))))
+        elif glob.has_magic(arg):
+            paths.extend(sorted(glob.glob(arg)))
+        else:
+            paths.append(arg)
+    return paths
+
+
+def parse_shard(path):
+    # Выполняется в процессе-воркере: наружу уходят только уникальные job-name
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return list(Unique(field(data, 'job-name'), ignore_case=True))
+
+
+def load_job_names(paths, workers=None):
+    if len(paths) == 1:
+        return parse_shard(paths[0])
+    names = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map сохраняет порядок файлов, поэтому результат не зависит от числа воркеров
+        for shard_names in pool.map(parse_shard, paths, chunksize=max(1, len(paths) // 64)):
+            names.extend(shard_names)
+    return names
+
+
+@print_result
+def f1(arg):
+    return sorted(list(Unique(arg, ignore_case=True)), key=lambda x: x.lower())
+
+@print_result
+def f2(arg):
+    return list(filter(lambda x: x.lower().startswith('программист'), arg))
+
+@print_result
+def f3(arg):
+    return list(map(lambda x: f"{x} с опытом Python", arg))
+
+@print_result
+def f4(arg):
+    salaries = list(gen_random(len(arg), 100000, 200000))
+    return list(map(lambda x: f"{x[0]}, зарплата {x[1]} руб.", zip(arg, salaries)))
+
+
+if __name__ == '__main__':
+    paths = expand_paths(sys.argv[1:] or ['data_light.json'])
+    with cm_timer_1():
+        f4(f3(f2(f1(load_job_names(paths)))))
+
+
+
+
+
+#Входные данные:
+
+#expand_paths(sys.argv[1:]) - файлы, каталоги (все *.json внутри) и glob-шаблоны вида 'shards/*.json'
+
+#load_job_names(paths) - файлы разбираются параллельно в ProcessPoolExecutor
+
+#parse_shard(path) - в воркере делаем field(data, 'job-name') и Unique, чтобы между процессами передавались только названия
+
+#f1() - Уникальные профессии:
+
+#Unique(..., ignore_case=True) - убираем дубликаты между файлами (игнорируя регистр)
+
+#sorted(..., key=lambda x: x.lower()) - сортируем без учета регистра
+
+#f2() - Фильтр программистов:
+
+#filter(lambda x: x.lower().startswith('программист'), ...) - оставляем только программистов
+
+#f3() - Добавляем Python опыт:
+
+#map(lambda x: f"{x} с опытом Python", ...) - к каждой профессии добавляем текст
+
+#f4() - Добавляем зарплаты:
+
+#gen_random(len(arg), 100000, 200000) - генерируем случайные зарплаты
+
+#zip(arg, salaries) - объединяем профессии и зарплаты
+
 #map(...) - форматируем в красивую строку
\ No newline at end of file
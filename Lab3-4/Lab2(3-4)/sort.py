@@ -1,12 +1,12 @@
-data = [4, -30, 100, -100, 123, 1, 0, -1, -4]
-
-if __name__ == '__main__':
-    # Без lambda
-    result = sorted(data, key=abs, reverse=True)
-    print(result)
-
-    # С lambda
-    result_with_lambda = sorted(data, key=lambda x: abs(x), reverse=True)
-    print(result_with_lambda)
-
+data = [4, -30, 100, -100, 123, 1, 0, -1, -4]
+
+if __name__ == '__main__':
+    # Без lambda
+    result = sorted(data, key=abs, reverse=True)
+    print(result)
+
+    # С lambda
+    result_with_lambda = sorted(data, key=lambda x: abs(x), reverse=True)
+    print(result_with_lambda)
+
 #Отсортировать числа по убыванию их модулей.
\ No newline at end of file
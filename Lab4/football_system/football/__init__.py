@@ -1,27 +1,40 @@
-"""
-Football System - система управления футбольным клубом
-Реализация паттернов проектирования: Фабрика, Декоратор, Наблюдатель
-"""
-
-from .domain.enums import PlayerPosition, MatchEvent
-from .domain.models import Player
-from .creational.factory import PlayerFactory
-from .structural.decorators import CaptainDecorator, InjuredDecorator, YoungTalentDecorator
-from .behavioral.observer import FootballMatch, Commentator, StatisticsTracker, MediaReporter
-
-__version__ = "1.0.0"
-__author__ = "Football System Team"
-
-__all__ = [
-    'PlayerPosition',
-    'MatchEvent',
-    'Player',
-    'PlayerFactory',
-    'CaptainDecorator',
-    'InjuredDecorator',
-    'YoungTalentDecorator',
-    'FootballMatch',
-    'Commentator',
-    'StatisticsTracker',
-    'MediaReporter'
+"""
+Football System - система управления футбольным клубом
+Реализация паттернов проектирования: Фабрика, Декоратор, Наблюдатель
+"""
+
+from .domain.enums import PlayerPosition, MatchEvent, OverflowPolicy
+from .domain.models import Player
+from .domain.events import EventStore, EventRecord
+from .creational.factory import PlayerFactory
+from .structural.decorators import CaptainDecorator, InjuredDecorator, YoungTalentDecorator
+from .behavioral.observer import FootballMatch, Commentator, StatisticsTracker, MediaReporter
+from .behavioral.async_observer import AsyncMatchSubject, AsyncFootballMatch
+from .storage.event_log import EventLog, EventLogRecorder
+from .simulation.season import SeasonSimulator, SeasonResult
+
+__version__ = "1.0.0"
+__author__ = "Football System Team"
+
+__all__ = [
+    'PlayerPosition',
+    'MatchEvent',
+    'OverflowPolicy',
+    'Player',
+    'EventStore',
+    'EventRecord',
+    'PlayerFactory',
+    'CaptainDecorator',
+    'InjuredDecorator',
+    'YoungTalentDecorator',
+    'FootballMatch',
+    'Commentator',
+    'StatisticsTracker',
+    'MediaReporter',
+    'AsyncMatchSubject',
+    'AsyncFootballMatch',
+    'EventLog',
+    'EventLogRecorder',
+    'SeasonSimulator',
+    'SeasonResult'
 ]
\ No newline at end of file
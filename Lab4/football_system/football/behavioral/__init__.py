@@ -1,3 +1,4 @@
-from .observer import FootballMatch, Commentator, StatisticsTracker, MediaReporter
-
-__all__ = ['FootballMatch', 'Commentator', 'StatisticsTracker', 'MediaReporter']
\ No newline at end of file
+from .observer import FootballMatch, Commentator, StatisticsTracker, MediaReporter
+from .async_observer import AsyncMatchSubject, AsyncFootballMatch
+
+__all__ = ['FootballMatch', 'Commentator', 'StatisticsTracker', 'MediaReporter', 'AsyncMatchSubject', 'AsyncFootballMatch']
\ No newline at end of file
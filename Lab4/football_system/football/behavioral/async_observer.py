@@ -0,0 +1,264 @@
+import asyncio
+from collections import deque
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from football.domain.enums import MatchEvent, OverflowPolicy
+from football.behavioral.observer import FootballMatch, MatchObserver, observer_interests
+
+
+class _ObserverChannel:
+    """Ограниченная очередь событий одного наблюдателя и ее задача-потребитель"""
+
+    def __init__(self, observer: MatchObserver, events: Optional[frozenset], maxsize: int,
+                 policy: OverflowPolicy, coalesce_key: Callable[[MatchEvent, dict], Hashable],
+                 in_thread: bool):
+        if maxsize < 1:
+            raise ValueError("maxsize должен быть положительным")
+        self.observer = observer
+        self.events = events
+        self.maxsize = maxsize
+        self.policy = policy
+        self.coalesce_key = coalesce_key
+        self.in_thread = in_thread
+        self.buffer: deque = deque()
+        self.closed = False
+        self.busy = False  # событие взято из очереди, но update еще не завершен
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors: List[BaseException] = []
+        self._condition: Optional[asyncio.Condition] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        # Примитивы asyncio создаются внутри работающего цикла событий;
+        # закрытый канал открывается заново, с новыми примитивами и задачей
+        if self._task is None or self._task.done():
+            self.closed = False
+            self._condition = asyncio.Condition()
+            self._task = asyncio.ensure_future(self._consume())
+
+    async def put(self, event_type: MatchEvent, data: dict) -> None:
+        async with self._condition:
+            if len(self.buffer) >= self.maxsize:
+                if self.policy is OverflowPolicy.BLOCK:
+                    await self._condition.wait_for(lambda: len(self.buffer) < self.maxsize or self.closed)
+                elif self.policy is OverflowPolicy.COALESCE and self._coalesce(event_type, data):
+                    self._condition.notify_all()
+                    return
+                else:
+                    self.buffer.popleft()
+                    self.dropped += 1
+            if self.closed:
+                return
+            self.buffer.append((event_type, data))
+            self._condition.notify_all()
+
+    def _coalesce(self, event_type: MatchEvent, data: dict) -> bool:
+        # Старое событие с тем же ключом убирается, новое встает в конец: порядок остальных не меняется
+        key = self.coalesce_key(event_type, data)
+        for i in range(len(self.buffer) - 1, -1, -1):
+            if self.coalesce_key(*self.buffer[i]) == key:
+                del self.buffer[i]
+                self.buffer.append((event_type, data))
+                self.coalesced += 1
+                return True
+        return False
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(lambda: self.buffer or self.closed)
+                if not self.buffer:
+                    return
+                event_type, data = self.buffer.popleft()
+                self.busy = True
+                self._condition.notify_all()
+            try:
+                if self.in_thread:
+                    result = await loop.run_in_executor(None, self.observer.update, event_type, data)
+                else:
+                    result = self.observer.update(event_type, data)
+                if asyncio.iscoroutine(result):
+                    await result
+                self.delivered += 1
+            except Exception as error:
+                # Ошибка наблюдателя не останавливает доставку остальных событий
+                self.errors.append(error)
+            async with self._condition:
+                self.busy = False
+                self._condition.notify_all()
+
+    async def drain(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self.buffer and not self.busy)
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        async with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        await self._task
+
+
+class AsyncMatchSubject:
+    """Асинхронный субъект: у каждого наблюдателя своя ограниченная очередь и задача
+
+    notify только кладет событие в очереди подписанных наблюдателей, поэтому
+    медленный наблюдатель не задерживает остальных и производителя. Порядок
+    событий для каждого наблюдателя сохраняется. При переполнении очереди:
+    BLOCK - notify ждет освобождения места (обратное давление),
+    DROP_OLDEST - отбрасывается самое старое событие,
+    COALESCE - заменяется ожидающее событие с тем же ключом (по умолчанию -
+    тип события), а если такого нет, отбрасывается самое старое.
+    """
+
+    def __init__(self, maxsize: int = 100, policy: OverflowPolicy = OverflowPolicy.BLOCK):
+        self.maxsize = maxsize
+        self.policy = policy
+        self._channels: Dict[int, _ObserverChannel] = {}
+        self._running = False
+
+    def attach(self, observer: MatchObserver, *events: MatchEvent, maxsize: Optional[int] = None,
+               policy: Optional[OverflowPolicy] = None,
+               coalesce_key: Callable[[MatchEvent, dict], Hashable] = lambda event_type, data: event_type,
+               in_thread: bool = False) -> None:
+        """Добавить наблюдателя
+
+        events - типы событий для подписки (без них - interests наблюдателя
+        или все события). in_thread=True вызывает синхронный update в пуле
+        потоков, чтобы блокирующий вывод не останавливал цикл событий.
+        """
+        if id(observer) in self._channels:
+            return
+        channel = _ObserverChannel(
+            observer, observer_interests(observer, events), maxsize or self.maxsize, policy or self.policy, coalesce_key, in_thread
+        )
+        self._channels[id(observer)] = channel
+        if self._running:
+            channel.start()
+
+    async def detach(self, observer: MatchObserver) -> None:
+        """Удалить наблюдателя, доставив ему уже поставленные в очередь события"""
+        channel = self._channels.pop(id(observer), None)
+        if channel is not None:
+            await channel.close()
+
+    def _start(self) -> None:
+        if not self._running:
+            self._running = True
+            for channel in self._channels.values():
+                channel.start()
+
+    def has_observers(self, event_type: MatchEvent) -> bool:
+        """Есть ли наблюдатели, подписанные на событие"""
+        return any(channel.events is None or event_type in channel.events
+                   for channel in self._channels.values())
+
+    async def notify(self, event_type: MatchEvent, data: dict) -> None:
+        """Поставить событие в очереди подписанных наблюдателей"""
+        self._start()
+        for channel in list(self._channels.values()):
+            if channel.events is None or event_type in channel.events:
+                await channel.put(event_type, data)
+
+    async def drain(self) -> None:
+        """Дождаться, пока все очереди опустеют"""
+        for channel in list(self._channels.values()):
+            if channel._task is not None:
+                await channel.drain()
+
+    async def close(self) -> None:
+        """Доставить оставшиеся события и остановить задачи наблюдателей
+
+        Следующий notify снова запускает задачи, в том числе в другом цикле событий.
+        """
+        for channel in list(self._channels.values()):
+            await channel.close()
+        self._running = False
+
+    def get_channel_stats(self, observer: MatchObserver) -> dict:
+        """Счетчики очереди наблюдателя"""
+        channel = self._channels[id(observer)]
+        return {
+            "queued": len(channel.buffer),
+            "delivered": channel.delivered,
+            "dropped": channel.dropped,
+            "coalesced": channel.coalesced,
+            "errors": len(channel.errors),
+        }
+
+    async def __aenter__(self):
+        self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncFootballMatch(FootballMatch):
+    """Футбольный матч с асинхронной доставкой событий через AsyncMatchSubject
+
+    Методы событий - корутины с теми же аргументами, что у FootballMatch:
+    состояние матча и events_log обновляются сразу, а наблюдатели получают
+    события из своих очередей.
+    """
+
+    def __init__(self, home_team: str, away_team: str, stadium: str = "",
+                 maxsize: int = 100, policy: OverflowPolicy = OverflowPolicy.BLOCK):
+        super().__init__(home_team, away_team, stadium)
+        self.dispatcher = AsyncMatchSubject(maxsize, policy)
+        self._pending: List[Tuple[MatchEvent, dict]] = []
+
+    def attach(self, observer: MatchObserver, *events: MatchEvent, **options) -> None:
+        self.dispatcher.attach(observer, *events, **options)
+
+    async def detach(self, observer: MatchObserver) -> None:
+        await self.dispatcher.detach(observer)
+
+    def has_observers(self, event_type: MatchEvent) -> bool:
+        return self.dispatcher.has_observers(event_type)
+
+    def notify(self, event_type: MatchEvent, data: dict) -> None:
+        # Синхронные методы FootballMatch только откладывают событие до _publish
+        self._pending.append((event_type, data))
+
+    async def _publish(self) -> None:
+        pending, self._pending = self._pending, []
+        for event_type, data in pending:
+            await self.dispatcher.notify(event_type, data)
+
+    async def start_match(self) -> None:
+        super().start_match()
+        await self._publish()
+
+    async def goal(self, team: str, scorer: str, minute: int, assist: str = None) -> None:
+        super().goal(team, scorer, minute, assist)
+        await self._publish()
+
+    async def yellow_card(self, player: str, minute: int, reason: str = "нарушение правил") -> None:
+        super().yellow_card(player, minute, reason)
+        await self._publish()
+
+    async def substitution(self, player_out: str, player_in: str, minute: int) -> None:
+        super().substitution(player_out, player_in, minute)
+        await self._publish()
+
+    async def finish_match(self) -> None:
+        super().finish_match()
+        await self._publish()
+
+    async def drain(self) -> None:
+        await self.dispatcher.drain()
+
+    async def close(self) -> None:
+        await self.dispatcher.close()
+
+    async def __aenter__(self):
+        await self.dispatcher.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.dispatcher.close()
@@ -1,231 +1,436 @@
-from abc import ABC, abstractmethod
-from typing import List
-from football.domain.enums import MatchEvent
-
-
-class MatchObserver(ABC):
-    """Абстрактный наблюдатель за событиями матча"""
-
-    @abstractmethod
-    def update(self, event_type: MatchEvent, data: dict):
-        pass
-
-
-class MatchSubject:
-    """Субъект для управления наблюдателями"""
-
-    def __init__(self):
-        self._observers: List[MatchObserver] = []
-
-    def attach(self, observer: MatchObserver) -> None:
-        """Добавить наблюдателя"""
-        if observer not in self._observers:
-            self._observers.append(observer)
-
-    def detach(self, observer: MatchObserver) -> None:
-        """Удалить наблюдателя"""
-        if observer in self._observers:
-            self._observers.remove(observer)
-
-    def notify(self, event_type: MatchEvent, data: dict) -> None:
-        """Уведомить всех наблюдателей"""
-        for observer in self._observers:
-            observer.update(event_type, data)
-
-
-class FootballMatch(MatchSubject):
-    """Футбольный матч - основной субъект для наблюдения"""
-
-    def __init__(self, home_team: str, away_team: str, stadium: str = ""):
-        super().__init__()
-        self.home_team = home_team
-        self.away_team = away_team
-        self.stadium = stadium or f"Стадион {home_team}"
-        self.score = {"home": 0, "away": 0}
-        self.minute = 0
-        self.is_finished = False
-        self.events_log = []
-
-    def start_match(self) -> None:
-        """Начать матч"""
-        self.minute = 0
-        self.is_finished = False
-        self.notify(MatchEvent.MATCH_START, {
-            "home_team": self.home_team,
-            "away_team": self.away_team,
-            "stadium": self.stadium
-        })
-
-    def goal(self, team: str, scorer: str, minute: int, assist: str = None) -> None:
-        """Зафиксировать гол"""
-        self.score[team] += 1
-        self.minute = minute
-
-        event_data = {
-            "team": team,
-            "scorer": scorer,
-            "assist": assist,
-            "minute": minute,
-            "score": self.score.copy(),
-            "team_name": self.home_team if team == "home" else self.away_team
-        }
-
-        self.events_log.append(("GOAL", event_data))
-        self.notify(MatchEvent.GOAL, event_data)
-
-    def yellow_card(self, player: str, minute: int, reason: str = "нарушение правил") -> None:
-        """Зафиксировать желтую карточку"""
-        self.minute = minute
-
-        event_data = {
-            "player": player,
-            "minute": minute,
-            "reason": reason
-        }
-
-        self.events_log.append(("YELLOW_CARD", event_data))
-        self.notify(MatchEvent.YELLOW_CARD, event_data)
-
-    def substitution(self, player_out: str, player_in: str, minute: int) -> None:
-        """Зафиксировать замену"""
-        self.minute = minute
-
-        event_data = {
-            "player_out": player_out,
-            "player_in": player_in,
-            "minute": minute
-        }
-
-        self.events_log.append(("SUBSTITUTION", event_data))
-        self.notify(MatchEvent.SUBSTITUTION, event_data)
-
-    def finish_match(self) -> None:
-        """Завершить матч"""
-        self.is_finished = True
-        self.minute = 90
-
-        event_data = {
-            "final_score": self.score.copy(),
-            "winner": self.get_winner(),
-            "home_team": self.home_team,
-            "away_team": self.away_team
-        }
-
-        self.events_log.append(("MATCH_END", event_data))
-        self.notify(MatchEvent.MATCH_END, event_data)
-
-    def get_winner(self) -> str:
-        """Определить победителя"""
-        if self.score["home"] > self.score["away"]:
-            return self.home_team
-        elif self.score["away"] > self.score["home"]:
-            return self.away_team
-        else:
-            return "ничья"
-
-    def get_match_info(self) -> dict:
-        """Получить информацию о матче"""
-        return {
-            "home_team": self.home_team,
-            "away_team": self.away_team,
-            "score": self.score,
-            "minute": self.minute,
-            "is_finished": self.is_finished,
-            "winner": self.get_winner() if self.is_finished else None,
-            "total_events": len(self.events_log)
-        }
-
-
-class Commentator(MatchObserver):
-    """Конкретный наблюдатель - комментатор"""
-
-    def __init__(self, name: str):
-        self.name = name
-
-    def update(self, event_type: MatchEvent, data: dict) -> None:
-        if event_type == MatchEvent.MATCH_START:
-            print(
-                f"🎙️ {self.name}: Матч начинается! {data['home_team']} против {data['away_team']} на стадионе {data['stadium']}")
-
-        elif event_type == MatchEvent.GOAL:
-            team_name = data['team_name']
-            print(f"🎙️ {self.name}: ГОООЛ! {data['scorer']} забивает на {data['minute']} минуте! "
-                  f"Счет {data['score']['home']}-{data['score']['away']} в пользу {team_name}")
-
-            if data.get('assist'):
-                print(f"🎙️ {self.name}: Голевая передача от {data['assist']}!")
-
-        elif event_type == MatchEvent.YELLOW_CARD:
-            print(
-                f"🎙️ {self.name}: Желтая карточка! {data['player']} получает предупреждение на {data['minute']} минуте. Причина: {data['reason']}")
-
-        elif event_type == MatchEvent.SUBSTITUTION:
-            print(
-                f"🎙️ {self.name}: Замена! {data['player_out']} уходит, на поле выходит {data['player_in']} на {data['minute']} минуте")
-
-        elif event_type == MatchEvent.MATCH_END:
-            winner = data['winner']
-            score = data['final_score']
-            print(f"🎙️ {self.name}: Матч завершен! Финальный счет {score['home']}-{score['away']}. "
-                  f"Победитель: {winner}!")
-
-
-class StatisticsTracker(MatchObserver):
-    """Конкретный наблюдатель - сборщик статистики"""
-
-    def __init__(self):
-        self.goals = []
-        self.cards = []
-        self.substitutions = []
-        self.match_events = []
-
-    def update(self, event_type: MatchEvent, data: dict) -> None:
-        self.match_events.append((event_type, data))
-
-        if event_type == MatchEvent.GOAL:
-            self.goals.append(data)
-
-        elif event_type == MatchEvent.YELLOW_CARD:
-            self.cards.append(data)
-
-        elif event_type == MatchEvent.SUBSTITUTION:
-            self.substitutions.append(data)
-
-    def get_match_statistics(self) -> dict:
-        """Получить полную статистику матча"""
-        home_goals = len([g for g in self.goals if g['team'] == 'home'])
-        away_goals = len([g for g in self.goals if g['team'] == 'away'])
-
-        return {
-            "total_goals": len(self.goals),
-            "home_goals": home_goals,
-            "away_goals": away_goals,
-            "goal_scorers": [g['scorer'] for g in self.goals],
-            "yellow_cards": len(self.cards),
-            "card_recipients": [c['player'] for c in self.cards],
-            "substitutions": len(self.substitutions),
-            "total_events": len(self.match_events),
-            "goals_data": self.goals,
-            "cards_data": self.cards
-        }
-
-
-class MediaReporter(MatchObserver):
-    """Конкретный наблюдатель - медиа-репортер"""
-
-    def __init__(self, media_outlet: str):
-        self.media_outlet = media_outlet
-        self.breaking_news = []
-
-    def update(self, event_type: MatchEvent, data: dict) -> None:
-        if event_type == MatchEvent.GOAL:
-            news = f"⚽ СЕНСАЦИЯ! {data['scorer']} забивает гол на {data['minute']} минуте!"
-            self.breaking_news.append(news)
-            print(f"📰 {self.media_outlet}: {news}")
-
-        elif event_type == MatchEvent.MATCH_END:
-            winner = data['winner']
-            score = data['final_score']
-            news = f"🏆 Матч завершен! {data['home_team']} {score['home']}-{score['away']} {data['away_team']}. Победитель: {winner}"
-            self.breaking_news.append(news)
+from abc import ABC, abstractmethod
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from football.domain.enums import MatchEvent
+from football.domain.events import EventStore, InternTable
+
+
+class MatchObserver(ABC):
+    """Абстрактный наблюдатель за событиями матча"""
+
+    # События, которые нужны наблюдателю; None - все события
+    interests: Optional[FrozenSet[MatchEvent]] = None
+
+    @abstractmethod
+    def update(self, event_type: MatchEvent, data: dict):
+        pass
+
+    def update_batch(self, events: List[Tuple[MatchEvent, dict]]) -> None:
+        """Обработать пачку событий; по умолчанию - update для каждого"""
+        for event_type, data in events:
+            self.update(event_type, data)
+
+
+def observer_interests(observer: MatchObserver, events: Iterable[MatchEvent] = ()) -> Optional[FrozenSet[MatchEvent]]:
+    """Типы событий для наблюдателя: явные events, иначе его interests, иначе None - все события
+
+    interests учитываются, только если это set или frozenset: у Mock-объектов
+    любой атрибут существует, и такой наблюдатель получает все события.
+    """
+    events = frozenset(events)
+    if events:
+        return events
+    interests = getattr(observer, "interests", None)
+    if isinstance(interests, (set, frozenset)):
+        return frozenset(interests)
+    return None
+
+
+class MatchSubject:
+    """Субъект для управления наблюдателями
+
+    Для каждого типа события хранится свой список наблюдателей, поэтому
+    notify вызывает только тех, кому это событие нужно.
+
+    При batch_size события копятся и доставляются через update_batch
+    пачками по batch_size или при явном flush().
+    """
+
+    def __init__(self, batch_size: Optional[int] = None):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size должен быть положительным")
+        self.batch_size = batch_size
+        self._batch: List[Tuple[MatchEvent, dict]] = []
+        self._observers: List[MatchObserver] = []
+        self._interests: Dict[int, Optional[FrozenSet[MatchEvent]]] = {}
+        self._dispatch: Dict[MatchEvent, List[MatchObserver]] = {event: [] for event in MatchEvent}
+
+    def attach(self, observer: MatchObserver, *events: MatchEvent) -> None:
+        """Добавить наблюдателя
+
+        events - типы событий для подписки. Без них используются interests
+        наблюдателя, а если их нет - наблюдатель получает все события.
+        """
+        # Накопленные события доставляются по старой подписке
+        self.flush()
+        if observer not in self._observers:
+            self._observers.append(observer)
+        self._interests[id(observer)] = observer_interests(observer, events)
+        self._rebuild_dispatch()
+
+    def detach(self, observer: MatchObserver) -> None:
+        """Удалить наблюдателя"""
+        self.flush()
+        if observer in self._observers:
+            self._observers.remove(observer)
+            del self._interests[id(observer)]
+            self._rebuild_dispatch()
+
+    def _rebuild_dispatch(self) -> None:
+        # Списки пересобираются при подписке, а не при каждом событии; порядок - порядок attach.
+        # Новые списки, а не изменение старых: attach/detach внутри update не ломает текущий notify
+        self._dispatch = {
+            event: [
+                observer for observer in self._observers
+                if self._interests[id(observer)] is None or event in self._interests[id(observer)]
+            ]
+            for event in MatchEvent
+        }
+
+    def has_observers(self, event_type: MatchEvent) -> bool:
+        """Есть ли наблюдатели, подписанные на событие
+
+        В режиме пачек подписка та же: attach и detach сначала доставляют
+        накопленные события.
+        """
+        return bool(self._dispatch[event_type])
+
+    def notify(self, event_type: MatchEvent, data: dict) -> None:
+        """Уведомить наблюдателей, подписанных на событие"""
+        if self.batch_size is not None:
+            self._batch.append((event_type, data))
+            if len(self._batch) >= self.batch_size:
+                self.flush()
+            return
+        for observer in self._dispatch[event_type]:
+            observer.update(event_type, data)
+
+    def notify_batch(self, events: Iterable[Tuple[MatchEvent, dict]]) -> None:
+        """Уведомить о готовых событиях (например, при повторе архивного матча)"""
+        self._batch.extend(events)
+        if self.batch_size is None or len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Доставить накопленные события: каждому наблюдателю - одной пачкой"""
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        for observer in self._observers:
+            interests = self._interests[id(observer)]
+            if interests is None:
+                observer.update_batch(batch)
+            else:
+                selected = [event for event in batch if event[0] in interests]
+                if selected:
+                    observer.update_batch(selected)
+
+
+class FootballMatch(MatchSubject):
+    """Футбольный матч - основной субъект для наблюдения
+
+    events_log - EventStore: список EventRecord (событие, минута, команда,
+    игрок, второй участник), а не пар (название события, словарь данных).
+    Словари данных получают только наблюдатели.
+    """
+
+    def __init__(self, home_team: str, away_team: str, stadium: str = "", batch_size: Optional[int] = None,
+                 max_events: Optional[int] = None, strings: Optional[InternTable] = None):
+        super().__init__(batch_size)
+        self.home_team = home_team
+        self.away_team = away_team
+        self.stadium = stadium or f"Стадион {home_team}"
+        self.score = {"home": 0, "away": 0}
+        self.minute = 0
+        self.is_finished = False
+        # max_events - хранить только последние события; strings - общая таблица имен
+        self.events_log = EventStore(max_events, strings)
+
+    def start_match(self) -> None:
+        """Начать матч"""
+        self.minute = 0
+        self.is_finished = False
+        self.notify(MatchEvent.MATCH_START, {
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "stadium": self.stadium
+        })
+
+    def goal(self, team: str, scorer: str, minute: int, assist: str = None) -> None:
+        """Зафиксировать гол"""
+        self.score[team] += 1
+        self.minute = minute
+        self.events_log.append(MatchEvent.GOAL, minute, team, scorer, assist)
+        # Словарь события строится, только если его кто-то получит
+        if not self.has_observers(MatchEvent.GOAL):
+            return
+
+        event_data = {
+            "team": team,
+            "scorer": scorer,
+            "assist": assist,
+            "minute": minute,
+            "score": self.score.copy(),
+            "team_name": self.home_team if team == "home" else self.away_team
+        }
+        self.notify(MatchEvent.GOAL, event_data)
+
+    def yellow_card(self, player: str, minute: int, reason: str = "нарушение правил") -> None:
+        """Зафиксировать желтую карточку"""
+        self.minute = minute
+        self.events_log.append(MatchEvent.YELLOW_CARD, minute, None, player, reason)
+        if not self.has_observers(MatchEvent.YELLOW_CARD):
+            return
+
+        event_data = {
+            "player": player,
+            "minute": minute,
+            "reason": reason
+        }
+        self.notify(MatchEvent.YELLOW_CARD, event_data)
+
+    def substitution(self, player_out: str, player_in: str, minute: int) -> None:
+        """Зафиксировать замену"""
+        self.minute = minute
+        self.events_log.append(MatchEvent.SUBSTITUTION, minute, None, player_out, player_in)
+        if not self.has_observers(MatchEvent.SUBSTITUTION):
+            return
+
+        event_data = {
+            "player_out": player_out,
+            "player_in": player_in,
+            "minute": minute
+        }
+        self.notify(MatchEvent.SUBSTITUTION, event_data)
+
+    def finish_match(self) -> None:
+        """Завершить матч"""
+        self.is_finished = True
+        self.minute = 90
+
+        event_data = {
+            "final_score": self.score.copy(),
+            "winner": self.get_winner(),
+            "home_team": self.home_team,
+            "away_team": self.away_team
+        }
+
+        self.events_log.append(MatchEvent.MATCH_END, self.minute)
+        self.notify(MatchEvent.MATCH_END, event_data)
+
+    def get_winner(self) -> str:
+        """Определить победителя"""
+        if self.score["home"] > self.score["away"]:
+            return self.home_team
+        elif self.score["away"] > self.score["home"]:
+            return self.away_team
+        else:
+            return "ничья"
+
+    def get_match_info(self) -> dict:
+        """Получить информацию о матче"""
+        return {
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "score": self.score,
+            "minute": self.minute,
+            "is_finished": self.is_finished,
+            "winner": self.get_winner() if self.is_finished else None,
+            "total_events": self.events_log.total
+        }
+
+
+class Commentator(MatchObserver):
+    """Конкретный наблюдатель - комментатор"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def update(self, event_type: MatchEvent, data: dict) -> None:
+        if event_type == MatchEvent.MATCH_START:
+            print(
+                f"🎙️ {self.name}: Матч начинается! {data['home_team']} против {data['away_team']} на стадионе {data['stadium']}")
+
+        elif event_type == MatchEvent.GOAL:
+            team_name = data['team_name']
+            print(f"🎙️ {self.name}: ГОООЛ! {data['scorer']} забивает на {data['minute']} минуте! "
+                  f"Счет {data['score']['home']}-{data['score']['away']} в пользу {team_name}")
+
+            if data.get('assist'):
+                print(f"🎙️ {self.name}: Голевая передача от {data['assist']}!")
+
+        elif event_type == MatchEvent.YELLOW_CARD:
+            print(
+                f"🎙️ {self.name}: Желтая карточка! {data['player']} получает предупреждение на {data['minute']} минуте. Причина: {data['reason']}")
+
+        elif event_type == MatchEvent.SUBSTITUTION:
+            print(
+                f"🎙️ {self.name}: Замена! {data['player_out']} уходит, на поле выходит {data['player_in']} на {data['minute']} минуте")
+
+        elif event_type == MatchEvent.MATCH_END:
+            winner = data['winner']
+            score = data['final_score']
+            print(f"🎙️ {self.name}: Матч завершен! Финальный счет {score['home']}-{score['away']}. "
+                  f"Победитель: {winner}!")
+
+
+class PlayerStats:
+    """Счетчики одного игрока"""
+    __slots__ = ("goals", "assists", "yellow_cards", "red_cards", "substitutions_in", "substitutions_out")
+
+    def __init__(self):
+        self.goals = 0
+        self.assists = 0
+        self.yellow_cards = 0
+        self.red_cards = 0
+        self.substitutions_in = 0
+        self.substitutions_out = 0
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class StatisticsTracker(MatchObserver):
+    """Конкретный наблюдатель - сборщик статистики
+
+    Счетчики и статистика игроков обновляются в update, поэтому
+    get_match_statistics не перебирает события. При retain_events=False
+    сами события (match_events, goals, cards, substitutions) не хранятся.
+    """
+
+    def __init__(self, retain_events: bool = True):
+        self.retain_events = retain_events
+        self.goals = []
+        self.cards = []
+        self.substitutions = []
+        self.match_events = []
+        self.players: Dict[str, PlayerStats] = {}
+        self.goal_scorers: List[str] = []
+        self.card_recipients: List[str] = []
+        self.total_events = 0
+        self.goal_count = 0
+        self.home_goals = 0
+        self.away_goals = 0
+        self.yellow_card_count = 0
+        self.substitution_count = 0
+
+    def _player(self, name: str) -> PlayerStats:
+        stats = self.players.get(name)
+        if stats is None:
+            stats = self.players[name] = PlayerStats()
+        return stats
+
+    def update(self, event_type: MatchEvent, data: dict) -> None:
+        self.total_events += 1
+        if self.retain_events:
+            self.match_events.append((event_type, data))
+
+        if event_type == MatchEvent.GOAL:
+            self._count_goal(data)
+            if self.retain_events:
+                self.goals.append(data)
+
+        elif event_type == MatchEvent.YELLOW_CARD:
+            self._count_card(data)
+            if self.retain_events:
+                self.cards.append(data)
+
+        elif event_type == MatchEvent.SUBSTITUTION:
+            self._count_substitution(data)
+            if self.retain_events:
+                self.substitutions.append(data)
+
+        elif event_type == MatchEvent.RED_CARD:
+            self._player(data["player"]).red_cards += 1
+
+    def _count_goal(self, data: dict) -> None:
+        self.goal_count += 1
+        team = data.get("team")
+        if team == "home":
+            self.home_goals += 1
+        elif team == "away":
+            self.away_goals += 1
+        self.goal_scorers.append(data["scorer"])
+        self._player(data["scorer"]).goals += 1
+        if data.get("assist"):
+            self._player(data["assist"]).assists += 1
+
+    def _count_card(self, data: dict) -> None:
+        self.yellow_card_count += 1
+        self.card_recipients.append(data["player"])
+        self._player(data["player"]).yellow_cards += 1
+
+    def _count_substitution(self, data: dict) -> None:
+        self.substitution_count += 1
+        self._player(data["player_out"]).substitutions_out += 1
+        self._player(data["player_in"]).substitutions_in += 1
+
+    def update_batch(self, events: List[Tuple[MatchEvent, dict]]) -> None:
+        self.total_events += len(events)
+        goal, card, substitution = MatchEvent.GOAL, MatchEvent.YELLOW_CARD, MatchEvent.SUBSTITUTION
+        goals = [data for event_type, data in events if event_type is goal]
+        cards = [data for event_type, data in events if event_type is card]
+        substitutions = [data for event_type, data in events if event_type is substitution]
+        for data in goals:
+            self._count_goal(data)
+        for data in cards:
+            self._count_card(data)
+        for data in substitutions:
+            self._count_substitution(data)
+        for event_type, data in events:
+            if event_type is MatchEvent.RED_CARD:
+                self._player(data["player"]).red_cards += 1
+        if self.retain_events:
+            self.match_events.extend(events)
+            self.goals.extend(goals)
+            self.cards.extend(cards)
+            self.substitutions.extend(substitutions)
+
+    def get_match_statistics(self) -> dict:
+        """Получить полную статистику матча
+
+        Списки - копии внутренних: изменение результата не портит счетчики.
+        При retain_events=False события не хранятся, и goals_data и
+        cards_data равны None.
+        """
+        return {
+            "total_goals": self.goal_count,
+            "home_goals": self.home_goals,
+            "away_goals": self.away_goals,
+            "goal_scorers": list(self.goal_scorers),
+            "yellow_cards": self.yellow_card_count,
+            "card_recipients": list(self.card_recipients),
+            "substitutions": self.substitution_count,
+            "total_events": self.total_events,
+            "goals_data": list(self.goals) if self.retain_events else None,
+            "cards_data": list(self.cards) if self.retain_events else None
+        }
+
+    def get_player_statistics(self, name: Optional[str] = None) -> dict:
+        """Статистика игрока или всех игроков: имя -> счетчики"""
+        if name is not None:
+            stats = self.players.get(name)
+            return (stats or PlayerStats()).to_dict()
+        return {player: stats.to_dict() for player, stats in self.players.items()}
+
+
+class MediaReporter(MatchObserver):
+    """Конкретный наблюдатель - медиа-репортер"""
+
+    interests = frozenset({MatchEvent.GOAL, MatchEvent.MATCH_END})
+
+    def __init__(self, media_outlet: str):
+        self.media_outlet = media_outlet
+        self.breaking_news = []
+
+    def update(self, event_type: MatchEvent, data: dict) -> None:
+        if event_type == MatchEvent.GOAL:
+            news = f"⚽ СЕНСАЦИЯ! {data['scorer']} забивает гол на {data['minute']} минуте!"
+            self.breaking_news.append(news)
+            print(f"📰 {self.media_outlet}: {news}")
+
+        elif event_type == MatchEvent.MATCH_END:
+            winner = data['winner']
+            score = data['final_score']
+            news = f"🏆 Матч завершен! {data['home_team']} {score['home']}-{score['away']} {data['away_team']}. Победитель: {winner}"
+            self.breaking_news.append(news)
             print(f"📰 {self.media_outlet}: {news}")
\ No newline at end of file
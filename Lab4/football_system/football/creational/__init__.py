@@ -1,3 +1,3 @@
-from .factory import PlayerFactory
-
+from .factory import PlayerFactory
+
 __all__ = ['PlayerFactory']
\ No newline at end of file
@@ -0,0 +1,145 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Union
+
+from .enums import MatchEvent
+
+_EVENTS: List[MatchEvent] = list(MatchEvent)
+_EVENT_CODES: Dict[MatchEvent, int] = {event: code for code, event in enumerate(_EVENTS)}
+_TEAMS = ("home", "away")
+_TEAM_CODES = {"home": 0, "away": 1}
+
+
+class InternTable:
+    """Таблица интернированных строк (имена игроков, причины карточек): строка <-> номер"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def intern(self, value: Optional[str]) -> int:
+        """Номер строки; -1 для None"""
+        if value is None:
+            return -1
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def lookup(self, string_id: int) -> Optional[str]:
+        return None if string_id < 0 else self.strings[string_id]
+
+
+class EventRecord:
+    """Запись события матча
+
+    player и other зависят от события: для гола - автор и ассистент,
+    для карточки - игрок и причина, для замены - уходящий и выходящий.
+    """
+    __slots__ = ("event", "minute", "team", "player", "other")
+
+    def __init__(self, event: MatchEvent, minute: int, team: Optional[str] = None,
+                 player: Optional[str] = None, other: Optional[str] = None):
+        self.event = event
+        self.minute = minute
+        self.team = team
+        self.player = player
+        self.other = other
+
+    def __eq__(self, other):
+        if not isinstance(other, EventRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return (f"EventRecord({self.event}, {self.minute}, {self.team!r}, "
+                f"{self.player!r}, {self.other!r})")
+
+
+class EventStore:
+    """Компактный журнал событий матча в колонках array
+
+    Событие занимает 12 байт: код MatchEvent, минута, команда и номера
+    строк из InternTable вместо словаря с повторяющимися ключами.
+    Добавление - O(1). При max_events журнал становится кольцевым буфером:
+    хранятся последние max_events событий, total считает все добавленные.
+
+    Журнал ведет себя как список EventRecord: индексы и срезы, len,
+    итерация, сравнение со списком записей и append(EventRecord).
+    """
+
+    def __init__(self, max_events: Optional[int] = None, strings: Optional[InternTable] = None):
+        if max_events is not None and max_events < 1:
+            raise ValueError("max_events должен быть положительным")
+        self.max_events = max_events
+        # Одну таблицу строк можно разделить между матчами сезона
+        self.strings = strings if strings is not None else InternTable()
+        self.total = 0
+        self._start = 0
+        self._events = array('B')
+        self._minutes = array('H')
+        self._teams = array('b')
+        self._players = array('i')
+        self._others = array('i')
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def dropped(self) -> int:
+        """Сколько старых событий вытеснено из кольцевого буфера"""
+        return self.total - len(self._events)
+
+    def append(self, event: Union[MatchEvent, EventRecord], minute: Optional[int] = None,
+               team: Optional[str] = None, player: Optional[str] = None, other: Optional[str] = None) -> None:
+        """Добавить событие по полям или готовую EventRecord"""
+        if isinstance(event, EventRecord):
+            event, minute, team, player, other = event.event, event.minute, event.team, event.player, event.other
+        intern = self.strings.intern
+        values = (_EVENT_CODES[event], minute, _TEAM_CODES.get(team, -1), intern(player), intern(other))
+        columns = (self._events, self._minutes, self._teams, self._players, self._others)
+        if self.max_events is not None and len(self._events) == self.max_events:
+            i = self._start
+            for column, value in zip(columns, values):
+                column[i] = value
+            self._start = (i + 1) % self.max_events
+        else:
+            for column, value in zip(columns, values):
+                column.append(value)
+        self.total += 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[EventRecord, List[EventRecord]]:
+        size = len(self._events)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("индекс события вне журнала")
+        i = (self._start + index) % size
+        team = self._teams[i]
+        return EventRecord(
+            _EVENTS[self._events[i]],
+            self._minutes[i],
+            _TEAMS[team] if team >= 0 else None,
+            self.strings.lookup(self._players[i]),
+            self.strings.lookup(self._others[i]),
+        )
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        for index in range(len(self._events)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, (EventStore, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(record == item for record, item in zip(self, other))
+
+    __hash__ = None
+
+    def count(self, event: MatchEvent) -> int:
+        """Число хранимых событий данного типа"""
+        return self._events.count(_EVENT_CODES[event])
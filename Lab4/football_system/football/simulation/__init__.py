@@ -0,0 +1,3 @@
+from .season import SeasonSimulator, SeasonResult, Fixture, generate_fixtures
+
+__all__ = ['SeasonSimulator', 'SeasonResult', 'Fixture', 'generate_fixtures']
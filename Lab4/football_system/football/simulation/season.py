@@ -0,0 +1,290 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from football.domain.enums import PlayerPosition
+from football.domain.models import Player
+from football.creational.factory import PlayerFactory
+from football.behavioral.observer import FootballMatch, PlayerStats, StatisticsTracker
+
+# Состав сгенерированной команды: 11 в старте и 7 в запасе
+SQUAD_LAYOUT = (
+    [PlayerPosition.GOALKEEPER] + [PlayerPosition.DEFENDER] * 4
+    + [PlayerPosition.MIDFIELDER] * 4 + [PlayerPosition.FORWARD] * 2
+    + [PlayerPosition.GOALKEEPER, PlayerPosition.DEFENDER, PlayerPosition.DEFENDER,
+       PlayerPosition.MIDFIELDER, PlayerPosition.MIDFIELDER, PlayerPosition.FORWARD, PlayerPosition.FORWARD]
+)
+STARTERS = 11
+# Вес игрока при выборе автора гола по позиции
+SCORING_WEIGHTS = {
+    PlayerPosition.GOALKEEPER.value: 0,
+    PlayerPosition.DEFENDER.value: 1,
+    PlayerPosition.MIDFIELDER.value: 3,
+    PlayerPosition.FORWARD.value: 6,
+}
+GOAL_CHANCE = 0.015  # вероятность гола команды за минуту: ~2.7 гола за матч на двоих
+CARD_CHANCE = 0.02
+SUBSTITUTIONS = 5
+# Сезон короче играется в текущем процессе: запуск пула дороже самой симуляции
+MIN_POOL_MATCHES = 5000
+
+# Ключ статистики игрока: (команда, имя) - имена в разных командах могут совпадать
+PlayerKey = Tuple[str, str]
+
+
+class Fixture(NamedTuple):
+    match_id: int
+    round: int
+    home: str
+    away: str
+
+
+class Standing:
+    """Строка турнирной таблицы"""
+    __slots__ = ("team", "played", "won", "drawn", "lost", "goals_for", "goals_against")
+
+    def __init__(self, team: str):
+        self.team = team
+        self.played = 0
+        self.won = 0
+        self.drawn = 0
+        self.lost = 0
+        self.goals_for = 0
+        self.goals_against = 0
+
+    @property
+    def points(self) -> int:
+        return self.won * 3 + self.drawn
+
+    @property
+    def goal_difference(self) -> int:
+        return self.goals_for - self.goals_against
+
+    def add_result(self, scored: int, conceded: int) -> None:
+        self.played += 1
+        self.goals_for += scored
+        self.goals_against += conceded
+        if scored > conceded:
+            self.won += 1
+        elif scored == conceded:
+            self.drawn += 1
+        else:
+            self.lost += 1
+
+    def merge(self, other: "Standing") -> None:
+        for name in ("played", "won", "drawn", "lost", "goals_for", "goals_against"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self) -> dict:
+        row = {name: getattr(self, name) for name in self.__slots__}
+        row["goal_difference"] = self.goal_difference
+        row["points"] = self.points
+        return row
+
+
+def build_squad(team_name: str) -> List[Player]:
+    """Состав через PlayerFactory: известный состав, дополненный игроками до 18"""
+    squad = PlayerFactory.create_team_squad(team_name)
+    numbers = {player.number for player in squad}
+    counts: Dict[str, int] = {}
+    for player in squad:
+        counts[player.position] = counts.get(player.position, 0) + 1
+    number = 1
+    for position in SQUAD_LAYOUT:
+        # Известные игроки занимают места своей позиции
+        if counts.get(position.value, 0) > 0:
+            counts[position.value] -= 1
+            continue
+        while number in numbers:
+            number += 1
+        squad.append(PlayerFactory.create_player(position, f"{team_name} #{number}", number))
+        numbers.add(number)
+    return squad
+
+
+def generate_fixtures(teams: Sequence[str], rounds: int = 2) -> List[Fixture]:
+    """Круговой турнир: каждый с каждым rounds раз, хозяева чередуются"""
+    teams = list(teams)
+    if len(teams) < 2:
+        raise ValueError("Нужно хотя бы две команды")
+    if len(teams) % 2:
+        teams.append(None)  # свободный от игры тур
+    size = len(teams)
+    fixtures = []
+    round_number = 0
+    for cycle in range(rounds):
+        rotation = teams[:]
+        for step in range(size - 1):
+            round_number += 1
+            for i in range(size // 2):
+                home, away = rotation[i], rotation[size - 1 - i]
+                if home is None or away is None:
+                    continue
+                if (cycle + (i == 0 and step % 2)) % 2:
+                    home, away = away, home
+                fixtures.append(Fixture(len(fixtures) + 1, round_number, home, away))
+            # Метод круга: первая команда на месте, остальные сдвигаются
+            rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+    return fixtures
+
+
+def simulate_match(fixture: Fixture, home_squad: List[Player], away_squad: List[Player],
+                   seed: int, tracker: Optional[StatisticsTracker] = None) -> FootballMatch:
+    """Сыграть матч; случайность зависит только от seed и match_id"""
+    rng = random.Random(f"{seed}:{fixture.match_id}")
+    match = FootballMatch(fixture.home, fixture.away, max_events=1)
+    if tracker is not None:
+        match.attach(tracker)
+    on_pitch = {"home": home_squad[:STARTERS], "away": away_squad[:STARTERS]}
+    bench = {"home": home_squad[STARTERS:], "away": away_squad[STARTERS:]}
+    substitution_minutes = {
+        side: sorted(rng.sample(range(46, 90), min(SUBSTITUTIONS, len(bench[side]))))
+        for side in ("home", "away")
+    }
+
+    match.start_match()
+    for minute in range(1, 91):
+        for side in ("home", "away"):
+            players = on_pitch[side]
+            if substitution_minutes[side] and substitution_minutes[side][0] == minute:
+                substitution_minutes[side].pop(0)
+                index = rng.randrange(1, len(players))  # вратаря не меняем
+                incoming = bench[side].pop(rng.randrange(len(bench[side])))
+                match.substitution(players[index].name, incoming.name, minute)
+                players[index] = incoming
+            if rng.random() < GOAL_CHANCE:
+                weights = [SCORING_WEIGHTS.get(player.position, 1) for player in players]
+                scorer = rng.choices(players, weights=weights)[0]
+                assist = None
+                if rng.random() < 0.7:
+                    assist = rng.choice([player for player in players[1:] if player is not scorer]).name
+                match.goal(side, scorer.name, minute, assist)
+            if rng.random() < CARD_CHANCE:
+                match.yellow_card(rng.choice(players).name, minute)
+    match.finish_match()
+    return match
+
+
+# Составы процесса-воркера: передаются один раз при запуске пула
+_squads: Dict[str, List[Player]] = {}
+
+
+def _set_squads(squads: Dict[str, List[Player]]) -> None:
+    global _squads
+    _squads = squads
+
+
+def _simulate_chunk(fixtures: List[Fixture], seed: int) -> tuple:
+    """Сыграть часть матчей со своим StatisticsTracker; вернуть частичные итоги
+
+    События карточек и замен не содержат команду, поэтому перед каждым
+    матчем tracker.players заполняется счетчиками игроков обеих команд,
+    и трекер увеличивает счетчики нужной команды. Если одно имя есть в
+    обоих составах матча, события этого матча относятся к хозяевам.
+    """
+    tracker = StatisticsTracker(retain_events=False)
+    standings: Dict[str, Standing] = {}
+    team_players: Dict[str, Dict[str, PlayerStats]] = {}
+    for fixture in fixtures:
+        for team in (fixture.home, fixture.away):
+            if team not in team_players:
+                team_players[team] = {player.name: PlayerStats() for player in _squads[team]}
+        tracker.players = {**team_players[fixture.away], **team_players[fixture.home]}
+        match = simulate_match(fixture, _squads[fixture.home], _squads[fixture.away], seed, tracker)
+        home, away = match.score["home"], match.score["away"]
+        standings.setdefault(fixture.home, Standing(fixture.home)).add_result(home, away)
+        standings.setdefault(fixture.away, Standing(fixture.away)).add_result(away, home)
+    players: Dict[PlayerKey, dict] = {}
+    for team, squad_stats in team_players.items():
+        for name, stats in squad_stats.items():
+            row = stats.to_dict()
+            if any(row.values()):  # игрок без событий в сезоне не попадает в статистику
+                players[(team, name)] = row
+    return standings, players, tracker.total_events
+
+
+class SeasonResult:
+    """Итоги сезона: таблица, статистика игроков и число событий"""
+
+    def __init__(self, standings: Dict[str, Standing], player_stats: Dict[PlayerKey, dict],
+                 matches: int, total_events: int):
+        self.matches = matches
+        self.total_events = total_events
+        rows = sorted(
+            standings.values(),
+            key=lambda row: (-row.points, -row.goal_difference, -row.goals_for, row.team)
+        )
+        self.standings = [dict(row.to_dict(), position=i) for i, row in enumerate(rows, 1)]
+        self.player_stats = dict(sorted(player_stats.items()))
+
+    def top_scorers(self, count: int = 10) -> List[tuple]:
+        """Лучшие бомбардиры: (команда, имя, голы)"""
+        scorers = [(team, name, stats["goals"])
+                   for (team, name), stats in self.player_stats.items() if stats["goals"]]
+        scorers.sort(key=lambda item: (-item[2], item[1], item[0]))
+        return scorers[:count]
+
+    def format_table(self) -> str:
+        lines = [f"{'#':>3} {'Команда':<20} {'И':>3} {'В':>3} {'Н':>3} {'П':>3} {'Мячи':>9} {'О':>4}"]
+        for row in self.standings:
+            goals = f"{row['goals_for']}-{row['goals_against']}"
+            lines.append(f"{row['position']:>3} {row['team']:<20} {row['played']:>3} {row['won']:>3} "
+                         f"{row['drawn']:>3} {row['lost']:>3} {goals:>9} {row['points']:>4}")
+        return "\n".join(lines)
+
+
+class SeasonSimulator:
+    """Симуляция сезона: календарь, матчи в пуле процессов, сводная таблица
+
+    Составы строятся через PlayerFactory, календарь - круговой. Матчи
+    делятся на части, каждая часть играется в процессе-воркере со своим
+    StatisticsTracker, а частичные таблицы и статистика игроков
+    складываются. Случайность каждого матча задается seed и его номером,
+    поэтому результат не зависит от числа процессов. Статистика игроков
+    хранится по ключу (команда, имя).
+
+    Пул процессов запускается только для сезонов от min_pool_matches
+    матчей (по умолчанию MIN_POOL_MATCHES). Матч играется примерно за
+    0.08 мс, а запуск воркеров и передача составов стоят около 0.1 с,
+    поэтому на сезоне из 1560 матчей пул медленнее одного процесса, и
+    короткие сезоны играются в текущем процессе.
+    """
+
+    def __init__(self, teams: Sequence[str], seed: int = 0, rounds: int = 2,
+                 processes: Optional[int] = None, chunks_per_process: int = 4,
+                 min_pool_matches: int = MIN_POOL_MATCHES):
+        self.teams = list(teams)
+        self.seed = seed
+        self.processes = processes or os.cpu_count() or 1
+        self.chunks_per_process = chunks_per_process
+        self.min_pool_matches = min_pool_matches
+        self.squads = {team: build_squad(team) for team in self.teams}
+        self.fixtures = generate_fixtures(self.teams, rounds)
+
+    def _chunks(self) -> List[List[Fixture]]:
+        count = max(1, min(len(self.fixtures), self.processes * self.chunks_per_process))
+        return [self.fixtures[i::count] for i in range(count)]
+
+    def run(self) -> SeasonResult:
+        chunks = self._chunks()
+        if self.processes == 1 or len(self.fixtures) < self.min_pool_matches:
+            _set_squads(self.squads)
+            parts = [_simulate_chunk(chunk, self.seed) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.processes, initializer=_set_squads,
+                                     initargs=(self.squads,)) as pool:
+                parts = list(pool.map(_simulate_chunk, chunks, [self.seed] * len(chunks)))
+
+        standings = {team: Standing(team) for team in self.teams}
+        player_stats: Dict[PlayerKey, dict] = {}
+        total_events = 0
+        for part_standings, part_players, part_events in parts:
+            for team, row in part_standings.items():
+                standings[team].merge(row)
+            for key, stats in part_players.items():
+                merged = player_stats.setdefault(key, dict.fromkeys(stats, 0))
+                for name, value in stats.items():
+                    merged[name] += value
+            total_events += part_events
+        return SeasonResult(standings, player_stats, len(self.fixtures), total_events)
@@ -0,0 +1,3 @@
+from .event_log import EventLog, EventLogRecorder
+
+__all__ = ['EventLog', 'EventLogRecorder']
\ No newline at end of file
@@ -0,0 +1,332 @@
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from football.domain.enums import MatchEvent
+from football.behavioral.observer import MatchObserver
+
+MAGIC = b"FBLOG001"
+SEGMENT_SIZE = 4 * 1024 * 1024
+
+# Заголовок записи: длина записи, crc32 остальной части, id матча, код события
+_HEADER = struct.Struct("<IIQB")
+_STRING_LENGTH = struct.Struct("<H")
+_NONE = 0xFFFF  # длина-метка None; строки в записи короче нее
+_NO_INT = -1
+
+_EVENTS: List[MatchEvent] = list(MatchEvent)
+_EVENT_CODES: Dict[MatchEvent, int] = {event: code for code, event in enumerate(_EVENTS)}
+
+# Поля данных события: числовые (в одной структуре) и строковые.
+# Числа: minute; score/final_score - пара (home, away)
+_CARD = (("minute",), ("player", "reason"))
+_SCHEMAS = {
+    MatchEvent.MATCH_START: ((), ("home_team", "away_team", "stadium")),
+    MatchEvent.GOAL: (("minute", "score"), ("team", "scorer", "assist", "team_name")),
+    MatchEvent.YELLOW_CARD: _CARD,
+    MatchEvent.RED_CARD: _CARD,
+    MatchEvent.SUBSTITUTION: (("minute",), ("player_out", "player_in")),
+    MatchEvent.MATCH_END: (("final_score",), ("winner", "home_team", "away_team")),
+}
+
+
+def _numbers_struct(numbers: Tuple[str, ...]) -> struct.Struct:
+    return struct.Struct("<" + "".join("i" if name == "minute" else "ii" for name in numbers))
+
+
+_NUMBERS = {event: _numbers_struct(numbers) for event, (numbers, _) in _SCHEMAS.items()}
+
+
+def encode_event(match_id: int, event_type: MatchEvent, data: dict) -> bytes:
+    """Запись события: заголовок, числовые поля, строки с длиной (0xFFFF - None)
+
+    Строка длиннее 65534 байт в UTF-8 не помещается в поле длины: ValueError.
+    """
+    numbers, strings = _SCHEMAS[event_type]
+    values = []
+    for name in numbers:
+        value = data.get(name)
+        if name == "minute":
+            values.append(_NO_INT if value is None else value)
+        else:
+            values.extend((_NO_INT, _NO_INT) if value is None else (value["home"], value["away"]))
+    payload = bytearray(_NUMBERS[event_type].pack(*values))
+    for name in strings:
+        value = data.get(name)
+        if value is None:
+            payload += _STRING_LENGTH.pack(_NONE)
+        else:
+            encoded = str(value).encode("utf-8")
+            if len(encoded) >= _NONE:
+                raise ValueError(f"поле {name}: строка длиннее {_NONE - 1} байт в UTF-8")
+            payload += _STRING_LENGTH.pack(len(encoded))
+            payload += encoded
+    body = struct.pack("<QB", match_id, _EVENT_CODES[event_type]) + payload
+    return struct.pack("<II", _HEADER.size + len(payload), zlib.crc32(body)) + body
+
+
+def _decoder(event_type: MatchEvent):
+    numbers, strings = _SCHEMAS[event_type]
+    layout = _NUMBERS[event_type]
+    unpack_numbers, numbers_size = layout.unpack_from, layout.size
+    unpack_length = _STRING_LENGTH.unpack_from
+
+    def decode(buffer, offset: int) -> dict:
+        values = unpack_numbers(buffer, offset)
+        offset += numbers_size
+        data = {}
+        i = 0
+        for name in numbers:
+            if name == "minute":
+                value = values[i]
+                data[name] = None if value == _NO_INT else value
+                i += 1
+            else:
+                data[name] = None if values[i] == _NO_INT else {"home": values[i], "away": values[i + 1]}
+                i += 2
+        for name in strings:
+            length = unpack_length(buffer, offset)[0]
+            offset += 2
+            if length == _NONE:
+                data[name] = None
+            else:
+                data[name] = str(buffer[offset:offset + length], "utf-8")
+                offset += length
+        return data
+    return decode
+
+
+# Декодеры по коду события: без хеширования MatchEvent на каждой записи
+_DECODERS = [_decoder(event) for event in _EVENTS]
+
+
+class EventLog:
+    """Журнал событий матчей на диске из сегментов фиксированного размера
+
+    Записи добавляются в конец текущего сегмента; заполненный сегмент
+    закрывается и создается следующий. Записи копятся в памяти и пишутся
+    с fsync пачками по sync_every (или при flush/close): после сбоя могут
+    пропасть только события последней незаписанной пачки. При открытии
+    сегменты просматриваются, оборванный хвост (неверная длина или crc)
+    затирается, а индекс матч -> позиции записей строится заново. Новый
+    сегмент готовится во временном файле и переименовывается, так что на
+    диске не бывает сегмента без заголовка; пустой последний сегмент
+    (сбой при создании в старых версиях) создается заново.
+    Повтор читает сегменты через mmap и отдает события наблюдателю
+    пачками через update_batch.
+    """
+
+    def __init__(self, directory: str, segment_size: int = SEGMENT_SIZE, sync_every: int = 1000):
+        if segment_size <= len(MAGIC) + _HEADER.size:
+            raise ValueError("segment_size слишком мал")
+        self.directory = directory
+        self.segment_size = segment_size
+        self.sync_every = sync_every
+        os.makedirs(directory, exist_ok=True)
+        self._index: Dict[int, array] = {}  # id матча -> (номер сегмента << 32) | смещение
+        self._ends: Dict[int, int] = {}  # номер сегмента -> конец проверенных записей
+        self._pending = bytearray()
+        self._pending_count = 0
+        self._file = None
+        self._segment = -1
+        self._position = 0
+        for name in os.listdir(directory):
+            if name.startswith("segment-") and name.endswith(".tmp"):
+                os.remove(os.path.join(directory, name))  # недописанный новый сегмент
+        segments = self._segment_numbers()
+        torn = None
+        if segments and os.path.getsize(self._path(segments[-1])) < len(MAGIC):
+            torn = segments.pop()
+        for number in segments:
+            end = self._scan(number)
+            if number == segments[-1] and torn is None:
+                self._open_segment(number, end)
+        if torn is not None:
+            self._new_segment(torn)
+        elif self._file is None:
+            self._new_segment(0)
+
+    def _path(self, number: int) -> str:
+        return os.path.join(self.directory, f"segment-{number:06d}.log")
+
+    def _segment_numbers(self) -> List[int]:
+        return sorted(
+            int(name[len("segment-"):-len(".log")])
+            for name in os.listdir(self.directory)
+            if name.startswith("segment-") and name.endswith(".log")
+        )
+
+    def _records(self, buffer, start: int = len(MAGIC)) -> Iterator[Tuple[int, int, int, int]]:
+        """(смещение, длина, id матча, код события) корректных записей подряд"""
+        offset = start
+        limit = len(buffer)
+        while offset + _HEADER.size <= limit:
+            length, crc, match_id, code = _HEADER.unpack_from(buffer, offset)
+            if length < _HEADER.size or offset + length > limit or code >= len(_EVENTS):
+                return
+            if zlib.crc32(buffer[offset + 8:offset + length]) != crc:
+                return
+            yield offset, length, match_id, code
+            offset += length
+
+    def _scan(self, number: int) -> int:
+        """Добавить записи сегмента в индекс; вернуть конец корректных данных"""
+        with open(self._path(number), "r+b") as f, mmap.mmap(f.fileno(), 0) as buffer:
+            if buffer[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self._path(number)} не сегмент журнала событий")
+            end = len(MAGIC)
+            for offset, length, match_id, _ in self._records(buffer):
+                self._index_record(match_id, number, offset)
+                end = offset + length
+            if any(buffer[end:end + _HEADER.size]):
+                # Оборванный хвост затирается, чтобы старые байты не приняли за записи
+                buffer[end:] = bytes(len(buffer) - end)
+                buffer.flush()
+        self._ends[number] = end
+        return end
+
+    def _index_record(self, match_id: int, segment: int, offset: int) -> None:
+        positions = self._index.get(match_id)
+        if positions is None:
+            positions = self._index[match_id] = array('q')
+        positions.append(segment << 32 | offset)
+
+    def _open_segment(self, number: int, position: int) -> None:
+        self._file = open(self._path(number), "r+b")
+        self._segment = number
+        self._position = position
+
+    def _new_segment(self, number: int) -> None:
+        path = self._path(number)
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as f:
+            f.write(MAGIC)
+            f.truncate(self.segment_size)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+        self._sync_directory()
+        self._ends[number] = len(MAGIC)
+        self._open_segment(number, len(MAGIC))
+
+    def _sync_directory(self) -> None:
+        # Переименование переживает сбой только после fsync каталога (есть не везде)
+        if os.name != "posix":
+            return
+        descriptor = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def append(self, match_id: int, event_type: MatchEvent, data: dict) -> None:
+        """Добавить событие матча"""
+        record = encode_event(match_id, event_type, data)
+        if len(MAGIC) + len(record) > self.segment_size:
+            raise ValueError("событие больше сегмента")
+        if self._position + len(self._pending) + len(record) > self.segment_size:
+            self.flush()
+            self._file.close()
+            self._new_segment(self._segment + 1)
+        self._index_record(match_id, self._segment, self._position + len(self._pending))
+        self._pending += record
+        self._pending_count += 1
+        if self._pending_count >= self.sync_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Записать накопленные события и сделать fsync"""
+        if not self._pending:
+            return
+        self._file.seek(self._position)
+        self._file.write(self._pending)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._position += len(self._pending)
+        self._ends[self._segment] = self._position
+        self._pending = bytearray()
+        self._pending_count = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def matches(self) -> List[int]:
+        """id матчей в журнале"""
+        return list(self._index)
+
+    def event_count(self, match_id: Optional[int] = None) -> int:
+        if match_id is not None:
+            return len(self._index.get(match_id, ()))
+        return sum(len(positions) for positions in self._index.values())
+
+    def read(self, match_id: Optional[int] = None) -> Iterator[Tuple[int, MatchEvent, dict]]:
+        """(id матча, событие, данные) в порядке записи; с match_id - только этого матча"""
+        self.flush()
+        unpack_header = _HEADER.unpack_from
+        if match_id is None:
+            for number in sorted(self._ends):
+                # crc уже проверены при открытии или записаны нами: идем только по заголовкам
+                end = self._ends[number]
+                offset = len(MAGIC)
+                with self._map(number) as buffer:
+                    while offset < end:
+                        length, _, record_match, code = unpack_header(buffer, offset)
+                        yield record_match, _EVENTS[code], _DECODERS[code](buffer, offset + _HEADER.size)
+                        offset += length
+            return
+        positions = self._index.get(match_id, ())
+        segment, buffer = -1, None
+        try:
+            for position in positions:
+                number, offset = position >> 32, position & 0xFFFFFFFF
+                if number != segment:
+                    if buffer is not None:
+                        buffer.close()
+                    segment, buffer = number, self._map(number)
+                code = buffer[offset + _HEADER.size - 1]
+                yield match_id, _EVENTS[code], _DECODERS[code](buffer, offset + _HEADER.size)
+        finally:
+            if buffer is not None:
+                buffer.close()
+
+    def _map(self, number: int) -> mmap.mmap:
+        with open(self._path(number), "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def replay(self, observer: MatchObserver, match_id: Optional[int] = None, batch_size: int = 4096) -> int:
+        """Передать события наблюдателю пачками через update_batch; вернуть их число"""
+        batch = []
+        count = 0
+        for _, event_type, data in self.read(match_id):
+            batch.append((event_type, data))
+            if len(batch) >= batch_size:
+                observer.update_batch(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            observer.update_batch(batch)
+            count += len(batch)
+        return count
+
+
+class EventLogRecorder(MatchObserver):
+    """Наблюдатель, записывающий события матча в EventLog"""
+
+    def __init__(self, log: EventLog, match_id: int):
+        self.log = log
+        self.match_id = match_id
+
+    def update(self, event_type: MatchEvent, data: dict) -> None:
+        self.log.append(self.match_id, event_type, data)
@@ -1,3 +1,3 @@
-from .decorators import CaptainDecorator, InjuredDecorator, YoungTalentDecorator
-
+from .decorators import CaptainDecorator, InjuredDecorator, YoungTalentDecorator
+
 __all__ = ['CaptainDecorator', 'InjuredDecorator', 'YoungTalentDecorator']
\ No newline at end of file
@@ -1,10 +1,10 @@
-from setuptools import setup, find_packages
-
-setup(
-    name="football_system",
-    version="1.0.0",
-    packages=find_packages(),
-    description="Система управления футбольным клубом с паттернами проектирования",
-    author="Developer",
-    python_requires=">=3.7",
+from setuptools import setup, find_packages
+
+setup(
+    name="football_system",
+    version="1.0.0",
+    packages=find_packages(),
+    description="Система управления футбольным клубом с паттернами проектирования",
+    author="Developer",
+    python_requires=">=3.7",
 )
\ No newline at end of file
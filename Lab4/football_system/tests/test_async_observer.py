@@ -0,0 +1,177 @@
+import asyncio
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from football import AsyncFootballMatch, StatisticsTracker, MatchEvent, OverflowPolicy
+from football.behavioral.observer import MatchObserver
+
+
+class GatedObserver(MatchObserver):
+    """Наблюдатель, который не обрабатывает события, пока не открыт шлюз"""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.received = []
+
+    async def update(self, event_type, data):
+        await self.gate.wait()
+        self.received.append((event_type, data.get("minute")))
+
+
+class TestAsyncObserver(unittest.TestCase):
+    """TDD тесты асинхронной доставки событий"""
+
+    def test_all_events_delivered_in_order(self):
+        """Все события доставляются каждому наблюдателю в исходном порядке"""
+        async def scenario():
+            # Given
+            stats = StatisticsTracker()
+            mock_observer = MagicMock()
+            async with AsyncFootballMatch("Спартак", "Зенит", maxsize=1) as match:
+                match.attach(stats)
+                match.attach(mock_observer)
+
+                # When
+                await match.start_match()
+                await match.goal("home", "Квинси Промес", 23)
+                await match.yellow_card("Артем Дзюба", 40)
+                await match.goal("away", "Артем Дзюба", 67)
+                await match.finish_match()
+                await match.drain()
+            return stats, mock_observer, match
+
+        stats, mock_observer, match = asyncio.run(scenario())
+
+        # Then
+        self.assertEqual(stats.get_match_statistics()["total_goals"], 2)
+        events = [call[0][0] for call in mock_observer.update.call_args_list]
+        self.assertEqual(events, [MatchEvent.MATCH_START, MatchEvent.GOAL, MatchEvent.YELLOW_CARD,
+                                  MatchEvent.GOAL, MatchEvent.MATCH_END])
+        self.assertEqual(match.get_match_info()["total_events"], 4)
+
+    def test_slow_observer_does_not_stall_producer(self):
+        """При DROP_OLDEST производитель не ждет медленного наблюдателя"""
+        async def scenario():
+            # Given
+            slow = GatedObserver()
+            match = AsyncFootballMatch("Спартак", "Зенит", maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+            match.attach(slow)
+
+            # When
+            for minute in range(1, 6):
+                await match.goal("home", "Квинси Промес", minute)
+            stats_before = match.dispatcher.get_channel_stats(slow)
+            slow.gate.set()
+            await match.close()
+            return slow, stats_before, match.dispatcher.get_channel_stats(slow)
+
+        slow, stats_before, stats_after = asyncio.run(scenario())
+
+        # Then
+        self.assertEqual(stats_before["queued"], 2)
+        self.assertEqual(stats_before["dropped"], 3)
+        self.assertEqual(slow.received, [(MatchEvent.GOAL, 4), (MatchEvent.GOAL, 5)])
+        self.assertEqual(stats_after["delivered"], 2)
+
+    def test_coalesce_keeps_latest_event_of_each_type(self):
+        """COALESCE заменяет ожидающее событие того же типа, сохраняя порядок остальных"""
+        async def scenario():
+            # Given
+            slow = GatedObserver()
+            match = AsyncFootballMatch("Спартак", "Зенит", maxsize=2, policy=OverflowPolicy.COALESCE)
+            match.attach(slow)
+
+            # When
+            await match.goal("home", "Квинси Промес", 1)
+            await match.yellow_card("Артем Дзюба", 2)
+            await match.goal("home", "Квинси Промес", 3)
+            await match.goal("home", "Квинси Промес", 4)
+            slow.gate.set()
+            await match.close()
+            return slow, match.dispatcher.get_channel_stats(slow)
+
+        slow, stats = asyncio.run(scenario())
+
+        # Then
+        self.assertEqual(slow.received, [(MatchEvent.YELLOW_CARD, 2), (MatchEvent.GOAL, 4)])
+        self.assertEqual(stats["coalesced"], 2)
+
+    def test_observer_errors_do_not_stop_delivery(self):
+        """Исключение в update учитывается, но следующие события доставляются"""
+        async def scenario():
+            # Given
+            failing = MagicMock()
+            failing.update.side_effect = [ValueError("сбой"), None]
+            async with AsyncFootballMatch("Спартак", "Зенит") as match:
+                match.attach(failing, MatchEvent.GOAL)
+
+                # When
+                await match.start_match()
+                await match.goal("home", "Квинси Промес", 23)
+                await match.goal("home", "Квинси Промес", 45)
+                await match.drain()
+                return match.dispatcher.get_channel_stats(failing)
+
+        stats = asyncio.run(scenario())
+
+        # Then
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["delivered"], 1)
+
+    def test_notify_after_close_restarts_delivery(self):
+        """После close события снова доставляются, в том числе в новом цикле событий"""
+        # Given
+        mock_observer = MagicMock()
+        match = AsyncFootballMatch("Спартак", "Зенит")
+        match.attach(mock_observer)
+
+        async def first_half():
+            async with match:
+                await match.start_match()
+                await match.goal("home", "Квинси Промес", 23)
+
+        async def second_half():
+            await match.goal("away", "Артем Дзюба", 67)
+            await match.drain()
+            await match.close()
+
+        # When
+        asyncio.run(first_half())
+        asyncio.run(second_half())
+
+        # Then
+        events = [call[0][0] for call in mock_observer.update.call_args_list]
+        self.assertEqual(events, [MatchEvent.MATCH_START, MatchEvent.GOAL, MatchEvent.GOAL])
+        self.assertEqual(match.dispatcher.get_channel_stats(mock_observer)["delivered"], 3)
+
+    def test_instance_interests(self):
+        """interests экземпляра-множества задают подписку, а у Mock игнорируются"""
+        async def scenario():
+            # Given
+            stats = StatisticsTracker()
+            stats.interests = frozenset({MatchEvent.GOAL})
+            mock_observer = MagicMock()
+            async with AsyncFootballMatch("Спартак", "Зенит") as match:
+                match.attach(stats)
+                match.attach(mock_observer)
+
+                # When
+                await match.start_match()
+                await match.goal("home", "Квинси Промес", 23)
+                await match.yellow_card("Артем Дзюба", 40)
+                await match.drain()
+            return stats, mock_observer
+
+        stats, mock_observer = asyncio.run(scenario())
+
+        # Then
+        self.assertEqual(stats.total_events, 1)
+        self.assertEqual(mock_observer.update.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from football import EventLog, EventLogRecorder, FootballMatch, StatisticsTracker, MatchEvent
+
+
+class TestEventLog(unittest.TestCase):
+    """TDD тесты журнала событий на диске"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def play_match(self, log, match_id, home="Спартак", away="Зенит"):
+        match = FootballMatch(home, away)
+        stats = StatisticsTracker()
+        match.attach(stats)
+        match.attach(EventLogRecorder(log, match_id))
+        match.start_match()
+        match.goal("home", "Квинси Промес", 23, "Александр Соболев")
+        match.yellow_card("Артем Дзюба", 40)
+        match.substitution("Артем Дзюба", "Иван Сергеев", 60)
+        match.goal("away", "Малком", 88)
+        match.finish_match()
+        return stats
+
+    def test_replay_after_restart(self):
+        """После переоткрытия журнала повтор восстанавливает статистику"""
+        # Given
+        with EventLog(self.directory) as log:
+            live = self.play_match(log, 1)
+
+        # When
+        replayed = StatisticsTracker()
+        with EventLog(self.directory) as log:
+            count = log.replay(replayed)
+
+        # Then
+        self.assertEqual(count, 6)
+        self.assertEqual(replayed.get_match_statistics(), live.get_match_statistics())
+
+    def test_segments_and_match_index(self):
+        """События разных матчей в нескольких сегментах читаются по id матча"""
+        # Given
+        with EventLog(self.directory, segment_size=256, sync_every=2) as log:
+            self.play_match(log, 1)
+            self.play_match(log, 2, "ЦСКА", "Локомотив")
+            self.play_match(log, 1)
+
+        # When
+        log = EventLog(self.directory, segment_size=256)
+        events = [event_type for _, event_type, _ in log.read(2)]
+        starts = [data for _, event_type, data in log.read(2) if event_type == MatchEvent.MATCH_START]
+        log.close()
+
+        # Then
+        self.assertGreater(len(os.listdir(self.directory)), 1)
+        self.assertEqual(sorted(log.matches()), [1, 2])
+        self.assertEqual(log.event_count(1), 12)
+        self.assertEqual(events[0], MatchEvent.MATCH_START)
+        self.assertEqual(events[-1], MatchEvent.MATCH_END)
+        self.assertEqual(starts[0]["home_team"], "ЦСКА")
+
+    def test_torn_tail_is_discarded(self):
+        """Оборванная запись в конце сегмента отбрасывается при открытии"""
+        # Given
+        with EventLog(self.directory) as log:
+            self.play_match(log, 1)
+        end = log._position
+        path = os.path.join(self.directory, "segment-000000.log")
+        with open(path, "r+b") as f:
+            f.seek(end)
+            f.write(b"\x40\x00\x00\x00\x01\x02\x03")
+
+        # When
+        with EventLog(self.directory) as log:
+            log.append(2, MatchEvent.YELLOW_CARD, {"player": "Малком", "minute": 5, "reason": "симуляция"})
+        log = EventLog(self.directory)
+
+        # Then
+        self.assertEqual(log.event_count(), 7)
+        self.assertEqual(list(log.read(2))[0][2]["reason"], "симуляция")
+        log.close()
+
+    def test_unsynced_batch_is_not_durable(self):
+        """События до fsync живут только в памяти процесса"""
+        # Given
+        log = EventLog(self.directory, sync_every=100)
+        log.append(1, MatchEvent.GOAL, {"team": "home", "scorer": "Квинси Промес", "minute": 23})
+
+        # When
+        reopened = EventLog(self.directory)
+
+        # Then
+        self.assertEqual(reopened.event_count(), 0)
+        reopened.close()
+        log.close()
+        with EventLog(self.directory) as durable:
+            self.assertEqual(durable.event_count(), 1)
+
+    def test_long_strings(self):
+        """Строка из 65534 байт сохраняется, более длинная отклоняется ValueError"""
+        # Given
+        longest = "ж" * 32767
+        log = EventLog(self.directory)
+
+        # When
+        log.append(1, MatchEvent.YELLOW_CARD, {"player": "Малком", "minute": 5, "reason": longest})
+
+        # Then
+        for reason in ("x" * 65535, "x" * 70000):
+            with self.assertRaises(ValueError):
+                log.append(1, MatchEvent.YELLOW_CARD, {"player": "Малком", "minute": 5, "reason": reason})
+        self.assertEqual(log.event_count(), 1)
+        self.assertEqual(list(log.read(1))[0][2]["reason"], longest)
+        log.close()
+
+    def test_crash_while_creating_segment(self):
+        """Пустой последний сегмент и временный файл после сбоя не мешают открыть журнал"""
+        # Given
+        with EventLog(self.directory) as log:
+            self.play_match(log, 1)
+        open(os.path.join(self.directory, "segment-000001.log"), "wb").close()
+        open(os.path.join(self.directory, "segment-000002.log.tmp"), "wb").close()
+
+        # When
+        with EventLog(self.directory) as log:
+            log.append(2, MatchEvent.YELLOW_CARD, {"player": "Малком", "minute": 5, "reason": "симуляция"})
+        log = EventLog(self.directory)
+
+        # Then
+        self.assertEqual(sorted(os.listdir(self.directory)), ["segment-000000.log", "segment-000001.log"])
+        self.assertEqual(log.event_count(1), 6)
+        self.assertEqual(list(log.read(2))[0][2]["reason"], "симуляция")
+        log.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
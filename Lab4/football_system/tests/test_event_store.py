@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from football import EventStore, EventRecord, FootballMatch, MatchEvent
+
+
+class TestEventStore(unittest.TestCase):
+    """TDD тесты компактного журнала событий"""
+
+    def test_append_and_iterate(self):
+        """События читаются обратно записями в порядке добавления"""
+        # Given
+        store = EventStore()
+
+        # When
+        store.append(MatchEvent.GOAL, 23, "home", "Квинси Промес", "Александр Соболев")
+        store.append(MatchEvent.YELLOW_CARD, 40, None, "Артем Дзюба", "нарушение правил")
+        store.append(MatchEvent.MATCH_END, 90)
+
+        # Then
+        self.assertEqual(len(store), 3)
+        self.assertEqual(list(store), [
+            EventRecord(MatchEvent.GOAL, 23, "home", "Квинси Промес", "Александр Соболев"),
+            EventRecord(MatchEvent.YELLOW_CARD, 40, None, "Артем Дзюба", "нарушение правил"),
+            EventRecord(MatchEvent.MATCH_END, 90),
+        ])
+        self.assertEqual(store[-1].event, MatchEvent.MATCH_END)
+        self.assertEqual(store.count(MatchEvent.GOAL), 1)
+
+    def test_player_names_are_interned(self):
+        """Повторяющиеся имена хранятся один раз"""
+        # Given
+        store = EventStore()
+
+        # When
+        for minute in range(10):
+            store.append(MatchEvent.GOAL, minute, "home", "Квинси Промес")
+
+        # Then
+        self.assertEqual(len(store.strings), 1)
+        self.assertEqual(len(store), 10)
+
+    def test_ring_buffer_keeps_latest_events(self):
+        """При max_events хранятся только последние события"""
+        # Given
+        store = EventStore(max_events=3)
+
+        # When
+        for minute in range(1, 6):
+            store.append(MatchEvent.GOAL, minute, "away", "Артем Дзюба")
+
+        # Then
+        self.assertEqual([record.minute for record in store], [3, 4, 5])
+        self.assertEqual(store.total, 5)
+        self.assertEqual(store.dropped, 2)
+        with self.assertRaises(IndexError):
+            store[3]
+
+    def test_list_compatibility(self):
+        """Журнал поддерживает срезы, сравнение со списком и append записи"""
+        # Given
+        match = FootballMatch("Спартак", "Зенит")
+        match.goal("home", "Квинси Промес", 23)
+        match.yellow_card("Артем Дзюба", 40)
+        copy = EventStore()
+
+        # When
+        for record in match.events_log:
+            copy.append(record)
+        copy.append(EventRecord(MatchEvent.MATCH_END, 90))
+
+        # Then
+        expected = [
+            EventRecord(MatchEvent.GOAL, 23, "home", "Квинси Промес"),
+            EventRecord(MatchEvent.YELLOW_CARD, 40, None, "Артем Дзюба", "нарушение правил"),
+        ]
+        self.assertEqual(match.events_log, expected)
+        self.assertEqual(expected, match.events_log)
+        self.assertEqual(copy[:2], expected)
+        self.assertEqual(copy[::-1][0].event, MatchEvent.MATCH_END)
+        self.assertEqual(copy[:2], match.events_log)
+        self.assertNotEqual(copy, match.events_log)
+
+    def test_match_total_events_with_retention_cap(self):
+        """total_events считает все события, даже вытесненные из журнала"""
+        # Given
+        match = FootballMatch("Спартак", "Зенит", max_events=2)
+
+        # When
+        match.goal("home", "Квинси Промес", 23)
+        match.yellow_card("Артем Дзюба", 40)
+        match.substitution("Артем Дзюба", "Иван Сергеев", 60)
+        match.finish_match()
+
+        # Then
+        self.assertEqual(match.get_match_info()["total_events"], 4)
+        self.assertEqual([record.event for record in match.events_log],
+                         [MatchEvent.SUBSTITUTION, MatchEvent.MATCH_END])
+        self.assertEqual(match.events_log[0].other, "Иван Сергеев")
+
+
+if __name__ == '__main__':
+    unittest.main()
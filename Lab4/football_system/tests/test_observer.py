@@ -1,78 +1,340 @@
-import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from football import FootballMatch, Commentator, StatisticsTracker, MediaReporter, MatchEvent
-
-
-class TestMatchObserver(unittest.TestCase):
-    """TDD тесты для паттерна Наблюдатель"""
-
-    def setUp(self):
-        self.match = FootballMatch("Спартак", "Зенит", "Лужники")
-        self.commentator = Commentator("Георгий Черданцев")
-        self.stats_tracker = StatisticsTracker()
-        self.media = MediaReporter("Спорт-Экспресс")
-
-    def test_observer_attachment(self):
-        """Тест подключения наблюдателей"""
-        # When
-        self.match.attach(self.commentator)
-        self.match.attach(self.stats_tracker)
-        self.match.attach(self.media)
-
-        # Then
-        # Проверяем через события матча
-        self.match.start_match()
-        self.match.goal("home", "Квинси Промес", 23)
-
-        stats = self.stats_tracker.get_match_statistics()
-        self.assertEqual(stats["total_goals"], 1)
-
-    def test_goal_notification(self):
-        """Тест уведомления о голе"""
-        # Given
-        self.match.attach(self.stats_tracker)
-
-        # When
-        self.match.goal("home", "Квинси Промес", 23, "Александр Соболев")
-
-        # Then
-        stats = self.stats_tracker.get_match_statistics()
-        self.assertEqual(stats["total_goals"], 1)
-        self.assertEqual(stats["home_goals"], 1)
-        self.assertEqual(stats["goal_scorers"][0], "Квинси Промес")
-
-    def test_match_finish(self):
-        """Тест завершения матча"""
-        # Given
-        self.match.attach(self.stats_tracker)
-
-        # When
-        self.match.goal("home", "Квинси Промес", 23)
-        self.match.goal("away", "Артем Дзюба", 67)
-        self.match.finish_match()
-
-        # Then
-        stats = self.stats_tracker.get_match_statistics()
-        self.assertEqual(stats["total_goals"], 2)
-        self.assertEqual(self.match.get_winner(), "ничья")
-
-    def test_detach_observer(self):
-        """Тест отключения наблюдателя"""
-        # Given
-        self.match.attach(self.stats_tracker)
-        self.match.detach(self.stats_tracker)
-
-        # When
-        self.match.goal("home", "Квинси Промес", 23)
-
-        # Then
-        stats = self.stats_tracker.get_match_statistics()
-        self.assertEqual(stats["total_goals"], 0)
-
-
-if __name__ == '__main__':
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from football import FootballMatch, Commentator, StatisticsTracker, MediaReporter, MatchEvent
+from football.behavioral.observer import MatchObserver
+
+
+class TestMatchObserver(unittest.TestCase):
+    """TDD тесты для паттерна Наблюдатель"""
+
+    def setUp(self):
+        self.match = FootballMatch("Спартак", "Зенит", "Лужники")
+        self.commentator = Commentator("Георгий Черданцев")
+        self.stats_tracker = StatisticsTracker()
+        self.media = MediaReporter("Спорт-Экспресс")
+
+    def test_observer_attachment(self):
+        """Тест подключения наблюдателей"""
+        # When
+        self.match.attach(self.commentator)
+        self.match.attach(self.stats_tracker)
+        self.match.attach(self.media)
+
+        # Then
+        # Проверяем через события матча
+        self.match.start_match()
+        self.match.goal("home", "Квинси Промес", 23)
+
+        stats = self.stats_tracker.get_match_statistics()
+        self.assertEqual(stats["total_goals"], 1)
+
+    def test_goal_notification(self):
+        """Тест уведомления о голе"""
+        # Given
+        self.match.attach(self.stats_tracker)
+
+        # When
+        self.match.goal("home", "Квинси Промес", 23, "Александр Соболев")
+
+        # Then
+        stats = self.stats_tracker.get_match_statistics()
+        self.assertEqual(stats["total_goals"], 1)
+        self.assertEqual(stats["home_goals"], 1)
+        self.assertEqual(stats["goal_scorers"][0], "Квинси Промес")
+
+    def test_match_finish(self):
+        """Тест завершения матча"""
+        # Given
+        self.match.attach(self.stats_tracker)
+
+        # When
+        self.match.goal("home", "Квинси Промес", 23)
+        self.match.goal("away", "Артем Дзюба", 67)
+        self.match.finish_match()
+
+        # Then
+        stats = self.stats_tracker.get_match_statistics()
+        self.assertEqual(stats["total_goals"], 2)
+        self.assertEqual(self.match.get_winner(), "ничья")
+
+    def test_detach_observer(self):
+        """Тест отключения наблюдателя"""
+        # Given
+        self.match.attach(self.stats_tracker)
+        self.match.detach(self.stats_tracker)
+
+        # When
+        self.match.goal("home", "Квинси Промес", 23)
+
+        # Then
+        stats = self.stats_tracker.get_match_statistics()
+        self.assertEqual(stats["total_goals"], 0)
+
+
+class TestEventSubscriptions(unittest.TestCase):
+    """Тесты подписки наблюдателей на отдельные типы событий"""
+
+    def setUp(self):
+        self.match = FootballMatch("Спартак", "Зенит", "Лужники")
+
+    def play(self):
+        self.match.start_match()
+        self.match.goal("home", "Квинси Промес", 23)
+        self.match.yellow_card("Артем Дзюба", 40)
+        self.match.substitution("Артем Дзюба", "Иван Сергеев", 60)
+        self.match.finish_match()
+
+    def test_explicit_events(self):
+        """Наблюдатель получает только события, на которые подписан"""
+        # Given
+        observer = MagicMock()
+        self.match.attach(observer, MatchEvent.GOAL, MatchEvent.YELLOW_CARD)
+
+        # When
+        self.play()
+
+        # Then
+        events = [call[0][0] for call in observer.update.call_args_list]
+        self.assertEqual(events, [MatchEvent.GOAL, MatchEvent.YELLOW_CARD])
+
+    def test_class_interests(self):
+        """MediaReporter по умолчанию подписан только на голы и конец матча"""
+        # Given
+        media = MediaReporter("Спорт-Экспресс")
+        media.update = MagicMock()
+        self.match.attach(media)
+
+        # When
+        self.play()
+
+        # Then
+        events = [call[0][0] for call in media.update.call_args_list]
+        self.assertEqual(events, [MatchEvent.GOAL, MatchEvent.MATCH_END])
+
+    def test_events_without_observers_are_only_logged(self):
+        """Событие без подписчиков попадает в журнал, но словарь для notify не строится"""
+        # Given
+        self.match.attach(MediaReporter("Спорт-Экспресс"))
+        self.match.notify = MagicMock()
+
+        # When
+        self.play()
+
+        # Then
+        events = [call[0][0] for call in self.match.notify.call_args_list]
+        self.assertEqual(events, [MatchEvent.MATCH_START, MatchEvent.GOAL, MatchEvent.MATCH_END])
+        self.assertEqual(self.match.get_match_info()["total_events"], 4)
+
+    def test_instance_interests(self):
+        """interests экземпляра учитываются, если это множество"""
+        # Given
+        media = MediaReporter("Спорт-Экспресс")
+        media.interests = {MatchEvent.YELLOW_CARD}
+        media.update = MagicMock()
+        self.match.attach(media)
+
+        # When
+        self.play()
+
+        # Then
+        events = [call[0][0] for call in media.update.call_args_list]
+        self.assertEqual(events, [MatchEvent.YELLOW_CARD])
+
+    def test_observer_without_interests_gets_everything(self):
+        """Без объявленных интересов наблюдатель получает все события в порядке подписки"""
+        # Given
+        calls = []
+        first = MagicMock()
+        first.update.side_effect = lambda event, data: calls.append(("first", event))
+        second = MagicMock()
+        second.update.side_effect = lambda event, data: calls.append(("second", event))
+        self.match.attach(first)
+        self.match.attach(second, MatchEvent.GOAL)
+
+        # When
+        self.play()
+
+        # Then
+        self.assertEqual(first.update.call_count, 5)
+        self.assertEqual(calls[1:3], [("first", MatchEvent.GOAL), ("second", MatchEvent.GOAL)])
+
+    def test_resubscribe_and_detach(self):
+        """Повторный attach меняет подписку, detach убирает из всех списков"""
+        # Given
+        observer = MagicMock()
+        self.match.attach(observer, MatchEvent.GOAL)
+        self.match.attach(observer, MatchEvent.MATCH_END)
+
+        # When
+        self.play()
+        self.match.detach(observer)
+        self.match.finish_match()
+
+        # Then
+        events = [call[0][0] for call in observer.update.call_args_list]
+        self.assertEqual(events, [MatchEvent.MATCH_END])
+
+
+class RecordingObserver(MatchObserver):
+    """Наблюдатель только с update: пачки приходят через update_batch по умолчанию"""
+
+    def __init__(self):
+        self.events = []
+
+    def update(self, event_type, data):
+        self.events.append(event_type)
+
+
+class TestBatchedDelivery(unittest.TestCase):
+    """Тесты пакетной доставки событий"""
+
+    def test_flush_by_size(self):
+        """События доставляются, когда набирается batch_size"""
+        # Given
+        match = FootballMatch("Спартак", "Зенит", batch_size=3)
+        stats = StatisticsTracker()
+        match.attach(stats)
+
+        # When
+        match.start_match()
+        match.goal("home", "Квинси Промес", 23)
+        pending_goals = stats.get_match_statistics()["total_goals"]
+        match.goal("away", "Артем Дзюба", 67)
+
+        # Then
+        self.assertEqual(pending_goals, 0)
+        self.assertEqual(stats.get_match_statistics()["total_goals"], 2)
+        self.assertEqual(stats.get_match_statistics()["total_events"], 3)
+
+    def test_explicit_flush_and_default_update_batch(self):
+        """flush доставляет остаток, update_batch по умолчанию вызывает update по порядку"""
+        # Given
+        match = FootballMatch("Спартак", "Зенит", batch_size=100)
+        recorder = RecordingObserver()
+        goals_only = RecordingObserver()
+        match.attach(recorder)
+        match.attach(goals_only, MatchEvent.GOAL)
+
+        # When
+        match.start_match()
+        match.goal("home", "Квинси Промес", 23)
+        match.yellow_card("Артем Дзюба", 40)
+        match.flush()
+
+        # Then
+        self.assertEqual(recorder.events, [MatchEvent.MATCH_START, MatchEvent.GOAL, MatchEvent.YELLOW_CARD])
+        self.assertEqual(goals_only.events, [MatchEvent.GOAL])
+
+    def test_replay_matches_live_statistics(self):
+        """Повтор архивных событий через notify_batch дает ту же статистику"""
+        # Given
+        live = StatisticsTracker()
+        match = FootballMatch("Спартак", "Зенит")
+        match.attach(live)
+        match.start_match()
+        match.goal("home", "Квинси Промес", 23, "Александр Соболев")
+        match.yellow_card("Артем Дзюба", 40)
+        match.substitution("Артем Дзюба", "Иван Сергеев", 60)
+        match.finish_match()
+
+        # When
+        replayed = StatisticsTracker()
+        replay = FootballMatch("Спартак", "Зенит", batch_size=1000)
+        replay.attach(replayed)
+        replay.notify_batch(live.match_events)
+        replay.flush()
+
+        # Then
+        self.assertEqual(replayed.get_match_statistics(), live.get_match_statistics())
+
+
+class TestIncrementalStatistics(unittest.TestCase):
+    """Тесты счетчиков и статистики игроков в StatisticsTracker"""
+
+    def play(self, *observers):
+        match = FootballMatch("Спартак", "Зенит")
+        for observer in observers:
+            match.attach(observer)
+        match.start_match()
+        match.goal("home", "Квинси Промес", 23, "Александр Соболев")
+        match.goal("home", "Квинси Промес", 51)
+        match.yellow_card("Артем Дзюба", 40)
+        match.substitution("Артем Дзюба", "Иван Сергеев", 60)
+        match.goal("away", "Иван Сергеев", 88, "Малком")
+        match.finish_match()
+
+    def test_player_statistics(self):
+        """Голы, передачи, карточки и замены считаются по игрокам"""
+        # Given
+        stats = StatisticsTracker()
+
+        # When
+        self.play(stats)
+
+        # Then
+        self.assertEqual(stats.get_player_statistics("Квинси Промес")["goals"], 2)
+        self.assertEqual(stats.get_player_statistics("Александр Соболев")["assists"], 1)
+        dzyuba = stats.get_player_statistics("Артем Дзюба")
+        self.assertEqual((dzyuba["yellow_cards"], dzyuba["substitutions_out"]), (1, 1))
+        sergeev = stats.get_player_statistics("Иван Сергеев")
+        self.assertEqual((sergeev["goals"], sergeev["substitutions_in"]), (1, 1))
+        self.assertEqual(len(stats.get_player_statistics()), 5)
+        self.assertEqual(stats.get_player_statistics("Игорь Акинфеев")["goals"], 0)
+
+    def test_statistics_without_retained_events(self):
+        """Без хранения событий счетчики те же, а данные событий не копятся"""
+        # Given
+        retained = StatisticsTracker()
+        compact = StatisticsTracker(retain_events=False)
+
+        # When
+        self.play(retained, compact)
+
+        # Then
+        full = retained.get_match_statistics()
+        counters = compact.get_match_statistics()
+        for key in ("total_goals", "home_goals", "away_goals", "goal_scorers",
+                    "yellow_cards", "card_recipients", "substitutions", "total_events"):
+            self.assertEqual(counters[key], full[key])
+        self.assertIsNone(counters["goals_data"])
+        self.assertIsNone(counters["cards_data"])
+        self.assertEqual(compact.match_events, [])
+
+    def test_statistics_are_copies(self):
+        """Изменение полученной статистики не меняет данные наблюдателя"""
+        # Given
+        stats = StatisticsTracker()
+        self.play(stats)
+        before = stats.get_match_statistics()
+
+        # When
+        changed = stats.get_match_statistics()
+        for key in ("goal_scorers", "card_recipients", "goals_data", "cards_data"):
+            changed[key].clear()
+
+        # Then
+        self.assertEqual(stats.get_match_statistics(), before)
+        self.assertTrue(before["goal_scorers"] and before["goals_data"] and before["cards_data"])
+
+    def test_batch_path_matches_update(self):
+        """update_batch дает ту же статистику, что и update"""
+        # Given
+        live = StatisticsTracker()
+        self.play(live)
+
+        # When
+        batched = StatisticsTracker()
+        batched.update_batch(live.match_events)
+
+        # Then
+        self.assertEqual(batched.get_match_statistics(), live.get_match_statistics())
+        self.assertEqual(batched.get_player_statistics(), live.get_player_statistics())
+
+
+if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from football import SeasonSimulator
+from football.simulation import generate_fixtures
+
+TEAMS = ["Спартак", "Зенит", "ЦСКА", "Локомотив", "Динамо", "Краснодар"]
+
+
+class TestSeasonSimulation(unittest.TestCase):
+    """TDD тесты симуляции сезона"""
+
+    def test_double_round_robin(self):
+        """Каждая пара играет дважды, дома и в гостях"""
+        # Given / When
+        fixtures = generate_fixtures(TEAMS + ["Рубин"])
+
+        # Then
+        pairs = {(fixture.home, fixture.away) for fixture in fixtures}
+        self.assertEqual(len(fixtures), 7 * 6)
+        self.assertEqual(len(pairs), len(fixtures))
+        self.assertTrue(all((away, home) in pairs for home, away in pairs))
+
+    def test_result_does_not_depend_on_processes(self):
+        """Один seed дает одну таблицу при любом числе процессов"""
+        # Given / When
+        single = SeasonSimulator(TEAMS, seed=42, processes=1).run()
+        pooled = SeasonSimulator(TEAMS, seed=42, processes=2, min_pool_matches=0).run()
+        other = SeasonSimulator(TEAMS, seed=43, processes=1).run()
+
+        # Then
+        self.assertEqual(single.standings, pooled.standings)
+        self.assertEqual(single.player_stats, pooled.player_stats)
+        self.assertEqual(single.total_events, pooled.total_events)
+        self.assertNotEqual(single.player_stats, other.player_stats)
+
+    def test_standings_match_player_stats(self):
+        """Голы в таблице совпадают с голами игроков"""
+        # Given / When
+        result = SeasonSimulator(TEAMS, seed=1, processes=1).run()
+
+        # Then
+        rows = result.standings
+        goals = sum(row["goals_for"] for row in rows)
+        self.assertEqual(result.matches, 30)
+        self.assertTrue(all(row["played"] == 10 for row in rows))
+        self.assertEqual(goals, sum(row["goals_against"] for row in rows))
+        self.assertEqual(goals, sum(stats["goals"] for stats in result.player_stats.values()))
+        self.assertEqual(sum(row["won"] for row in rows), sum(row["lost"] for row in rows))
+        self.assertEqual([row["position"] for row in rows], list(range(1, 7)))
+        self.assertIn(("Спартак", "Квинси Промес"), result.player_stats)
+        self.assertEqual(result.top_scorers(1)[0][2], max(stats["goals"] for stats in result.player_stats.values()))
+
+    def test_same_name_in_different_teams(self):
+        """Одноименные игроки разных команд считаются отдельно"""
+        # Given
+        simulator = SeasonSimulator(["Спартак", "Зенит", "ЦСКА"], seed=7, rounds=4, processes=1)
+        promes = next(player for player in simulator.squads["Спартак"] if player.name == "Квинси Промес")
+        namesake = next(player for player in simulator.squads["Зенит"] if player.position == promes.position)
+        namesake.name = promes.name
+
+        # When
+        result = simulator.run()
+
+        # Then
+        spartak = result.player_stats[("Спартак", "Квинси Промес")]
+        zenit = result.player_stats[("Зенит", "Квинси Промес")]
+        self.assertEqual(spartak["substitutions_in"] + zenit["substitutions_in"], 0)
+        self.assertGreater(spartak["goals"], 0)
+        self.assertGreater(zenit["goals"], 0)
+        self.assertEqual(sum(row["goals_for"] for row in result.standings),
+                         sum(stats["goals"] for stats in result.player_stats.values()))
+
+    def test_small_season_runs_inline(self):
+        """Короткий сезон не запускает пул процессов"""
+        # Given
+        simulator = SeasonSimulator(TEAMS, seed=1, processes=4)
+
+        # When
+        with patch("football.simulation.season.ProcessPoolExecutor") as pool:
+            result = simulator.run()
+
+        # Then
+        pool.assert_not_called()
+        self.assertEqual(result.matches, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+from collections import namedtuple
+
+from models import ТаблицаСотрудников
+
+try:
+    import numpy as np
+except ImportError:  # без numpy работает построчная версия
+    np = None
+
+Статистика = namedtuple("Статистика", "количество сумма среднее минимум максимум медиана")
+
+
+def статистика_по_отделам(сотрудники, полная=True):
+    """Статистика зарплат по id_отдела: количество, сумма, среднее, минимум, максимум, медиана
+
+    При полная=False считаются только количество, сумма и среднее
+    (остальные поля None) - этого достаточно для запроса 2 и не требует сортировки.
+    Сумма отдела - sum() по его зарплатам в порядке сотрудников, как в исходном
+    запросе 2 (в Python 3.12+ sum() компенсирует ошибки округления). bincount
+    в numpy складывает иначе, поэтому numpy считает только полную статистику.
+    """
+    if полная and np is not None:
+        return _статистика_numpy(сотрудники)
+    return _статистика_python(сотрудники, полная)
+
+
+def _статистика_python(сотрудники, полная):
+    зарплаты = {}
+    for с in сотрудники:
+        зарплаты.setdefault(с.id_отдела, []).append(с.зарплата)
+    результат = {}
+    for к, значения in зарплаты.items():
+        сумма = sum(значения)
+        n = len(значения)
+        if not полная:
+            результат[к] = Статистика(n, сумма, сумма / n, None, None, None)
+            continue
+        значения.sort()
+        медиана = (значения[(n - 1) // 2] + значения[n // 2]) / 2
+        результат[к] = Статистика(n, сумма, сумма / n, значения[0], значения[-1], медиана)
+    return результат
+
+
+def _колонки(сотрудники):
+    if isinstance(сотрудники, ТаблицаСотрудников):
+        # Массивы array отдаются numpy без копирования
+        return (np.frombuffer(сотрудники.ids_отделов, dtype=np.int64),
+                np.frombuffer(сотрудники.зарплаты, dtype=np.float64))
+    ключи = []
+    значения = []
+    for с in сотрудники:
+        ключи.append(с.id_отдела)
+        значения.append(с.зарплата)
+    return np.array(ключи, dtype=np.int64), np.array(значения, dtype=np.float64)
+
+
+def _статистика_numpy(сотрудники):
+    ключи, значения = _колонки(сотрудники)
+    if not len(ключи):
+        return {}
+
+    # Плотные коды групп: небольшие неотрицательные id берем как есть, иначе через unique
+    if ключи.min() >= 0 and ключи.max() < 4 * len(ключи) + 1024:
+        коды = ключи
+        количества = np.bincount(коды)
+        группы = np.flatnonzero(количества)
+        количества = количества[группы]
+        суммы = np.bincount(коды, weights=значения)[группы]
+    else:
+        группы, коды = np.unique(ключи, return_inverse=True)
+        количества = np.bincount(коды)
+        суммы = np.bincount(коды, weights=значения)
+    средние = суммы / количества
+
+    # Сортировка по (группа, зарплата): границы групп дают минимум, максимум и медиану
+    упорядочено = значения[np.lexsort((значения, коды))]
+    начала = np.concatenate(([0], np.cumsum(количества)[:-1]))
+    минимумы = упорядочено[начала]
+    максимумы = упорядочено[начала + количества - 1]
+    медианы = (упорядочено[начала + (количества - 1) // 2] + упорядочено[начала + количества // 2]) / 2
+    дополнительно = zip(минимумы.tolist(), максимумы.tolist(), медианы.tolist())
+
+    return {
+        к: Статистика(n, сумма, среднее, *доп)
+        for к, n, сумма, среднее, доп in zip(
+            группы.tolist(), количества.tolist(), суммы.tolist(), средние.tolist(), дополнительно
+        )
+    }
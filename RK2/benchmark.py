@@ -0,0 +1,270 @@
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from itertools import accumulate
+
+from models import Отдел, Сотрудник, СотрудникиОтдела, ТаблицаСотрудников
+from queries import запрос_1_отделы_со_словом_отдел, запрос_2_средняя_зарплата_по_отделам, запрос_3_сотрудники_на_а
+from queries import запрос_1_по_хранилищу, запрос_2_по_хранилищу, запрос_3_по_хранилищу
+from queries import запрос_1_многие_ко_многим, запрос_2_многие_ко_многим, запрос_3_многие_ко_многим
+from query_builder import запрос_1_построитель, запрос_2_построитель, запрос_3_построитель
+from store import Хранилище, ИндексСвязей
+
+РАЗМЕРЫ = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+КОРНИ = (
+    "Абрам", "Агап", "Аксен", "Алексе", "Андре", "Афанась", "Бел", "Богдан", "Васил", "Волк",
+    "Григорь", "Дмитри", "Егор", "Жук", "Зайц", "Иван", "Кузнец", "Лебед", "Мороз", "Никол",
+    "Орл", "Павл", "Петр", "Роман", "Сидор", "Смирн", "Тарас", "Федор", "Фрол", "Яковл",
+)
+ОКОНЧАНИЯ = ("ов", "ев", "ин", "ский")
+НАЗВАНИЯ = ("Отдел", "Группа", "Служба", "Лаборатория", "Управление")
+ОБЛАСТИ = ("разработки", "продаж", "поддержки", "закупок", "аналитики", "логистики", "кадров", "маркетинга")
+
+
+def _фамилии(rng, количество, распределение):
+    """Генератор количество фамилий с заданным распределением"""
+    пул = [к + о for к in КОРНИ for о in ОКОНЧАНИЯ]
+    rng.shuffle(пул)
+    if распределение == "равномерно":
+        for _ in range(количество):
+            yield rng.choice(пул)
+    elif распределение == "зипф":
+        # Вес k-й фамилии 1/k: немного фамилий встречаются очень часто
+        веса = list(accumulate(1 / k for k in range(1, len(пул) + 1)))
+        for _ in range(количество):
+            yield rng.choices(пул, cum_weights=веса)[0]
+    elif распределение == "уникальные":
+        for i in range(количество):
+            yield f"{пул[i % len(пул)]}{i // len(пул)}"
+    else:
+        raise ValueError(f"Неизвестное распределение фамилий: {распределение}")
+
+
+def сгенерировать_организацию(сотрудников, отделов=None, связей_на_сотрудника=1.0,
+                              фамилии="равномерно", доля_отделов=0.5, зерно=0, компактно=False):
+    """Синтетическая организация: (отделы, сотрудники, связи)
+
+    Одинаковые аргументы дают одинаковые данные. По умолчанию в среднем
+    100 сотрудников на отдел; доля_отделов - доля наименований со словом
+    "Отдел"; связей_на_сотрудника - среднее число строк СотрудникиОтдела
+    на сотрудника (разные отделы, первый - основной). фамилии: "равномерно",
+    "зипф" или "уникальные". При компактно=True сотрудники хранятся в
+    ТаблицеСотрудников.
+    """
+    rng = random.Random(зерно)
+    отделов = отделов or max(1, сотрудников // 100)
+    список_отделов = []
+    for id_отдела in range(1, отделов + 1):
+        вид = "Отдел" if rng.random() < доля_отделов else rng.choice(НАЗВАНИЯ[1:])
+        список_отделов.append(Отдел(id_отдела, f"{вид} {rng.choice(ОБЛАСТИ)} {id_отдела}"))
+
+    таблица = ТаблицаСотрудников() if компактно else None
+    создать = Сотрудник if таблица is None else таблица.добавить
+    сотрудники = []
+    связи = []
+    целых, дробная = divmod(связей_на_сотрудника, 1)
+    for id_сотрудника, фамилия in enumerate(_фамилии(rng, сотрудников, фамилии), 1):
+        id_отдела = rng.randint(1, отделов)
+        сотрудники.append(создать(id_сотрудника, фамилия, float(rng.randrange(30000, 200000, 500)), id_отдела))
+        количество = min(отделов, int(целых) + (rng.random() < дробная))
+        if количество:
+            связи.append(СотрудникиОтдела(id_сотрудника, id_отдела))
+        дополнительные = set()
+        while len(дополнительные) < количество - 1:
+            другой = rng.randint(1, отделов)
+            if другой != id_отдела:
+                дополнительные.add(другой)
+        связи.extend(СотрудникиОтдела(id_сотрудника, id_отдела) for id_отдела in sorted(дополнительные))
+    return список_отделов, (таблица if таблица is not None else сотрудники), связи
+
+
+def _хранилище(отделы, сотрудники):
+    # Ленивые индексы строятся при подготовке, чтобы запросы мерились без них
+    хранилище = Хранилище(отделы, сотрудники)
+    хранилище.индекс_фамилий()
+    хранилище.индекс_наименований()
+    return хранилище
+
+
+def _реализации(отделы, сотрудники, связи):
+    """Имя реализации -> (подготовка, {запрос: функция от подготовленных данных})"""
+    return {
+        "списки": (lambda: None, {
+            "запрос_1": lambda _: запрос_1_отделы_со_словом_отдел(отделы, сотрудники),
+            "запрос_2": lambda _: запрос_2_средняя_зарплата_по_отделам(отделы, сотрудники),
+            "запрос_3": lambda _: запрос_3_сотрудники_на_а(отделы, сотрудники),
+        }),
+        "хранилище": (lambda: _хранилище(отделы, сотрудники), {
+            "запрос_1": запрос_1_по_хранилищу,
+            "запрос_2": запрос_2_по_хранилищу,
+            "запрос_3": запрос_3_по_хранилищу,
+        }),
+        "построитель": (lambda: _хранилище(отделы, сотрудники), {
+            "запрос_1": запрос_1_построитель,
+            "запрос_2": запрос_2_построитель,
+            "запрос_3": запрос_3_построитель,
+        }),
+        "многие_ко_многим": (lambda: ИндексСвязей(связи), {
+            "запрос_1": lambda индекс: запрос_1_многие_ко_многим(отделы, сотрудники, индекс),
+            "запрос_2": lambda индекс: запрос_2_многие_ко_многим(отделы, сотрудники, индекс),
+            "запрос_3": lambda индекс: запрос_3_многие_ко_многим(отделы, сотрудники, индекс),
+        }),
+    }
+
+
+def замерить(функция, повторов=3):
+    """(лучшее время в секундах, пиковая память в байтах) вызова функция()
+
+    Время меряется без tracemalloc (он замедляет выделения в разы),
+    память - отдельным прогоном под tracemalloc; учитываются только
+    выделения во время вызова, а не уже загруженные данные.
+    """
+    лучшее = math.inf
+    for _ in range(повторов):
+        gc.collect()
+        начало = time.perf_counter()
+        функция()
+        лучшее = min(лучшее, time.perf_counter() - начало)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        функция()
+        _, пик = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return лучшее, пик
+
+
+def показатели_роста(результаты):
+    """Наклон log(время)/log(размер) между соседними размерами
+
+    Около 1 - линейный рост, около 2 - квадратичный. Замеры короче
+    миллисекунды не сравниваются: их время - в основном шум.
+    """
+    ряды = {}
+    for р in результаты:
+        ряды.setdefault((р["реализация"], р["запрос"]), []).append(р)
+    показатели = []
+    for (реализация, запрос), ряд in ряды.items():
+        ряд.sort(key=lambda р: р["сотрудников"])
+        for a, b in zip(ряд, ряд[1:]):
+            if a["секунд"] < 1e-3 or b["сотрудников"] == a["сотрудников"]:
+                continue
+            наклон = math.log(b["секунд"] / a["секунд"]) / math.log(b["сотрудников"] / a["сотрудников"])
+            показатели.append({
+                "реализация": реализация, "запрос": запрос,
+                "от": a["сотрудников"], "до": b["сотрудников"], "наклон": round(наклон, 3),
+            })
+    return показатели
+
+
+def отношения_к_хранилищу(результаты, реализация="построитель"):
+    """Время реализации, деленное на время ручных запросов над хранилищем
+
+    Для каждого запроса и размера; около 1 - реализация не медленнее ручной.
+    Как и в показателях роста, замеры короче миллисекунды не сравниваются.
+    """
+    ручные = {
+        (р["запрос"], р["сотрудников"]): р["секунд"]
+        for р in результаты if р["реализация"] == "хранилище" and р["запрос"] != "подготовка"
+    }
+    отношения = []
+    for р in результаты:
+        ручное = ручные.get((р["запрос"], р["сотрудников"]))
+        if р["реализация"] != реализация or ручное is None or ручное < 1e-3:
+            continue
+        отношения.append({
+            "реализация": реализация, "запрос": р["запрос"], "сотрудников": р["сотрудников"],
+            "отношение": round(р["секунд"] / ручное, 3),
+        })
+    return отношения
+
+
+def запустить(размеры=РАЗМЕРЫ, реализации=None, повторов=3, зерно=0, печать=None, **параметры):
+    """Замеры запросов 1-3 для каждого размера; возвращает словарь для JSON
+
+    параметры передаются в сгенерировать_организацию. Для каждого размера
+    отдельно замеряются подготовка реализации (построение индексов) и
+    каждый запрос.
+    """
+    результаты = []
+    for размер in размеры:
+        отделы, сотрудники, связи = сгенерировать_организацию(размер, зерно=зерно, **параметры)
+        for имя, (подготовка, запросы) in _реализации(отделы, сотрудники, связи).items():
+            if реализации is not None and имя not in реализации:
+                continue
+            секунд, пик = замерить(подготовка, повторов=1)
+            данные = подготовка()
+            замеры = [("подготовка", секунд, пик)]
+            for запрос, функция in запросы.items():
+                замеры.append((запрос, *замерить(lambda: функция(данные), повторов)))
+            for запрос, секунд, пик in замеры:
+                результаты.append({
+                    "реализация": имя, "запрос": запрос, "сотрудников": размер, "отделов": len(отделы),
+                    "связей": len(связи), "секунд": секунд, "пик_памяти": пик,
+                })
+                if печать:
+                    печать(f"{имя:>16} {запрос:>10} {размер:>9}: {секунд:.4f} с, {пик / 2 ** 20:.1f} МБ")
+            del данные
+    return {
+        "python": platform.python_version(),
+        "платформа": platform.platform(),
+        "зерно": зерно,
+        "повторов": повторов,
+        "параметры": параметры,
+        "результаты": результаты,
+        "рост": показатели_роста(результаты),
+        "построитель_к_хранилищу": отношения_к_хранилищу(результаты),
+    }
+
+
+def main(аргументы=None):
+    разбор = argparse.ArgumentParser(description="Замеры запросов RK2 на синтетических организациях")
+    разбор.add_argument("--размеры", type=int, nargs="+", default=list(РАЗМЕРЫ), help="числа сотрудников")
+    разбор.add_argument("--реализации", nargs="+", choices=("списки", "хранилище", "построитель", "многие_ко_многим"))
+    разбор.add_argument("--отделов", type=int, help="число отделов (по умолчанию сотрудников / 100)")
+    разбор.add_argument("--связей", type=float, default=1.0, help="связей СотрудникиОтдела на сотрудника")
+    разбор.add_argument("--фамилии", default="равномерно", choices=("равномерно", "зипф", "уникальные"))
+    разбор.add_argument("--компактно", action="store_true", help="сотрудники в ТаблицеСотрудников")
+    разбор.add_argument("--повторов", type=int, default=3)
+    разбор.add_argument("--зерно", type=int, default=0)
+    разбор.add_argument("--вывод", default="benchmark.json", help="файл JSON с результатами")
+    разбор.add_argument("--макс-наклон", type=float,
+                        help="код возврата 1, если рост времени круче (например, 1.5 против квадратичного)")
+    разбор.add_argument("--макс-отношение", type=float,
+                        help="код возврата 1, если построитель медленнее ручных запросов над хранилищем "
+                             "больше чем во столько раз (например, 1.25)")
+    а = разбор.parse_args(аргументы)
+
+    отчет = запустить(
+        а.размеры, а.реализации, а.повторов, а.зерно, печать=print,
+        отделов=а.отделов, связей_на_сотрудника=а.связей, фамилии=а.фамилии, компактно=а.компактно,
+    )
+    with open(а.вывод, "w", encoding="utf-8") as f:
+        json.dump(отчет, f, ensure_ascii=False, indent=2)
+    print(f"Результаты записаны в {а.вывод}")
+
+    код = 0
+    if а.макс_наклон is not None:
+        превышения = [п for п in отчет["рост"] if п["наклон"] > а.макс_наклон]
+        for п in превышения:
+            print(f"Рост {п['реализация']} {п['запрос']} {п['от']}->{п['до']}: наклон {п['наклон']}")
+        код = код or int(bool(превышения))
+    if а.макс_отношение is not None:
+        превышения = [о for о in отчет["построитель_к_хранилищу"] if о["отношение"] > а.макс_отношение]
+        for о in превышения:
+            print(f"Построитель {о['запрос']} на {о['сотрудников']}: в {о['отношение']} раза медленнее хранилища")
+        код = код or int(bool(превышения))
+    return код
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+
+from queries import запрос_1_по_хранилищу, запрос_2_по_хранилищу, запрос_3_по_хранилищу
+
+
+class _Запись:
+    __slots__ = ("результат", "версия", "затронута")
+
+    def __init__(self, результат, версия, затронута):
+        self.результат = результат
+        self.версия = версия
+        self.затронута = затронута  # функция(изменение) -> bool
+
+
+class КэшЗапросов:
+    """LRU-кэш результатов запросов 1-3 над Хранилищем
+
+    Ключ записи - имя запроса и параметры. Каждое изменение Хранилища
+    сбрасывает только записи, которые оно может затронуть, остальным
+    присваивается новая версия данных. Запись с версией, отличной от
+    Хранилище.версия, считается устаревшей. Результаты отдаются без
+    копирования - их нельзя изменять.
+    """
+
+    def __init__(self, хранилище, размер=256):
+        self.хранилище = хранилище
+        self.размер = размер
+        self._записи = OrderedDict()
+        self.попадания = 0
+        self.промахи = 0
+        self.вытеснения = 0
+        self.сбросы = 0
+        хранилище.подписаться(self._при_изменении)
+
+    def __len__(self):
+        return len(self._записи)
+
+    def _при_изменении(self, изменение):
+        версия = self.хранилище.версия
+        for ключ in list(self._записи):
+            запись = self._записи[ключ]
+            if запись.затронута(изменение):
+                del self._записи[ключ]
+                self.сбросы += 1
+            else:
+                запись.версия = версия
+
+    def _получить(self, ключ, вычислить):
+        запись = self._записи.get(ключ)
+        if запись is not None and запись.версия == self.хранилище.версия:
+            self._записи.move_to_end(ключ)
+            self.попадания += 1
+            return запись.результат
+        self.промахи += 1
+        результат, затронута = вычислить()
+        self._записи[ключ] = _Запись(результат, self.хранилище.версия, затронута)
+        self._записи.move_to_end(ключ)
+        if len(self._записи) > self.размер:
+            self._записи.popitem(last=False)
+            self.вытеснения += 1
+        return результат
+
+    def запрос_1(self, слово="отдел"):
+        def вычислить():
+            результат = запрос_1_по_хранилищу(self.хранилище, слово)
+            отделы = {о.id_отдела for о in self.хранилище.найти_отделы(слово)}
+            слово_cf = слово.casefold()
+
+            def затронута(изменение):
+                if изменение.вид == "отдел":
+                    return any(слово_cf in строка.casefold() for строка in изменение.строки)
+                return not отделы.isdisjoint(изменение.ids_отделов)
+            return результат, затронута
+        return self._получить(("запрос_1", слово), вычислить)
+
+    def запрос_2(self):
+        # Средние зависят от всех сотрудников и порядка отделов: сбрасывается при любом изменении
+        return self._получить(("запрос_2",), lambda: (запрос_2_по_хранилищу(self.хранилище), lambda изменение: True))
+
+    def запрос_3(self, префикс="А", без_регистра=False):
+        def вычислить():
+            результат = запрос_3_по_хранилищу(self.хранилище, префикс, без_регистра)
+            отделы = {с.id_отдела for с in self.хранилище.найти_по_фамилии(префикс, без_регистра)}
+            нормализовать = str.casefold if без_регистра else str
+            префикс_н = нормализовать(префикс)
+
+            def затронута(изменение):
+                if изменение.вид == "отдел":
+                    return not отделы.isdisjoint(изменение.ids_отделов)
+                return any(нормализовать(строка).startswith(префикс_н) for строка in изменение.строки)
+            return результат, затронута
+        return self._получить(("запрос_3", префикс, без_регистра), вычислить)
+
+    def статистика(self):
+        всего = self.попадания + self.промахи
+        return {
+            "попадания": self.попадания,
+            "промахи": self.промахи,
+            "доля_попаданий": self.попадания / всего if всего else 0.0,
+            "вытеснения": self.вытеснения,
+            "сбросы": self.сбросы,
+            "размер": len(self._записи),
+        }
@@ -0,0 +1,203 @@
+from bisect import bisect_left
+from heapq import merge
+from operator import itemgetter
+
+# Перебор в порядке добавления просматривает все строки по порядку позиций,
+# если совпадений не меньше 1/ПЛОТНОСТЬ всех строк
+ПЛОТНОСТЬ = 8
+_БЕСКОНЕЧНОСТЬ = float("inf")
+
+
+def верхняя_граница(префикс):
+    # Наименьшая строка, большая всех строк с данным префиксом
+    return префикс[:-1] + chr(ord(префикс[-1]) + 1)
+
+
+class ПрефиксныйИндекс:
+    """Отсортированный индекс строк для поиска по префиксу за O(log n + k)
+
+    Ключи хранятся парами (строка, позиция), где позиция - номер вставки:
+    так одинаковые строки различимы при удалении, а найденные значения
+    можно вернуть в порядке добавления. Пока индекс строится (до первого
+    поиска или удаления) и при добавить_все ключи копятся в буфере и
+    вливаются в отсортированные списки одной сортировкой: построение по
+    одной строке стоит O(n log n), а не O(n²). В построенный индекс
+    добавить вставляет ключ сразу через bisect за O(log n) сравнений.
+
+    Для перебора в порядке добавления рядом хранится словарь позиция ->
+    строка, упорядоченный по позициям. Перебор ленивый: частые префиксы
+    фильтруются проходом по этому словарю, редкие сливаются через heapq
+    из серий одинаковых строк (внутри серии ключи уже идут по позициям).
+    Менять индекс во время перебора нельзя.
+    """
+
+    def __init__(self, без_регистра=False):
+        self.без_регистра = без_регистра
+        self._ключи = []  # отсортированные (строка, позиция)
+        self._значения = []  # значения в том же порядке
+        self._новые = []  # ((строка, позиция), значение), еще не влитые в списки
+        self._построен = False  # был поиск или удаление: добавления идут сразу в списки
+        self._по_позициям = {}  # позиция -> (строка, значение)
+        self._наибольшая_позиция = -1
+        self._позиции_упорядочены = True
+
+    def __len__(self):
+        return len(self._ключи) + len(self._новые)
+
+    def _нормализовать(self, строка):
+        return строка.casefold() if self.без_регистра else строка
+
+    def добавить(self, строка, позиция, значение):
+        строка = self._нормализовать(строка)
+        if self._построен and not self._новые:
+            ключ = (строка, позиция)
+            i = bisect_left(self._ключи, ключ)
+            self._ключи.insert(i, ключ)
+            self._значения.insert(i, значение)
+        else:
+            self._новые.append(((строка, позиция), значение))
+        self._запомнить_позицию(строка, позиция, значение)
+
+    def добавить_все(self, тройки):
+        """Массовое добавление (строка, позиция, значение)"""
+        for строка, позиция, значение in тройки:
+            строка = self._нормализовать(строка)
+            self._новые.append(((строка, позиция), значение))
+            self._запомнить_позицию(строка, позиция, значение)
+
+    def _запомнить_позицию(self, строка, позиция, значение):
+        if позиция < self._наибольшая_позиция:
+            self._позиции_упорядочены = False
+        else:
+            self._наибольшая_позиция = позиция
+        self._по_позициям[позиция] = (строка, значение)
+
+    def _влить(self):
+        # Отсортированная часть - одна серия для timsort: слияние стоит O(n + b log b)
+        self._построен = True
+        if not self._новые:
+            return
+        пары = list(zip(self._ключи, self._значения))
+        пары.extend(self._новые)
+        пары.sort(key=itemgetter(0))
+        self._ключи = [ключ for ключ, _ in пары]
+        self._значения = [значение for _, значение in пары]
+        self._новые = []
+
+    def удалить(self, строка, позиция):
+        self._влить()
+        ключ = (self._нормализовать(строка), позиция)
+        i = bisect_left(self._ключи, ключ)
+        if i == len(self._ключи) or self._ключи[i] != ключ:
+            raise KeyError(строка)
+        del self._ключи[i]
+        del self._значения[i]
+        del self._по_позициям[позиция]
+
+    def _границы(self, префикс):
+        self._влить()
+        префикс = self._нормализовать(префикс)
+        if not префикс:
+            return 0, len(self._ключи)
+        return (bisect_left(self._ключи, (префикс,)),
+                bisect_left(self._ключи, (верхняя_граница(префикс),)))
+
+    def найти(self, префикс, по_порядку=False):
+        """Значения, чьи строки начинаются с префикса (по строкам или в порядке добавления)"""
+        начало, конец = self._границы(префикс)
+        if not по_порядку:
+            return self._значения[начало:конец]
+        return list(self.перебрать(префикс, по_порядку))
+
+    def перебрать(self, префикс, по_порядку=False):
+        # Ленивый вариант найти: значения не копируются в список
+        начало, конец = self._границы(префикс)
+        if not по_порядку:
+            for i in range(начало, конец):
+                yield self._значения[i]
+        elif (конец - начало) * ПЛОТНОСТЬ >= len(self._ключи):
+            yield from self._перебрать_по_позициям(self._нормализовать(префикс), конец - начало)
+        else:
+            значения = self._значения
+            for _, i in merge(*self._серии(начало, конец)):
+                yield значения[i]
+
+    def _перебрать_по_позициям(self, префикс, количество):
+        # На каждую найденную строку приходится не больше ПЛОТНОСТЬ просмотренных
+        if not количество:
+            return
+        if not self._позиции_упорядочены:
+            self._по_позициям = dict(sorted(self._по_позициям.items()))
+            self._позиции_упорядочены = True
+        for строка, значение in self._по_позициям.values():
+            if строка.startswith(префикс):
+                yield значение
+                количество -= 1
+                if not количество:
+                    return
+
+    def _серии(self, начало, конец):
+        # Серии одинаковых строк в [начало, конец): (позиция, номер) по возрастанию позиций
+        ключи = self._ключи
+        серии = []
+        while начало < конец:
+            граница = bisect_left(ключи, (ключи[начало][0], _БЕСКОНЕЧНОСТЬ), начало, конец)
+            серии.append(((ключи[i][1], i) for i in range(начало, граница)))
+            начало = граница
+        return серии
+
+    def количество(self, префикс):
+        начало, конец = self._границы(префикс)
+        return конец - начало
+
+
+def триграммы(строка):
+    return {строка[i:i + 3] for i in range(len(строка) - 2)}
+
+
+class ТриграммныйИндекс:
+    """Индекс триграмм для поиска по подстроке без учета регистра
+
+    Для подстроки из трех и более символов кандидаты - пересечение списков
+    ее триграмм, затем каждый кандидат проверяется оператором in.
+    Более короткие подстроки проверяются по всем строкам.
+    """
+
+    def __init__(self):
+        self._строки = {}  # ключ -> (позиция, строка в casefold)
+        self._списки = {}  # триграмма -> множество ключей
+
+    def __len__(self):
+        return len(self._строки)
+
+    def добавить(self, ключ, строка, позиция):
+        if ключ in self._строки:
+            self.удалить(ключ)
+        строка = строка.casefold()
+        self._строки[ключ] = (позиция, строка)
+        for т in триграммы(строка):
+            self._списки.setdefault(т, set()).add(ключ)
+
+    def удалить(self, ключ):
+        _, строка = self._строки.pop(ключ)
+        for т in триграммы(строка):
+            ключи = self._списки[т]
+            ключи.discard(ключ)
+            if not ключи:
+                del self._списки[т]
+
+    def кандидаты(self, подстрока):
+        т = триграммы(подстрока.casefold())
+        if not т:
+            return self._строки.keys()
+        списки = sorted((self._списки.get(х, ()) for х in т), key=len)
+        if not списки[0]:
+            return set()
+        return set(списки[0]).intersection(*списки[1:])
+
+    def найти(self, подстрока):
+        """Ключи строк, содержащих подстроку, в порядке позиций"""
+        подстрока = подстрока.casefold()
+        найдено = [к for к in self.кандидаты(подстрока) if подстрока in self._строки[к][1]]
+        найдено.sort(key=lambda к: self._строки[к][0])
+        return найдено
@@ -1,22 +1,34 @@
-from models import create_test_data
-from queries import запрос_1_отделы_со_словом_отдел, запрос_2_средняя_зарплата_по_отделам, запрос_3_сотрудники_на_а
-
-def main():
-    отделы, сотрудники, _ = create_test_data()
-
-    print("=== Запрос 1 ===")
-    for item in запрос_1_отделы_со_словом_отдел(отделы, сотрудники):
-        print(f"  {item['отдел']}:")
-        for s in item["сотрудники"]:
-            print(f"    {s['фамилия']} (ID: {s['id']}, Зарплата: {s['зарплата']})")
-
-    print("\n=== Запрос 2 ===")
-    for название, средняя in запрос_2_средняя_зарплата_по_отделам(отделы, сотрудники):
-        print(f"  {название}: {средняя}")
-
-    print("\n=== Запрос 3 ===")
-    for s in запрос_3_сотрудники_на_а(отделы, сотрудники):
-        print(f"  {s['фамилия']} (Отдел: {s['отдел']})")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+from models import create_test_data
+from store import Хранилище
+from streaming import поток_запроса_1, поток_запроса_2, поток_запроса_3, постранично
+
+# Строки печатаются по мере получения, в памяти не больше одной страницы
+РАЗМЕР_СТРАНИЦЫ = 100
+
+def main():
+    отделы, сотрудники, _ = create_test_data()
+    хранилище = Хранилище(отделы, сотрудники)
+
+    print("=== Запрос 1 ===")
+    текущий_отдел = None
+    for строки in постранично(поток_запроса_1(хранилище), РАЗМЕР_СТРАНИЦЫ):
+        for строка in строки:
+            if строка["отдел"] != текущий_отдел:
+                текущий_отдел = строка["отдел"]
+                print(f"  {текущий_отдел}:")
+            s = строка["сотрудник"]
+            if s is not None:
+                print(f"    {s['фамилия']} (ID: {s['id']}, Зарплата: {s['зарплата']})")
+
+    print("\n=== Запрос 2 ===")
+    for строки in постранично(поток_запроса_2(хранилище), РАЗМЕР_СТРАНИЦЫ):
+        for название, средняя in строки:
+            print(f"  {название}: {средняя}")
+
+    print("\n=== Запрос 3 ===")
+    for строки in постранично(поток_запроса_3(хранилище), РАЗМЕР_СТРАНИЦЫ):
+        for s in строки:
+            print(f"  {s['фамилия']} (Отдел: {s['отдел']})")
+
+if __name__ == "__main__":
+    main()
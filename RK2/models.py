@@ -1,52 +1,128 @@
-class Сотрудник:
-    def __init__(self, id_сотрудника, фамилия, зарплата, id_отдела):
-        self.id_сотрудника = id_сотрудника
-        self.фамилия = фамилия
-        self.зарплата = зарплата
-        self.id_отдела = id_отдела
-
-class Отдел:
-    def __init__(self, id_отдела, наименование):
-        self.id_отдела = id_отдела
-        self.наименование = наименование
-
-class СотрудникиОтдела:
-    def __init__(self, id_сотрудника, id_отдела):
-        self.id_сотрудника = id_сотрудника
-        self.id_отдела = id_отдела
-
-# Функция для инициализации тестовых данных
-def create_test_data():
-    отделы = [
-        Отдел(1, "Отдел разработки"),
-        Отдел(2, "Отдел маркетинга"),
-        Отдел(3, "Отдел продаж"),
-        Отдел(4, "Отдел поддержки"),
-        Отдел(5, "Отдел аналитики")
-    ]
-
-    сотрудники = [
-        Сотрудник(1, "Иванов", 75000.0, 1),
-        Сотрудник(2, "Петров", 82000.0, 1),
-        Сотрудник(3, "Сидоров", 68000.0, 2),
-        Сотрудник(4, "Алексеев", 71000.0, 3),
-        Сотрудник(5, "Андреева", 79000.0, 4),
-        Сотрудник(6, "Белов", 65000.0, 5),
-        Сотрудник(7, "Афанасьев", 85000.0, 1),
-        Сотрудник(8, "Григорьева", 73000.0, 3)
-    ]
-
-    сотрудники_отдела = [
-        СотрудникиОтдела(1, 1),
-        СотрудникиОтдела(1, 3),
-        СотрудникиОтдела(2, 1),
-        СотрудникиОтдела(3, 2),
-        СотрудникиОтдела(4, 3),
-        СотрудникиОтдела(5, 4),
-        СотрудникиОтдела(6, 5),
-        СотрудникиОтдела(7, 1),
-        СотрудникиОтдела(8, 3),
-        СотрудникиОтдела(8, 5)
-    ]
-
+from array import array
+
+class Сотрудник:
+    __slots__ = ("id_сотрудника", "фамилия", "зарплата", "id_отдела")
+
+    def __init__(self, id_сотрудника, фамилия, зарплата, id_отдела):
+        self.id_сотрудника = id_сотрудника
+        self.фамилия = фамилия
+        self.зарплата = зарплата
+        self.id_отдела = id_отдела
+
+class Отдел:
+    __slots__ = ("id_отдела", "наименование")
+
+    def __init__(self, id_отдела, наименование):
+        self.id_отдела = id_отдела
+        self.наименование = наименование
+
+class СотрудникиОтдела:
+    __slots__ = ("id_сотрудника", "id_отдела")
+
+    def __init__(self, id_сотрудника, id_отдела):
+        self.id_сотрудника = id_сотрудника
+        self.id_отдела = id_отдела
+
+class СтрокаСотрудника:
+    """Представление строки ТаблицыСотрудников с теми же полями, что у Сотрудника"""
+    __slots__ = ("_таблица", "_номер")
+
+    def __init__(self, таблица, номер):
+        self._таблица = таблица
+        self._номер = номер
+
+    @property
+    def id_сотрудника(self):
+        return self._таблица.ids[self._номер]
+
+    @property
+    def фамилия(self):
+        т = self._таблица
+        return т.фамилии[т.коды_фамилий[self._номер]]
+
+    @property
+    def зарплата(self):
+        return self._таблица.зарплаты[self._номер]
+
+    @property
+    def id_отдела(self):
+        return self._таблица.ids_отделов[self._номер]
+
+class ТаблицаСотрудников:
+    """Колоночное хранение сотрудников: массивы array и общий пул фамилий
+
+    Строка занимает 8 байт на каждое числовое поле и 8 байт на код фамилии,
+    одинаковые фамилии хранятся один раз. Итерация выдает СтрокаСотрудника,
+    поэтому запросы читают .фамилия, .зарплата и т.д. как у Сотрудника.
+    """
+
+    def __init__(self, сотрудники=()):
+        self.ids = array('q')
+        self.зарплаты = array('d')
+        self.ids_отделов = array('q')
+        self.коды_фамилий = array('q')
+        self.фамилии = []  # код -> фамилия
+        self._коды = {}  # фамилия -> код
+        for с in сотрудники:
+            self.добавить(с.id_сотрудника, с.фамилия, с.зарплата, с.id_отдела)
+
+    def добавить(self, id_сотрудника, фамилия, зарплата, id_отдела):
+        код = self._коды.get(фамилия)
+        if код is None:
+            код = self._коды[фамилия] = len(self.фамилии)
+            self.фамилии.append(фамилия)
+        self.ids.append(id_сотрудника)
+        self.зарплаты.append(зарплата)
+        self.ids_отделов.append(id_отдела)
+        self.коды_фамилий.append(код)
+        return СтрокаСотрудника(self, len(self.ids) - 1)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, номер):
+        if номер < 0:
+            номер += len(self.ids)
+        if not 0 <= номер < len(self.ids):
+            raise IndexError(номер)
+        return СтрокаСотрудника(self, номер)
+
+    def __iter__(self):
+        for номер in range(len(self.ids)):
+            yield СтрокаСотрудника(self, номер)
+
+# Функция для инициализации тестовых данных
+def create_test_data():
+    отделы = [
+        Отдел(1, "Отдел разработки"),
+        Отдел(2, "Отдел маркетинга"),
+        Отдел(3, "Отдел продаж"),
+        Отдел(4, "Отдел поддержки"),
+        Отдел(5, "Отдел аналитики")
+    ]
+
+    сотрудники = [
+        Сотрудник(1, "Иванов", 75000.0, 1),
+        Сотрудник(2, "Петров", 82000.0, 1),
+        Сотрудник(3, "Сидоров", 68000.0, 2),
+        Сотрудник(4, "Алексеев", 71000.0, 3),
+        Сотрудник(5, "Андреева", 79000.0, 4),
+        Сотрудник(6, "Белов", 65000.0, 5),
+        Сотрудник(7, "Афанасьев", 85000.0, 1),
+        Сотрудник(8, "Григорьева", 73000.0, 3)
+    ]
+
+    сотрудники_отдела = [
+        СотрудникиОтдела(1, 1),
+        СотрудникиОтдела(1, 3),
+        СотрудникиОтдела(2, 1),
+        СотрудникиОтдела(3, 2),
+        СотрудникиОтдела(4, 3),
+        СотрудникиОтдела(5, 4),
+        СотрудникиОтдела(6, 5),
+        СотрудникиОтдела(7, 1),
+        СотрудникиОтдела(8, 3),
+        СотрудникиОтдела(8, 5)
+    ]
+
     return отделы, сотрудники, сотрудники_отдела
\ No newline at end of file
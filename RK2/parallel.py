@@ -0,0 +1,132 @@
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
+class _Шард:
+    """Часть сотрудников одного набора отделов в колонках array - дешево передается в процесс"""
+    __slots__ = ("позиции", "ids", "фамилии", "зарплаты", "ids_отделов")
+
+    def __init__(self):
+        self.позиции = array('q')  # номер сотрудника в исходном списке
+        self.ids = array('q')
+        self.фамилии = []
+        self.зарплаты = array('d')
+        self.ids_отделов = array('q')
+
+    def __getstate__(self):
+        return (self.позиции, self.ids, self.фамилии, self.зарплаты, self.ids_отделов)
+
+    def __setstate__(self, состояние):
+        self.позиции, self.ids, self.фамилии, self.зарплаты, self.ids_отделов = состояние
+
+
+# Шарды процесса-воркера: передаются один раз при запуске пула, а не с каждой задачей
+_шарды = []
+
+
+def _установить_шарды(шарды):
+    global _шарды
+    _шарды = шарды
+
+
+def _шард_запрос_1(номер, ids_отделов):
+    шард = _шарды[номер]
+    результат = {}
+    for id_сотрудника, фамилия, зарплата, id_отдела in zip(шард.ids, шард.фамилии, шард.зарплаты, шард.ids_отделов):
+        if id_отдела in ids_отделов:
+            результат.setdefault(id_отдела, []).append(
+                {"фамилия": фамилия, "id": id_сотрудника, "зарплата": зарплата}
+            )
+    return результат
+
+
+def _шард_запрос_2(номер):
+    шард = _шарды[номер]
+    # Отдел целиком лежит в одном шарде, а сотрудники - в исходном порядке,
+    # поэтому sum() получает те же списки зарплат, что и запрос 2 без шардов
+    зарплаты = {}
+    for зарплата, id_отдела in zip(шард.зарплаты, шард.ids_отделов):
+        зарплаты.setdefault(id_отдела, []).append(зарплата)
+    return {к: (sum(значения), len(значения)) for к, значения in зарплаты.items()}
+
+
+def _шард_запрос_3(номер, префикс):
+    шард = _шарды[номер]
+    return [
+        (позиция, фамилия, id_отдела)
+        for позиция, фамилия, id_отдела in zip(шард.позиции, шард.фамилии, шард.ids_отделов)
+        if фамилия.startswith(префикс)
+    ]
+
+
+class ПараллельныйИсполнитель:
+    """Выполнение запросов RK2 по шардам в пуле процессов
+
+    Сотрудники делятся на шарды по хешу id_отдела, поэтому все сотрудники
+    отдела попадают в один шард. Частичные результаты шардов объединяются
+    в координаторе, результат совпадает с функциями из queries.py.
+    """
+
+    def __init__(self, отделы, сотрудники, шардов=None, процессов=None):
+        процессов = процессов or os.cpu_count() or 1
+        шардов = шардов or процессов
+        self.отделы = list(отделы)
+        self.шарды = [_Шард() for _ in range(шардов)]
+        for позиция, с in enumerate(сотрудники):
+            шард = self.шарды[hash(с.id_отдела) % шардов]
+            шард.позиции.append(позиция)
+            шард.ids.append(с.id_сотрудника)
+            шард.фамилии.append(с.фамилия)
+            шард.зарплаты.append(с.зарплата)
+            шард.ids_отделов.append(с.id_отдела)
+        self._пул = ProcessPoolExecutor(
+            max_workers=процессов, initializer=_установить_шарды, initargs=(self.шарды,)
+        )
+
+    def close(self):
+        self._пул.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _по_шардам(self, функция, *аргументы):
+        задачи = [self._пул.submit(функция, номер, *аргументы) for номер in range(len(self.шарды))]
+        return [задача.result() for задача in задачи]
+
+    def запрос_1_отделы_со_словом_отдел(self):
+        отобранные = [отд for отд in self.отделы if "отдел" in отд.наименование.lower()]
+        ids_отделов = {отд.id_отдела for отд in отобранные}
+        по_отделам = {}
+        for часть in self._по_шардам(_шард_запрос_1, ids_отделов):
+            по_отделам.update(часть)
+        return [
+            {"отдел": отд.наименование, "сотрудники": по_отделам.get(отд.id_отдела, [])}
+            for отд in отобранные
+        ]
+
+    def запрос_2_средняя_зарплата_по_отделам(self):
+        итоги = {}
+        for часть in self._по_шардам(_шард_запрос_2):
+            итоги.update(часть)
+        результат = []
+        for отдел in self.отделы:
+            итог = итоги.get(отдел.id_отдела)
+            if итог is not None:
+                сумма, количество = итог
+                результат.append((отдел.наименование, round(сумма / количество, 2)))
+        результат.sort(key=lambda x: x[1], reverse=True)
+        return результат
+
+    def запрос_3_сотрудники_на_а(self, префикс="А"):
+        отделы_dict = {отд.id_отдела: отд.наименование for отд in self.отделы}
+        # Каждый шард упорядочен по позиции, слияние восстанавливает исходный порядок
+        найдено = heapq.merge(*self._по_шардам(_шард_запрос_3, префикс))
+        return [
+            {"фамилия": фамилия, "отдел": отделы_dict.get(id_отдела, "Неизвестный отдел")}
+            for _, фамилия, id_отдела in найдено
+        ]
@@ -1,34 +1,105 @@
-def запрос_1_отделы_со_словом_отдел(отделы, сотрудники):
-    отделы_с_словом = [отд for отд in отделы if "отдел" in отд.наименование.lower()]
-    результат = []
-    for отдел in отделы_с_словом:
-        сотрудники_в_отделе = [
-            сотр for сотр in сотрудники if сотр.id_отдела == отдел.id_отдела
-        ]
-        результат.append({
-            "отдел": отдел.наименование,
-            "сотрудники": [
-                {"фамилия": с.фамилия, "id": с.id_сотрудника, "зарплата": с.зарплата}
-                for с in сотрудники_в_отделе
-            ]
-        })
-    return результат
-
-def запрос_2_средняя_зарплата_по_отделам(отделы, сотрудники):
-    результат = []
-    for отдел in отделы:
-        зарплаты = [с.зарплата for с in сотрудники if с.id_отдела == отдел.id_отдела]
-        if зарплаты:
-            средняя = round(sum(зарплаты) / len(зарплаты), 2)
-            результат.append((отдел.наименование, средняя))
-    результат.sort(key=lambda x: x[1], reverse=True)
-    return результат
-
-def запрос_3_сотрудники_на_а(отделы, сотрудники):
-    сотрудники_а = [с for с in сотрудники if с.фамилия.startswith("А")]
-    отделы_dict = {отд.id_отдела: отд.наименование for отд in отделы}
-    результат = []
-    for с in сотрудники_а:
-        название_отдела = отделы_dict.get(с.id_отдела, "Неизвестный отдел")
-        результат.append({"фамилия": с.фамилия, "отдел": название_отдела})
-    return результат
\ No newline at end of file
+from aggregation import статистика_по_отделам
+from store import ИндексСвязей
+
+def сгруппировать_по_отделам(сотрудники):
+    # Один проход вместо повторного просмотра всех сотрудников для каждого отдела
+    по_отделам = {}
+    for с in сотрудники:
+        по_отделам.setdefault(с.id_отдела, []).append(с)
+    return по_отделам
+
+def _запрос_1(отделы, сотрудники_отдела, отфильтрованы=False):
+    результат = []
+    for отдел in отделы:
+        if отфильтрованы or "отдел" in отдел.наименование.lower():
+            результат.append({
+                "отдел": отдел.наименование,
+                "сотрудники": [
+                    {"фамилия": с.фамилия, "id": с.id_сотрудника, "зарплата": с.зарплата}
+                    for с in сотрудники_отдела(отдел.id_отдела)
+                ]
+            })
+    return результат
+
+def _запрос_2(отделы, сотрудники_отдела):
+    результат = []
+    for отдел in отделы:
+        зарплаты = [с.зарплата for с in сотрудники_отдела(отдел.id_отдела)]
+        if зарплаты:
+            средняя = round(sum(зарплаты) / len(зарплаты), 2)
+            результат.append((отдел.наименование, средняя))
+    результат.sort(key=lambda x: x[1], reverse=True)
+    return результат
+
+def _запрос_3(сотрудники, название_отдела):
+    результат = []
+    for с in сотрудники:
+        if с.фамилия.startswith("А"):
+            результат.append({"фамилия": с.фамилия, "отдел": название_отдела(с.id_отдела)})
+    return результат
+
+def запрос_1_отделы_со_словом_отдел(отделы, сотрудники):
+    по_отделам = сгруппировать_по_отделам(сотрудники)
+    return _запрос_1(отделы, lambda id_отдела: по_отделам.get(id_отдела, ()))
+
+def _запрос_2_по_статистике(отделы, статистика):
+    результат = []
+    for отдел in отделы:
+        ст = статистика.get(отдел.id_отдела)
+        if ст is not None:
+            результат.append((отдел.наименование, round(ст.среднее, 2)))
+    результат.sort(key=lambda x: x[1], reverse=True)
+    return результат
+
+def запрос_2_средняя_зарплата_по_отделам(отделы, сотрудники):
+    return _запрос_2_по_статистике(отделы, статистика_по_отделам(сотрудники, полная=False))
+
+def запрос_3_сотрудники_на_а(отделы, сотрудники):
+    отделы_dict = {отд.id_отдела: отд.наименование for отд in отделы}
+    return _запрос_3(сотрудники, lambda id_отдела: отделы_dict.get(id_отдела, "Неизвестный отдел"))
+
+# Те же запросы поверх индексированного хранилища (store.Хранилище)
+
+def запрос_1_по_хранилищу(хранилище, слово="отдел"):
+    # Отделы отбираются по триграммному индексу наименований
+    return _запрос_1(хранилище.найти_отделы(слово), хранилище.сотрудники_отдела, отфильтрованы=True)
+
+def запрос_2_по_хранилищу(хранилище):
+    статистика = статистика_по_отделам(хранилище.сотрудники.values(), полная=False)
+    return _запрос_2_по_статистике(хранилище.отделы.values(), статистика)
+
+def запрос_3_по_хранилищу(хранилище, префикс="А", без_регистра=False):
+    # Поиск по индексу фамилий вместо просмотра всех сотрудников
+    return [
+        {"фамилия": с.фамилия, "отдел": хранилище.название_отдела(с.id_отдела)}
+        for с in хранилище.найти_по_фамилии(префикс, без_регистра)
+    ]
+
+# Запросы для связи многие-ко-многим через СотрудникиОтдела (store.ИндексСвязей)
+
+def _индекс_связей(связи):
+    return связи if isinstance(связи, ИндексСвязей) else ИндексСвязей(связи)
+
+def запрос_1_многие_ко_многим(отделы, сотрудники, связи):
+    индекс = _индекс_связей(связи)
+    по_id = {с.id_сотрудника: с for с in сотрудники}
+    return _запрос_1(отделы, lambda id_отдела: [
+        по_id[i] for i in индекс.сотрудники(id_отдела) if i in по_id
+    ])
+
+def запрос_2_многие_ко_многим(отделы, сотрудники, связи):
+    индекс = _индекс_связей(связи)
+    по_id = {с.id_сотрудника: с for с in сотрудники}
+    return _запрос_2(отделы, lambda id_отдела: [
+        по_id[i] for i in индекс.сотрудники(id_отдела) if i in по_id
+    ])
+
+def запрос_3_многие_ко_многим(отделы, сотрудники, связи):
+    индекс = _индекс_связей(связи)
+    отделы_dict = {отд.id_отдела: отд.наименование for отд in отделы}
+    результат = []
+    for с in сотрудники:
+        if с.фамилия.startswith("А"):
+            for id_отдела in индекс.отделы(с.id_сотрудника):
+                результат.append({"фамилия": с.фамилия, "отдел": отделы_dict.get(id_отдела, "Неизвестный отдел")})
+    return результат
@@ -0,0 +1,768 @@
+from collections import Counter, defaultdict
+from itertools import compress
+from operator import attrgetter, itemgetter
+
+from models import СотрудникиОтдела
+
+ОПЕРАТОРЫ = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "начинается": lambda a, b: a.startswith(b),
+    "содержит": lambda a, b: b.casefold() in a.casefold(),  # без учета регистра
+}
+
+# Агрегаты над списком значений группы. Сумма - sum() по значениям в порядке
+# строк, как в запросе 2 из queries.py (в Python 3.12+ sum() компенсирует ошибки
+# округления, поэтому накопление по одному значению дало бы другой результат)
+АГРЕГАТЫ = {
+    "количество": len,
+    "сумма": sum,
+    "среднее": lambda значения: sum(значения) / len(значения) if значения else None,
+    "минимум": lambda значения: min(значения) if значения else None,
+    "максимум": lambda значения: max(значения) if значения else None,
+    "список": lambda значения: значения,
+}
+
+# Поля, по которым у таблиц есть индексы
+ИНДЕКСИРОВАННЫЕ = {
+    "отделы": {"id_отдела"},
+    "сотрудники": {"id_сотрудника", "id_отдела"},
+    "связи": {"id_сотрудника", "id_отдела"},
+}
+
+# Индексы, в которых ключу соответствует не больше одного объекта
+УНИКАЛЬНЫЕ = {("отделы", "id_отдела"), ("сотрудники", "id_сотрудника")}
+
+# Агрегаты, которые можно накапливать за один проход без списков значений
+ПОТОКОВЫЕ = {"количество", "сумма", "среднее", "минимум", "максимум"}
+
+
+def _поле(выражение):
+    псевдоним, поле = выражение.split(".", 1)
+    return псевдоним, поле
+
+
+def _скомпилировать(выражение):
+    """Функция строка -> значение для "псевдоним.поле", имени столбца или функции
+
+    Пара (выражение, значение) дает значение, если выражение равно None (как COALESCE).
+    """
+    if callable(выражение):
+        return выражение
+    if isinstance(выражение, tuple):
+        получить, по_умолчанию = _скомпилировать(выражение[0]), выражение[1]
+
+        def с_умолчанием(строка):
+            значение = получить(строка)
+            return по_умолчанию if значение is None else значение
+        return с_умолчанием
+    if "." in выражение:
+        псевдоним, поле = _поле(выражение)
+        получить = attrgetter(поле)
+
+        def значение(строка):
+            объект = строка.get(псевдоним)
+            return None if объект is None else получить(объект)
+        return значение
+    return itemgetter(выражение)
+
+
+class _Фильтр:
+    __slots__ = ("псевдоним", "поле", "оператор", "значение")
+
+    def __init__(self, псевдоним, поле, оператор, значение):
+        self.псевдоним = псевдоним
+        self.поле = поле
+        self.оператор = оператор
+        self.значение = значение
+
+    def __str__(self):
+        return f"{self.псевдоним}.{self.поле} {self.оператор} {self.значение!r}"
+
+
+class _Соединение:
+    __slots__ = ("таблица", "псевдоним", "левое_выражение", "правое_поле", "левое")
+
+    def __init__(self, таблица, псевдоним, левое_выражение, правое_поле, левое):
+        self.таблица = таблица
+        self.псевдоним = псевдоним
+        self.левое_выражение = левое_выражение
+        self.правое_поле = правое_поле
+        self.левое = левое
+
+
+class Запрос:
+    """Построитель запросов над Хранилищем и ИндексомСвязей
+
+    Запрос(хранилище).из_("отделы", "о").где("о.наименование", "содержит", "отдел")
+        .соединить("сотрудники", "с", "о.id_отдела", "с.id_отдела")
+        .сгруппировать("о.id_отдела", средняя=("среднее", "с.зарплата"))
+        .выбрать(отдел="о.наименование", средняя="средняя")
+        .упорядочить("средняя", по_убыванию=True).ограничить(10)
+
+    Каждый метод возвращает новый Запрос. Планировщик опускает фильтры под
+    внутренние соединения (фильтры правой таблицы левого соединения
+    проверяются после него, как WHERE в SQL), выбирает индексы хранилища
+    (id, триграммы наименований, префиксы фамилий) и, если группировка идет
+    по левой таблице соединения через индекс, считает агрегаты без
+    построения промежуточных строк: по группе индекса для каждого ключа
+    или, если источник просматривается целиком, одним проходом по правой
+    таблице. Запрос без группировки, все соединения которого идут по
+    уникальному ключу, выполняется по столбцам: каждый шаг - один проход
+    map по списку объектов, а словари строк строятся только в конце.
+    Метод план() описывает выбранный способ выполнения.
+    """
+
+    def __init__(self, хранилище, связи=None):
+        self._хранилище = хранилище
+        self._связи = связи
+        self._источник = None
+        self._фильтры = ()
+        self._соединения = ()
+        self._группировка = None
+        self._выбор = None
+        self._порядок = ()
+        self._предел = None
+
+    def _копия(self, **изменения):
+        новый = Запрос.__new__(Запрос)
+        новый.__dict__.update(self.__dict__)
+        новый.__dict__.update(изменения)
+        return новый
+
+    def из_(self, таблица, псевдоним):
+        self._таблица(таблица)
+        return self._копия(_источник=(таблица, псевдоним))
+
+    def где(self, поле, оператор, значение):
+        if оператор not in ОПЕРАТОРЫ:
+            raise ValueError(f"Неизвестный оператор: {оператор}")
+        псевдоним, имя = _поле(поле)
+        return self._копия(_фильтры=self._фильтры + (_Фильтр(псевдоним, имя, оператор, значение),))
+
+    def соединить(self, таблица, псевдоним, левое_выражение, правое_поле, левое=False):
+        self._таблица(таблица)
+        правый_псевдоним, поле = _поле(правое_поле)
+        if правый_псевдоним != псевдоним:
+            raise ValueError(f"Правое поле {правое_поле} должно относиться к {псевдоним}")
+        соединение = _Соединение(таблица, псевдоним, левое_выражение, поле, левое)
+        return self._копия(_соединения=self._соединения + (соединение,))
+
+    def сгруппировать(self, *ключи, **агрегаты):
+        for функция, _ in агрегаты.values():
+            if функция not in АГРЕГАТЫ:
+                raise ValueError(f"Неизвестный агрегат: {функция}")
+        return self._копия(_группировка=(ключи, агрегаты))
+
+    def выбрать(self, **столбцы):
+        return self._копия(_выбор=столбцы)
+
+    def упорядочить(self, выражение, по_убыванию=False):
+        return self._копия(_порядок=self._порядок + ((выражение, по_убыванию),))
+
+    def ограничить(self, количество):
+        return self._копия(_предел=количество)
+
+    def _таблица(self, таблица):
+        if таблица not in ИНДЕКСИРОВАННЫЕ:
+            raise ValueError(f"Неизвестная таблица: {таблица}")
+        if таблица == "связи" and self._связи is None:
+            raise ValueError("Для таблицы связи нужен ИндексСвязей")
+
+    # Планирование
+
+    def _фильтры_для(self, псевдоним):
+        return [ф for ф in self._фильтры if ф.псевдоним == псевдоним]
+
+    def _все_строки(self, таблица):
+        х = self._хранилище
+        if таблица == "отделы":
+            return х.отделы.values()
+        if таблица == "сотрудники":
+            return х.сотрудники.values()
+        return (
+            СотрудникиОтдела(id_сотрудника, id_отдела)
+            for id_отдела, ids in self._связи.сотрудники_отдела.items()
+            for id_сотрудника in ids
+        )
+
+    def _по_индексу(self, таблица, поле, значение):
+        """Объекты таблицы с поле == значение через хеш-индекс"""
+        х = self._хранилище
+        if таблица == "отделы":
+            отдел = х.отделы.get(значение)
+            return () if отдел is None else (отдел,)
+        if таблица == "сотрудники":
+            if поле == "id_сотрудника":
+                сотрудник = х.сотрудники.get(значение)
+                return () if сотрудник is None else (сотрудник,)
+            return х.сотрудники_отдела(значение)
+        if поле == "id_отдела":
+            return [СотрудникиОтдела(i, значение) for i in self._связи.сотрудники(значение)]
+        return [СотрудникиОтдела(значение, i) for i in self._связи.отделы(значение)]
+
+    def _выбрать_индекс(self, таблица, фильтры):
+        """(описание, функция без аргументов -> объекты, оставшиеся фильтры) или None"""
+        for ф in фильтры:
+            if ф.оператор == "==" and ф.поле in ИНДЕКСИРОВАННЫЕ[таблица]:
+                return (f"хеш-индекс {ф}", lambda ф=ф: self._по_индексу(таблица, ф.поле, ф.значение),
+                        [д for д in фильтры if д is not ф])
+        for ф in фильтры:
+            if таблица == "сотрудники" and ф.поле == "фамилия" and ф.оператор == "начинается":
+                return (f"префиксный индекс {ф}",
+                        lambda ф=ф: self._хранилище.найти_по_фамилии(ф.значение),
+                        [д for д in фильтры if д is not ф])
+            if таблица == "отделы" and ф.поле == "наименование" and ф.оператор == "содержит":
+                return (f"триграммный индекс {ф}",
+                        lambda ф=ф: self._хранилище.найти_отделы(ф.значение),
+                        [д for д in фильтры if д is not ф])
+        return None
+
+    def _доступ(self, таблица, псевдоним, фильтры):
+        выбор = self._выбрать_индекс(таблица, фильтры)
+        if выбор is None:
+            описание, объекты, остальные = "полный просмотр", lambda: self._все_строки(таблица), фильтры
+        else:
+            описание, объекты, остальные = выбор
+        if остальные:
+            описание += ", фильтр " + " и ".join(map(str, остальные))
+        проверка = _проверка(остальные)
+        return f"{таблица} {псевдоним}: {описание}", объекты, проверка, выбор is not None
+
+    def _фильтры_соединения(self, соединение):
+        """(фильтры, опускаемые под соединение, фильтры после него)"""
+        фильтры = self._фильтры_для(соединение.псевдоним)
+        if соединение.левое:
+            # Под левое соединение фильтр опускать нельзя: он стал бы условием ON
+            # и вместо отбрасывания строки дополнял бы ее None
+            return [], фильтры
+        return фильтры, []
+
+    def _спланировать(self):
+        """(план, функция предел -> строки после выбора столбцов, до сортировки)"""
+        if self._источник is None:
+            raise ValueError("Не задан источник: вызовите из_()")
+        таблица, псевдоним = self._источник
+        псевдонимы = {псевдоним} | {с.псевдоним for с in self._соединения}
+        for ф in self._фильтры:
+            if ф.псевдоним not in псевдонимы:
+                raise ValueError(f"Неизвестный псевдоним в фильтре: {ф}")
+
+        план = []
+        описание, объекты, проверка, есть_индекс = self._доступ(таблица, псевдоним, self._фильтры_для(псевдоним))
+        план.append(описание)
+
+        if self._можно_по_столбцам():
+            строки = self._спланировать_по_столбцам(план, объекты, проверка)
+            self._описать_выбор(план)
+            return план, строки
+
+        def строки_источника():
+            if проверка is _всегда:
+                return ({псевдоним: объект} for объект in объекты())
+            return ({псевдоним: объект} for объект in объекты() if проверка(объект))
+
+        этапы = []
+        for соединение in self._соединения:
+            этап, описание = self._спланировать_соединение(соединение)
+            этапы.append(этап)
+            план.append(описание)
+
+        группировка = self._группировка
+        if группировка is not None and self._можно_соединение_с_группировкой():
+            # Последнее соединение идет по индексу: агрегируем прямо по найденным объектам
+            соединение = self._соединения[-1]
+            предагрегация = not есть_индекс and self._можно_предагрегировать()
+            if предагрегация:
+                план[-1] += f" + группировка одним проходом по {соединение.таблица}"
+            else:
+                план[-1] += " + группировка по индексу"
+            предыдущие = этапы[:-1]
+
+            def поток_строк():
+                поток = строки_источника()
+                for этап in предыдущие:
+                    поток = этап(поток)
+                return self._группировка_по_индексу(поток, соединение, предагрегация)
+        else:
+            def поток_строк():
+                поток = строки_источника()
+                for этап in этапы:
+                    поток = этап(поток)
+                if группировка is not None:
+                    поток = _сгруппировать(поток, *группировка)
+                return поток
+            if группировка is not None:
+                план.append("группировка хешированием")
+
+        def строки(предел):
+            поток = поток_строк()
+            if self._выбор is not None:
+                столбцы = [(имя, _скомпилировать(в)) for имя, в in self._выбор.items()]
+                поток = ({имя: получить(строка) for имя, получить in столбцы} for строка in поток)
+            if предел is not None:
+                результат = []
+                for строка in поток:
+                    if len(результат) >= предел:
+                        break
+                    результат.append(строка)
+                return результат
+            return list(поток)
+
+        self._описать_выбор(план)
+        return план, строки
+
+    def _описать_выбор(self, план):
+        if self._выбор is not None:
+            план.append("выбор " + ", ".join(self._выбор))
+        if self._порядок:
+            план.append("сортировка " + ", ".join(
+                f"{в if isinstance(в, str) else 'функция'}{' по убыванию' if у else ''}" for в, у in self._порядок
+            ))
+        if self._предел is not None:
+            план.append(f"ограничение {self._предел}")
+
+    def _словарь(self, таблица):
+        return self._хранилище.отделы if таблица == "отделы" else self._хранилище.сотрудники
+
+    def _спланировать_соединение(self, соединение):
+        таблица, псевдоним = соединение.таблица, соединение.псевдоним
+        ключ_слева = _скомпилировать(соединение.левое_выражение)
+        опускаемые, после = self._фильтры_соединения(соединение)
+        описание, объекты, проверка, есть_индекс = self._доступ(таблица, псевдоним, опускаемые)
+        левое = соединение.левое
+
+        if соединение.правое_поле in ИНДЕКСИРОВАННЫЕ[таблица] and not есть_индекс:
+            # Поиск по индексу для каждой левой строки
+            поле = соединение.правое_поле
+            if (таблица, поле) in УНИКАЛЬНЫЕ:
+                # Не больше одной пары: строку можно дополнить на месте, без копии
+                словарь = self._словарь(таблица)
+
+                def этап(поток):
+                    for строка in поток:
+                        объект = словарь.get(ключ_слева(строка))
+                        if объект is not None and not проверка(объект):
+                            объект = None
+                        if объект is not None or левое:
+                            строка[псевдоним] = объект
+                            yield строка
+            else:
+                def этап(поток):
+                    for строка in поток:
+                        найдено = False
+                        for объект in self._по_индексу(таблица, поле, ключ_слева(строка)):
+                            if проверка(объект):
+                                найдено = True
+                                yield {**строка, псевдоним: объект}
+                        if левое and not найдено:
+                            yield {**строка, псевдоним: None}
+            вид = "левое соединение" if левое else "соединение"
+            описание = f"{вид} {таблица} {псевдоним}: хеш-индекс {псевдоним}.{поле}" + (
+                описание[описание.index(", фильтр"):] if ", фильтр" in описание else "")
+        else:
+            # Хеш-соединение по отфильтрованной (возможно, по индексу) правой таблице
+            ключ_справа = attrgetter(соединение.правое_поле)
+
+            def этап(поток):
+                таблица_хеша = {}
+                for объект in объекты():
+                    if проверка(объект):
+                        таблица_хеша.setdefault(ключ_справа(объект), []).append(объект)
+                for строка in поток:
+                    пара = таблица_хеша.get(ключ_слева(строка))
+                    if пара:
+                        for объект in пара:
+                            yield {**строка, псевдоним: объект}
+                    elif левое:
+                        yield {**строка, псевдоним: None}
+            вид = "левое хеш-соединение" if левое else "хеш-соединение"
+            описание = f"{вид} с {описание}"
+
+        if not после:
+            return этап, описание
+        # Фильтр после левого соединения: строка без пары (None) его не проходит
+        проверка_после = _проверка(после)
+
+        def этап_с_фильтром(поток):
+            for строка in этап(поток):
+                объект = строка[псевдоним]
+                if объект is not None and проверка_после(объект):
+                    yield строка
+        return этап_с_фильтром, описание + ", затем фильтр " + " и ".join(map(str, после))
+
+    # Выполнение по столбцам
+
+    def _можно_по_столбцам(self):
+        if self._группировка is not None:
+            return False
+        for соединение in self._соединения:
+            if (соединение.таблица, соединение.правое_поле) not in УНИКАЛЬНЫЕ:
+                return False
+            if callable(соединение.левое_выражение) or "." not in соединение.левое_выражение:
+                return False
+        return True
+
+    def _спланировать_по_столбцам(self, план, объекты, проверка):
+        шаги = []
+        for соединение in self._соединения:
+            таблица, псевдоним = соединение.таблица, соединение.псевдоним
+            фильтры = self._фильтры_для(псевдоним)
+            # Без пары строка остается только у левого соединения без фильтров справа;
+            # фильтры проверяются после поиска пары, так что для левого соединения это WHERE
+            оставить_пустые = соединение.левое and not фильтры
+            шаги.append((псевдоним, _поле(соединение.левое_выражение), self._словарь(таблица),
+                         _проверка(фильтры) if фильтры else None, оставить_пустые))
+            вид = "левое соединение" if соединение.левое else "соединение"
+            описание = f"{вид} {таблица} {псевдоним}: хеш-индекс {псевдоним}.{соединение.правое_поле}"
+            if фильтры:
+                описание += (", затем фильтр " if соединение.левое else ", фильтр ") + " и ".join(map(str, фильтры))
+            план.append(описание)
+        план.append("выполнение по столбцам")
+        источник = self._источник[1]
+        фильтры_источника = None if проверка is _всегда else проверка
+
+        def строки(предел):
+            объекты_источника = объекты()
+            if фильтры_источника is not None:
+                объекты_источника = filter(фильтры_источника, объекты_источника)
+            if not isinstance(объекты_источника, list):
+                # Готовый список из индекса не копируется: столбцы только читаются
+                объекты_источника = list(объекты_источника)
+            столбцы = {источник: объекты_источника}
+            # Псевдонимы, в столбцах которых бывает None (строки левого соединения без пары)
+            пустые = set()
+            for псевдоним, левое, словарь, проверка_справа, оставить_пустые in шаги:
+                найденные = list(map(словарь.get, _значения_поля(левое, столбцы, пустые)))
+                if проверка_справа is not None:
+                    найденные = [о if о is not None and проверка_справа(о) else None for о in найденные]
+                столбцы[псевдоним] = найденные
+                if None in найденные:
+                    if оставить_пустые:
+                        пустые.add(псевдоним)
+                    else:
+                        оставить = [о is not None for о in найденные]
+                        столбцы = {п: list(compress(столбец, оставить)) for п, столбец in столбцы.items()}
+            if предел is not None:
+                столбцы = {п: столбец[:предел] for п, столбец in столбцы.items()}
+            return self._проекция(столбцы, пустые)
+        return строки
+
+    def _проекция(self, столбцы, пустые):
+        """Словари строк из столбцов объектов: значения выбора считаются по столбцу за раз"""
+        псевдонимы = list(столбцы)
+        if self._выбор is None:
+            return _словари(псевдонимы, list(столбцы.values()))
+        значения = []
+        строки_объектов = None
+        for выражение in self._выбор.values():
+            столбец = _столбец(выражение, столбцы, пустые)
+            if столбец is None:
+                # Функции и имена столбцов получают строку {псевдоним: объект}
+                if строки_объектов is None:
+                    строки_объектов = _словари(псевдонимы, list(столбцы.values()))
+                столбец = map(_скомпилировать(выражение), строки_объектов)
+            значения.append(столбец)
+        return _словари(list(self._выбор), значения)
+
+    # Группировка через индекс
+
+    def _можно_соединение_с_группировкой(self):
+        if not self._соединения:
+            return False
+        соединение = self._соединения[-1]
+        if соединение.правое_поле not in ИНДЕКСИРОВАННЫЕ[соединение.таблица]:
+            return False
+        if self._выбрать_индекс(соединение.таблица, self._фильтры_соединения(соединение)[0]) is not None:
+            return False
+        ключи, агрегаты = self._группировка
+        левые = {с.псевдоним for с in self._соединения[:-1]} | {self._источник[1]}
+        if not all(isinstance(к, str) and "." in к and _поле(к)[0] in левые for к in ключи):
+            return False
+        # Ключи группировки однозначно задают левую строку, если в них есть ключ соединения
+        if соединение.левое_выражение not in ключи:
+            return False
+        return all(
+            callable(выражение) or выражение == соединение.псевдоним
+            or "." in выражение and _поле(выражение)[0] == соединение.псевдоним
+            for _, выражение in агрегаты.values()
+        )
+
+    def _можно_предагрегировать(self):
+        # Источник просматривается целиком, так что ключи соединения покроют почти
+        # всю правую таблицу: один последовательный проход по ней дешевле, чем
+        # обход группы индекса для каждого ключа
+        _, агрегаты = self._группировка
+        псевдоним = self._соединения[-1].псевдоним
+        return bool(агрегаты) and all(
+            функция in ПОТОКОВЫЕ and isinstance(выражение, str)
+            and (выражение == псевдоним and функция == "количество" or "." in выражение)
+            for функция, выражение in агрегаты.values()
+        )
+
+    def _размеры_групп(self, таблица, поле):
+        """ключ -> число объектов по готовому индексу или None"""
+        if таблица == "сотрудники" and поле == "id_отдела":
+            return {ключ: len(группа) for ключ, группа in self._хранилище.сотрудники_по_отделам.items()}
+        if таблица == "связи":
+            группы = self._связи.сотрудники_отдела if поле == "id_отдела" else self._связи.отделы_сотрудника
+            return {ключ: len(группа) for ключ, группа in группы.items() if группа}
+        return None
+
+    def _предагрегаты(self, соединение, проверка):
+        """имя агрегата -> {ключ соединения: значение} за проход по правой таблице
+
+        Объекты обходятся в порядке таблицы - в том же порядке, что и в группах
+        индекса, поэтому sum() получает те же списки и суммы совпадают с построчными.
+        """
+        _, агрегаты = self._группировка
+        ключ = attrgetter(соединение.правое_поле)
+        объекты = self._все_строки(соединение.таблица)
+        if проверка is not None or соединение.таблица == "связи":
+            объекты = [о for о in объекты if проверка is None or проверка(о)]
+        количества = None
+        суммы = {}
+        итоги = {}
+        for имя, (функция, выражение) in агрегаты.items():
+            if функция in ("количество", "среднее") and количества is None:
+                if проверка is None:
+                    количества = self._размеры_групп(соединение.таблица, соединение.правое_поле)
+                if количества is None:
+                    количества = Counter(map(ключ, объекты))
+            if функция == "количество":
+                итоги[имя] = количества
+                continue
+            поле = attrgetter(_поле(выражение)[1])
+            if функция in ("сумма", "среднее"):
+                if выражение not in суммы:
+                    значения = defaultdict(list)
+                    for к, значение in zip(map(ключ, объекты), map(поле, объекты)):
+                        значения[к].append(значение)
+                    суммы[выражение] = {к: sum(список) for к, список in значения.items()}
+                if функция == "сумма":
+                    итоги[имя] = суммы[выражение]
+                else:
+                    итоги[имя] = {к: сумма / количества[к] for к, сумма in суммы[выражение].items()}
+            else:
+                лучше = (lambda a, b: a < b) if функция == "минимум" else (lambda a, b: a > b)
+                крайние = {}
+                for объект in объекты:
+                    к, значение = ключ(объект), поле(объект)
+                    текущее = крайние.get(к)
+                    if текущее is None or лучше(значение, текущее):
+                        крайние[к] = значение
+                итоги[имя] = крайние
+        return итоги
+
+    def _группировка_по_индексу(self, поток, соединение, предагрегация=False):
+        ключи, агрегаты = self._группировка
+        таблица, псевдоним = соединение.таблица, соединение.псевдоним
+        ключ_слева = _скомпилировать(соединение.левое_выражение)
+        проверка = self._проверка_или_нет(псевдоним)
+        получить_ключи = [(к, _скомпилировать(к)) for к in ключи]
+        # С фильтрами справа строки без пары отбрасываются и у левого соединения (WHERE)
+        пустые = соединение.левое and проверка is None
+
+        if предагрегация:
+            итоги = list(self._предагрегаты(соединение, проверка).items())
+            пустые_итоги = {имя: АГРЕГАТЫ[функция]([]) for имя, (функция, _) in агрегаты.items()}
+            есть = итоги[0][1]
+            имена_ключей = [имя for имя, _ in получить_ключи]
+            функции_ключей = [получить for _, получить in получить_ключи]
+            увиденные = set()
+            for строка in поток:
+                значения_ключей = [получить(строка) for получить in функции_ключей]
+                ключ = tuple(значения_ключей)
+                if ключ in увиденные:
+                    continue
+                увиденные.add(ключ)
+                значение_ключа = ключ_слева(строка)
+                if значение_ключа not in есть and not пустые:
+                    continue
+                результат = dict(строка)
+                результат.update(zip(имена_ключей, значения_ключей))
+                if значение_ключа in есть:
+                    for имя, значения in итоги:
+                        результат[имя] = значения[значение_ключа]
+                else:
+                    результат.update(пустые_итоги)
+                yield результат
+            return
+
+        вычисления = []
+        for имя, (функция, выражение) in агрегаты.items():
+            if callable(выражение):
+                значения = (lambda в: lambda строка, объекты: [в({**строка, псевдоним: о}) for о in объекты])(выражение)
+            elif выражение == псевдоним:
+                значения = lambda строка, объекты: объекты
+            else:
+                поле = attrgetter(_поле(выражение)[1])
+                значения = (lambda п: lambda строка, объекты: list(map(п, объекты)))(поле)
+            вычисления.append((имя, АГРЕГАТЫ[функция], значения))
+
+        увиденные = set()
+        for строка in поток:
+            ключ = tuple(получить(строка) for _, получить in получить_ключи)
+            if ключ in увиденные:
+                continue
+            увиденные.add(ключ)
+            объекты = self._по_индексу(таблица, соединение.правое_поле, ключ_слева(строка))
+            объекты = list(объекты) if проверка is None else [о for о in объекты if проверка(о)]
+            if not объекты and not пустые:
+                continue
+            результат = dict(строка)
+            результат.update((имя, получить(строка)) for имя, получить in получить_ключи)
+            for имя, итог, значения in вычисления:
+                результат[имя] = итог(значения(строка, объекты))
+            yield результат
+
+    def _проверка_или_нет(self, псевдоним):
+        фильтры = self._фильтры_для(псевдоним)
+        return _проверка(фильтры) if фильтры else None
+
+    # Выполнение
+
+    def план(self):
+        return self._спланировать()[0]
+
+    def выполнить(self):
+        _, строки = self._спланировать()
+        if not self._порядок:
+            return строки(self._предел)
+        результат = строки(None)
+        # Устойчивая сортировка с последнего ключа к первому
+        for выражение, по_убыванию in reversed(self._порядок):
+            результат.sort(key=_скомпилировать(выражение), reverse=по_убыванию)
+        if self._предел is not None:
+            del результат[self._предел:]
+        return результат
+
+    def __iter__(self):
+        return iter(self.выполнить())
+
+
+def _всегда(объект):
+    return True
+
+
+def _проверка(фильтры):
+    if not фильтры:
+        return _всегда
+    условия = [(attrgetter(ф.поле), ОПЕРАТОРЫ[ф.оператор], ф.значение) for ф in фильтры]
+    return lambda объект: all(оператор(получить(объект), значение) for получить, оператор, значение in условия)
+
+
+def _значения_поля(поле, столбцы, пустые):
+    """Итератор значений поля (псевдоним, имя) по строкам; у пустых объектов - None"""
+    псевдоним, имя = поле
+    объекты, получить = столбцы[псевдоним], attrgetter(имя)
+    # Проверка None in читает каждый объект, поэтому делается только для столбцов с пропусками
+    if псевдоним in пустые:
+        return (None if объект is None else получить(объект) for объект in объекты)
+    return map(получить, объекты)
+
+
+def _столбец(выражение, столбцы, пустые):
+    """Значения выражения по столбцам объектов или None, если нужна строка целиком"""
+    if isinstance(выражение, tuple):
+        основа, по_умолчанию = выражение
+        столбец = _столбец(основа, столбцы, пустые)
+        if столбец is None:
+            return None
+        return (по_умолчанию if значение is None else значение for значение in столбец)
+    if callable(выражение) or "." not in выражение:
+        return None
+    поле = _поле(выражение)
+    if поле[0] not in столбцы:
+        return None
+    return _значения_поля(поле, столбцы, пустые)
+
+
+def _словари(имена, столбцы):
+    """Словари {имя: значение} по строкам столбцов"""
+    if not имена:
+        return []
+    return list(map(_конструктор_строки(tuple(имена)), *столбцы))
+
+
+def _конструктор_строки(имена):
+    """Функция (значение_1, ..., значение_n) -> {имя_1: значение_1, ...}
+
+    Словарь пишется литералом: так строка собирается вдвое быстрее, чем
+    dict(zip(...)). Имена попадают в функцию как значения по умолчанию,
+    в исходный текст подставляются только номера.
+    """
+    номера = range(len(имена))
+    исходник = "def строка({}, *, {}):\n    return {{{}}}\n".format(
+        ", ".join(f"з{i}" for i in номера),
+        ", ".join(f"и{i}=и{i}" for i in номера),
+        ", ".join(f"и{i}: з{i}" for i in номера),
+    )
+    пространство = {f"и{i}": имя for i, имя in zip(номера, имена)}
+    exec(исходник, пространство)
+    return пространство["строка"]
+
+
+def _сгруппировать(поток, ключи, агрегаты):
+    получить_ключи = [(к, _скомпилировать(к)) for к in ключи]
+    вычисления = [(имя, АГРЕГАТЫ[ф], _скомпилировать(в)) for имя, (ф, в) in агрегаты.items()]
+    группы = {}
+    for строка in поток:
+        ключ = tuple(получить(строка) for _, получить in получить_ключи)
+        группа = группы.get(ключ)
+        if группа is None:
+            группа = группы[ключ] = (строка, [[] for _ in вычисления])
+        for значения, (_, _, значение) in zip(группа[1], вычисления):
+            # Как в SQL, пустые значения (None после левого соединения) не агрегируются
+            х = значение(строка)
+            if х is not None:
+                значения.append(х)
+    for ключ, (строка, значения) in группы.items():
+        результат = dict(строка)
+        результат.update((имя, значение) for (имя, _), значение in zip(получить_ключи, ключ))
+        for (имя, итог, _), список in zip(вычисления, значения):
+            результат[имя] = итог(список)
+        yield результат
+
+
+# Запросы 1-3 через построитель
+
+def запрос_1_построитель(хранилище, слово="отдел"):
+    return (
+        Запрос(хранилище)
+        .из_("отделы", "о").где("о.наименование", "содержит", слово)
+        .соединить("сотрудники", "с", "о.id_отдела", "с.id_отдела", левое=True)
+        .сгруппировать("о.id_отдела", сотрудники=("список", "с"))
+        .выбрать(отдел="о.наименование", сотрудники=lambda строка: [
+            {"фамилия": с.фамилия, "id": с.id_сотрудника, "зарплата": с.зарплата}
+            for с in строка["сотрудники"]
+        ])
+        .выполнить()
+    )
+
+
+def запрос_2_построитель(хранилище):
+    return [
+        (строка["отдел"], строка["средняя"])
+        for строка in Запрос(хранилище)
+        .из_("отделы", "о")
+        .соединить("сотрудники", "с", "о.id_отдела", "с.id_отдела")
+        .сгруппировать("о.id_отдела", средняя=("среднее", "с.зарплата"))
+        .выбрать(отдел="о.наименование", средняя=lambda строка: round(строка["средняя"], 2))
+        .упорядочить("средняя", по_убыванию=True)
+        .выполнить()
+    ]
+
+
+def запрос_3_построитель(хранилище, префикс="А"):
+    return (
+        Запрос(хранилище)
+        .из_("сотрудники", "с").где("с.фамилия", "начинается", префикс)
+        .соединить("отделы", "о", "с.id_отдела", "о.id_отдела", левое=True)
+        .выбрать(фамилия="с.фамилия", отдел=("о.наименование", "Неизвестный отдел"))
+        .выполнить()
+    )
@@ -0,0 +1,198 @@
+import threading
+
+from queries import запрос_1_отделы_со_словом_отдел, запрос_2_средняя_зарплата_по_отделам, запрос_3_сотрудники_на_а
+
+# Размер куска вектора сотрудников и число корзин словаря позиций:
+# запись копирует один кусок/корзину и оглавление, а не все данные
+РАЗМЕР_КУСКА = 1024
+КОРЗИН = 1024
+
+
+class Снимок:
+    """Неизменяемая версия данных: отделы и сотрудники в порядке добавления
+
+    Сотрудники лежат в кусках-кортежах по РАЗМЕР_КУСКА, удаленные заменены
+    на None. Соседние версии разделяют все куски, кроме измененных.
+    """
+    __slots__ = ("версия", "отделы", "куски", "позиции", "длина", "удалено")
+
+    def __init__(self, версия, отделы, куски, позиции, длина, удалено):
+        self.версия = версия
+        self.отделы = отделы  # кортеж Отдел
+        self.куски = куски  # кортеж кортежей Сотрудник или None
+        self.позиции = позиции  # кортеж КОРЗИН словарей id_сотрудника -> позиция
+        self.длина = длина
+        self.удалено = удалено
+
+    def __len__(self):
+        return self.длина - self.удалено
+
+    def сотрудники(self):
+        for кусок in self.куски:
+            for с in кусок:
+                if с is not None:
+                    yield с
+
+    def сотрудник(self, id_сотрудника):
+        позиция = self.позиции[hash(id_сотрудника) % КОРЗИН].get(id_сотрудника)
+        if позиция is None:
+            return None
+        return self.куски[позиция // РАЗМЕР_КУСКА][позиция % РАЗМЕР_КУСКА]
+
+    def запрос_1(self):
+        return запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники())
+
+    def запрос_2(self):
+        return запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники())
+
+    def запрос_3(self):
+        return запрос_3_сотрудники_на_а(self.отделы, self.сотрудники())
+
+
+class ХранилищеСнимков:
+    """Хранилище с изоляцией снимков для одновременных чтений и записей
+
+    Читатели берут снимок() - одно чтение атрибута без блокировок - и
+    выполняют запросы над ним, не видя чужих изменений. Писатели по очереди
+    (под блокировкой) строят новую версию из старой, копируя только
+    затронутые куски, и публикуют ее присваиванием. Запись не ждет
+    читателей, а читатели не ждут запись. Добавленные объекты Сотрудник
+    и Отдел не изменяются на месте - изменение делается заменой.
+    """
+
+    def __init__(self, отделы=(), сотрудники=()):
+        self._блокировка = threading.Lock()
+        self._снимок = Снимок(0, (), (), tuple({} for _ in range(КОРЗИН)), 0, 0)
+        with self.транзакция() as т:
+            for отдел in отделы:
+                т.добавить_отдел(отдел)
+            for сотрудник in сотрудники:
+                т.добавить_сотрудника(сотрудник)
+
+    def снимок(self):
+        return self._снимок
+
+    def транзакция(self):
+        """Несколько изменений, публикуемых одним снимком"""
+        return _Транзакция(self)
+
+    def добавить_отдел(self, отдел):
+        with self.транзакция() as т:
+            т.добавить_отдел(отдел)
+
+    def удалить_отдел(self, id_отдела):
+        with self.транзакция() as т:
+            т.удалить_отдел(id_отдела)
+
+    def добавить_сотрудника(self, сотрудник):
+        with self.транзакция() as т:
+            т.добавить_сотрудника(сотрудник)
+
+    def удалить_сотрудника(self, id_сотрудника):
+        with self.транзакция() as т:
+            т.удалить_сотрудника(id_сотрудника)
+
+
+class _Транзакция:
+    def __init__(self, хранилище):
+        self._хранилище = хранилище
+
+    def __enter__(self):
+        self._хранилище._блокировка.acquire()
+        с = self._хранилище._снимок
+        self._отделы = с.отделы
+        self._список_отделов = None  # копия отделов, если транзакция их меняет
+        self._номера_отделов = None  # id_отдела -> номер в копии
+        self._куски = list(с.куски)
+        self._позиции = list(с.позиции)
+        self._длина = с.длина
+        self._удалено = с.удалено
+        # Куски и корзины, уже скопированные в этой транзакции
+        self._свои_куски = set()
+        self._свои_корзины = set()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                старый = self._хранилище._снимок
+                if self._удалено * 2 > self._длина:
+                    self._уплотнить()
+                if self._список_отделов is not None:
+                    self._отделы = tuple(о for о in self._список_отделов if о is not None)
+                куски = tuple(
+                    tuple(кусок) if номер in self._свои_куски else кусок
+                    for номер, кусок in enumerate(self._куски)
+                )
+                self._хранилище._снимок = Снимок(
+                    старый.версия + 1, self._отделы, куски,
+                    tuple(self._позиции), self._длина, self._удалено
+                )
+        finally:
+            self._хранилище._блокировка.release()
+
+    def _кусок(self, номер):
+        if номер not in self._свои_куски:
+            self._куски[номер] = list(self._куски[номер])
+            self._свои_куски.add(номер)
+        return self._куски[номер]
+
+    def _корзина(self, id_сотрудника):
+        номер = hash(id_сотрудника) % КОРЗИН
+        if номер not in self._свои_корзины:
+            self._позиции[номер] = dict(self._позиции[номер])
+            self._свои_корзины.add(номер)
+        return self._позиции[номер]
+
+    def _отделы_для_записи(self):
+        # Копия отделов и словарь номеров создаются один раз за транзакцию,
+        # кортеж нового снимка собирается при публикации
+        if self._список_отделов is None:
+            self._список_отделов = list(self._отделы)
+            self._номера_отделов = {о.id_отдела: номер for номер, о in enumerate(self._список_отделов)}
+        return self._список_отделов
+
+    def добавить_отдел(self, отдел):
+        отделы = self._отделы_для_записи()
+        номер = self._номера_отделов.get(отдел.id_отдела)
+        if номер is None:
+            self._номера_отделов[отдел.id_отдела] = len(отделы)
+            отделы.append(отдел)
+        else:
+            отделы[номер] = отдел
+
+    def удалить_отдел(self, id_отдела):
+        отделы = self._отделы_для_записи()
+        номер = self._номера_отделов.pop(id_отдела, None)
+        if номер is not None:
+            отделы[номер] = None
+
+    def добавить_сотрудника(self, сотрудник):
+        if сотрудник.id_сотрудника in self._корзина(сотрудник.id_сотрудника):
+            self.удалить_сотрудника(сотрудник.id_сотрудника)
+        позиция = self._длина
+        if позиция % РАЗМЕР_КУСКА == 0:
+            self._куски.append([])
+            self._свои_куски.add(len(self._куски) - 1)
+        self._кусок(позиция // РАЗМЕР_КУСКА).append(сотрудник)
+        self._корзина(сотрудник.id_сотрудника)[сотрудник.id_сотрудника] = позиция
+        self._длина += 1
+
+    def удалить_сотрудника(self, id_сотрудника):
+        позиция = self._корзина(id_сотрудника).pop(id_сотрудника)
+        кусок = self._кусок(позиция // РАЗМЕР_КУСКА)
+        сотрудник = кусок[позиция % РАЗМЕР_КУСКА]
+        кусок[позиция % РАЗМЕР_КУСКА] = None
+        self._удалено += 1
+        return сотрудник
+
+    def _уплотнить(self):
+        # Больше половины позиций пусты: переписываем сотрудников подряд
+        живые = [с for кусок in self._куски for с in кусок if с is not None]
+        self._куски = [живые[i:i + РАЗМЕР_КУСКА] for i in range(0, len(живые), РАЗМЕР_КУСКА)]
+        self._позиции = [{} for _ in range(КОРЗИН)]
+        for позиция, с in enumerate(живые):
+            self._позиции[hash(с.id_сотрудника) % КОРЗИН][с.id_сотрудника] = позиция
+        self._свои_куски = set(range(len(self._куски)))
+        self._длина = len(живые)
+        self._удалено = 0
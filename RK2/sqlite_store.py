@@ -0,0 +1,142 @@
+import sqlite3
+from itertools import islice
+
+from indexes import верхняя_граница
+
+СХЕМА = """
+CREATE TABLE IF NOT EXISTS отделы (
+    id_отдела INTEGER PRIMARY KEY,
+    наименование TEXT NOT NULL,
+    наименование_нижн TEXT NOT NULL,
+    порядок INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS сотрудники (
+    id_сотрудника INTEGER NOT NULL,
+    фамилия TEXT NOT NULL,
+    зарплата REAL NOT NULL,
+    id_отдела INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS сотрудники_отдела (
+    id_сотрудника INTEGER NOT NULL,
+    id_отдела INTEGER NOT NULL
+);
+"""
+
+# Индексы создаются после массовой загрузки: так вставка идет быстрее
+ИНДЕКСЫ = """
+CREATE INDEX IF NOT EXISTS сотрудники_по_отделу ON сотрудники (id_отдела);
+CREATE INDEX IF NOT EXISTS сотрудники_по_фамилии ON сотрудники (фамилия);
+CREATE INDEX IF NOT EXISTS связи_по_отделу ON сотрудники_отдела (id_отдела, id_сотрудника);
+CREATE INDEX IF NOT EXISTS связи_по_сотруднику ON сотрудники_отдела (id_сотрудника, id_отдела);
+"""
+
+
+def _пакеты(строки, размер):
+    строки = iter(строки)
+    while True:
+        пакет = list(islice(строки, размер))
+        if not пакет:
+            return
+        yield пакет
+
+
+class SQLiteХранилище:
+    """Хранилище RK2 в файле SQLite (или в памяти при путь=":memory:")
+
+    Порядок строк совпадает с порядком загрузки: отделы упорядочены по
+    столбцу порядок, сотрудники - по rowid. Поэтому запросы возвращают
+    то же, что функции из queries.py над исходными списками.
+    """
+
+    def __init__(self, путь=":memory:"):
+        self.соединение = sqlite3.connect(путь)
+        self.соединение.executescript(СХЕМА)
+
+    def close(self):
+        self.соединение.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def загрузить(self, отделы=(), сотрудники=(), связи=(), размер_пакета=100000):
+        """Массовая загрузка через executemany пакетами в одной транзакции"""
+        с = self.соединение
+        with с:
+            порядок = с.execute("SELECT COALESCE(MAX(порядок) + 1, 0) FROM отделы").fetchone()[0]
+            for пакет in _пакеты(отделы, размер_пакета):
+                с.executemany(
+                    "INSERT OR REPLACE INTO отделы VALUES (?, ?, ?, "
+                    "COALESCE((SELECT порядок FROM отделы WHERE id_отдела = ?), ?))",
+                    [(о.id_отдела, о.наименование, о.наименование.lower(), о.id_отдела, порядок + i)
+                     for i, о in enumerate(пакет)]
+                )
+                порядок += len(пакет)
+            for пакет in _пакеты(сотрудники, размер_пакета):
+                с.executemany(
+                    "INSERT INTO сотрудники VALUES (?, ?, ?, ?)",
+                    [(х.id_сотрудника, х.фамилия, х.зарплата, х.id_отдела) for х in пакет]
+                )
+            for пакет in _пакеты(связи, размер_пакета):
+                с.executemany(
+                    "INSERT INTO сотрудники_отдела VALUES (?, ?)",
+                    [(х.id_сотрудника, х.id_отдела) for х in пакет]
+                )
+            с.executescript(ИНДЕКСЫ)
+        с.execute("ANALYZE")
+
+    def запрос_1_отделы_со_словом_отдел(self, слово="отдел"):
+        результат = []
+        текущий = None
+        строки = self.соединение.execute(
+            "SELECT о.id_отдела, о.наименование, с.фамилия, с.id_сотрудника, с.зарплата "
+            "FROM отделы о LEFT JOIN сотрудники с ON с.id_отдела = о.id_отдела "
+            "WHERE instr(о.наименование_нижн, ?) > 0 "
+            "ORDER BY о.порядок, с.rowid",
+            (слово.lower(),)
+        )
+        for id_отдела, наименование, фамилия, id_сотрудника, зарплата in строки:
+            if текущий != id_отдела:
+                текущий = id_отдела
+                результат.append({"отдел": наименование, "сотрудники": []})
+            if id_сотрудника is not None:
+                результат[-1]["сотрудники"].append(
+                    {"фамилия": фамилия, "id": id_сотрудника, "зарплата": зарплата}
+                )
+        return результат
+
+    def запрос_2_средняя_зарплата_по_отделам(self):
+        # SUM в SQLite 3.43+ суммирует с компенсацией, а до 3.43 - простым
+        # сложением, и не всегда совпадает с sum() текущего Python. Поэтому
+        # SQLite отдает зарплаты в порядке rowid, а суммы, округление и
+        # устойчивая сортировка считаются в Python, как в queries.py
+        зарплаты = {}
+        for id_отдела, зарплата in self.соединение.execute(
+            "SELECT id_отдела, зарплата FROM сотрудники ORDER BY rowid"
+        ):
+            зарплаты.setdefault(id_отдела, []).append(зарплата)
+        результат = []
+        for id_отдела, наименование in self.соединение.execute(
+            "SELECT id_отдела, наименование FROM отделы ORDER BY порядок"
+        ):
+            if id_отдела in зарплаты:
+                отдела = зарплаты[id_отдела]
+                результат.append((наименование, round(sum(отдела) / len(отдела), 2)))
+        результат.sort(key=lambda x: x[1], reverse=True)
+        return результат
+
+    def запрос_3_сотрудники_на_а(self, префикс="А"):
+        # Диапазон по индексу фамилий вместо LIKE: LIKE не различает регистр только для ASCII
+        if not префикс:
+            условие, параметры = "", ()
+        else:
+            условие, параметры = "WHERE с.фамилия >= ? AND с.фамилия < ? ", (префикс, верхняя_граница(префикс))
+        строки = self.соединение.execute(
+            "SELECT с.фамилия, COALESCE(о.наименование, 'Неизвестный отдел') "
+            "FROM сотрудники с LEFT JOIN отделы о ON о.id_отдела = с.id_отдела "
+            + условие + "ORDER BY с.rowid",
+            параметры
+        )
+        return [{"фамилия": фамилия, "отдел": отдел} for фамилия, отдел in строки]
@@ -0,0 +1,212 @@
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import count
+
+from indexes import ПрефиксныйИндекс, ТриграммныйИндекс
+
+# Описание изменения данных для подписчиков Хранилища: вид ("отдел" или
+# "сотрудник"), затронутые id отделов и строки (наименования или фамилии до и после)
+Изменение = namedtuple("Изменение", "вид ids_отделов строки")
+
+
+class Хранилище:
+    """Хранилище отделов и сотрудников с хеш-индексами по идентификаторам"""
+
+    def __init__(self, отделы=(), сотрудники=()):
+        self.отделы = {}  # id_отдела -> Отдел
+        self.сотрудники = {}  # id_сотрудника -> Сотрудник
+        self.сотрудники_по_отделам = {}  # id_отдела -> {id_сотрудника: Сотрудник}
+        self._позиции = {}  # id_сотрудника -> номер добавления
+        self._счетчик = count()
+        self._индексы_фамилий = {}  # без_регистра -> ПрефиксныйИндекс, строятся по требованию
+        self._позиции_отделов = {}  # id_отдела -> номер добавления
+        self._счетчик_отделов = count()
+        self._индекс_наименований = None  # ТриграммныйИндекс, строится по требованию
+        self.версия = 0  # увеличивается при каждом изменении данных
+        self._подписчики = []
+        for отдел in отделы:
+            self.добавить_отдел(отдел)
+        for сотрудник in сотрудники:
+            self.добавить_сотрудника(сотрудник)
+
+    def подписаться(self, функция):
+        """функция(изменение) вызывается после каждого изменения данных"""
+        self._подписчики.append(функция)
+
+    def _изменено(self, вид, ids_отделов, строки):
+        self.версия += 1
+        изменение = Изменение(вид, frozenset(ids_отделов), frozenset(строки))
+        for функция in self._подписчики:
+            функция(изменение)
+
+    def добавить_отдел(self, отдел):
+        старый = self.отделы.get(отдел.id_отдела)
+        self.отделы[отдел.id_отдела] = отдел
+        позиция = self._позиции_отделов.get(отдел.id_отдела)
+        if позиция is None:
+            позиция = self._позиции_отделов[отдел.id_отдела] = next(self._счетчик_отделов)
+        if self._индекс_наименований is not None:
+            self._индекс_наименований.добавить(отдел.id_отдела, отдел.наименование, позиция)
+        строки = {отдел.наименование} if старый is None else {отдел.наименование, старый.наименование}
+        self._изменено("отдел", {отдел.id_отдела}, строки)
+
+    def удалить_отдел(self, id_отдела):
+        отдел = self.отделы.pop(id_отдела)
+        del self._позиции_отделов[id_отдела]
+        if self._индекс_наименований is not None:
+            self._индекс_наименований.удалить(id_отдела)
+        self._изменено("отдел", {id_отдела}, {отдел.наименование})
+        return отдел
+
+    def добавить_сотрудника(self, сотрудник):
+        # id читаются один раз: строка ТаблицыСотрудников создает новый int при каждом
+        # чтении, а ключи трех словарей должны быть одним объектом
+        id_сотрудника, id_отдела = сотрудник.id_сотрудника, сотрудник.id_отдела
+        if id_сотрудника in self.сотрудники:
+            self.удалить_сотрудника(id_сотрудника)
+        self.сотрудники[id_сотрудника] = сотрудник
+        self.сотрудники_по_отделам.setdefault(id_отдела, {})[id_сотрудника] = сотрудник
+        позиция = self._позиции[id_сотрудника] = next(self._счетчик)
+        for индекс in self._индексы_фамилий.values():
+            индекс.добавить(сотрудник.фамилия, позиция, сотрудник)
+        self._изменено("сотрудник", {id_отдела}, {сотрудник.фамилия})
+
+    def удалить_сотрудника(self, id_сотрудника):
+        сотрудник = self.сотрудники.pop(id_сотрудника)
+        в_отделе = self.сотрудники_по_отделам[сотрудник.id_отдела]
+        del в_отделе[id_сотрудника]
+        if not в_отделе:
+            del self.сотрудники_по_отделам[сотрудник.id_отдела]
+        позиция = self._позиции.pop(id_сотрудника)
+        for индекс in self._индексы_фамилий.values():
+            индекс.удалить(сотрудник.фамилия, позиция)
+        self._изменено("сотрудник", {сотрудник.id_отдела}, {сотрудник.фамилия})
+        return сотрудник
+
+    def отдел(self, id_отдела):
+        return self.отделы.get(id_отдела)
+
+    def название_отдела(self, id_отдела):
+        отдел = self.отделы.get(id_отдела)
+        return отдел.наименование if отдел else "Неизвестный отдел"
+
+    def сотрудник(self, id_сотрудника):
+        return self.сотрудники.get(id_сотрудника)
+
+    def сотрудники_отдела(self, id_отдела):
+        return self.сотрудники_по_отделам.get(id_отдела, {}).values()
+
+    def индекс_фамилий(self, без_регистра=False):
+        # Строится при первом обращении, дальше обновляется при каждой вставке и удалении
+        индекс = self._индексы_фамилий.get(без_регистра)
+        if индекс is None:
+            индекс = ПрефиксныйИндекс(без_регистра)
+            индекс.добавить_все(
+                (сотрудник.фамилия, self._позиции[сотрудник.id_сотрудника], сотрудник)
+                for сотрудник in self.сотрудники.values()
+            )
+            self._индексы_фамилий[без_регистра] = индекс
+        return индекс
+
+    def индекс_наименований(self):
+        if self._индекс_наименований is None:
+            индекс = ТриграммныйИндекс()
+            for отдел in self.отделы.values():
+                индекс.добавить(отдел.id_отдела, отдел.наименование, self._позиции_отделов[отдел.id_отдела])
+            self._индекс_наименований = индекс
+        return self._индекс_наименований
+
+    def найти_отделы(self, подстрока):
+        """Отделы, в наименовании которых есть подстрока (без учета регистра), в порядке добавления"""
+        return [self.отделы[id_отдела] for id_отдела in self.индекс_наименований().найти(подстрока)]
+
+    def найти_по_фамилии(self, префикс, без_регистра=False):
+        """Сотрудники с фамилией на префикс в порядке добавления"""
+        return self.индекс_фамилий(без_регистра).найти(префикс, по_порядку=True)
+
+
+class ИндексСвязей:
+    """Двусторонний индекс связи многие-ко-многим СотрудникиОтдела
+
+    Для каждого отдела хранится отсортированный массив id сотрудников,
+    для каждого сотрудника - отсортированный массив id отделов.
+    """
+
+    def __init__(self, связи=()):
+        отделы = {}
+        сотрудники = {}
+        for связь in связи:
+            отделы.setdefault(связь.id_отдела, []).append(связь.id_сотрудника)
+            сотрудники.setdefault(связь.id_сотрудника, []).append(связь.id_отдела)
+        self.сотрудники_отдела = {к: _массив_id(v) for к, v in отделы.items()}
+        self.отделы_сотрудника = {к: _массив_id(v) for к, v in сотрудники.items()}
+        self._маски = {}
+
+    def сотрудники(self, id_отдела):
+        return self.сотрудники_отдела.get(id_отдела, _ПУСТО)
+
+    def отделы(self, id_сотрудника):
+        return self.отделы_сотрудника.get(id_сотрудника, _ПУСТО)
+
+    def маска_отдела(self, id_отдела):
+        # Битовая маска сотрудников отдела: бит с номером id_сотрудника
+        маска = self._маски.get(id_отдела)
+        if маска is None:
+            маска = self._маски[id_отдела] = маска_из_id(self.сотрудники(id_отдела))
+        return маска
+
+    def общие_сотрудники(self, *ids_отделов):
+        # Сотрудники, работающие во всех перечисленных отделах
+        if not ids_отделов:
+            return []
+        массивы = sorted((self.сотрудники(i) for i in ids_отделов), key=len)
+        if not массивы[0]:
+            return []
+        if len(массивы[0]) * 64 < max(м[-1] for м in массивы):
+            # Разреженные id: пересекаем отсортированные массивы
+            результат = массивы[0]
+            for массив in массивы[1:]:
+                результат = пересечение(результат, массив)
+            return list(результат)
+        маска = -1
+        for id_отдела in ids_отделов:
+            маска &= self.маска_отдела(id_отдела)
+        return id_из_маски(маска)
+
+
+_ПУСТО = array('q')
+
+
+def _массив_id(ids):
+    ids.sort()
+    return array('q', ids)
+
+
+def пересечение(a, b):
+    # Пересечение отсортированных массивов: проход по меньшему и bisect в большем
+    if len(a) > len(b):
+        a, b = b, a
+    результат = array('q')
+    начало = 0
+    for x in a:
+        начало = bisect_left(b, x, начало)
+        if начало == len(b):
+            break
+        if b[начало] == x:
+            результат.append(x)
+    return результат
+
+
+def маска_из_id(ids):
+    if not ids:
+        return 0
+    байты = bytearray(max(ids) // 8 + 1)
+    for i in ids:
+        байты[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(байты, 'little')
+
+
+def id_из_маски(маска):
+    байты = маска.to_bytes((маска.bit_length() + 7) // 8, 'little')
+    return [i * 8 + бит for i, б in enumerate(байты) if б for бит in range(8) if б >> бит & 1]
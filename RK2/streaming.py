@@ -0,0 +1,66 @@
+from collections import namedtuple
+from itertools import islice
+
+from queries import запрос_2_по_хранилищу
+
+# Наибольший допустимый размер страницы
+МАКС_РАЗМЕР_СТРАНИЦЫ = 10000
+
+Страница = namedtuple("Страница", "строки курсор")
+
+
+def поток_запроса_1(хранилище, слово="отдел"):
+    """Запрос 1 построчно: по строке на каждого сотрудника отдела
+
+    Строка - {"отдел": наименование, "сотрудник": {...}}. Для отдела без
+    сотрудников выдается одна строка с "сотрудник": None.
+    """
+    for отдел in хранилище.найти_отделы(слово):
+        пустой = True
+        for с in хранилище.сотрудники_отдела(отдел.id_отдела):
+            пустой = False
+            yield {
+                "отдел": отдел.наименование,
+                "сотрудник": {"фамилия": с.фамилия, "id": с.id_сотрудника, "зарплата": с.зарплата}
+            }
+        if пустой:
+            yield {"отдел": отдел.наименование, "сотрудник": None}
+
+
+def поток_запроса_2(хранилище):
+    # Для сортировки нужны средние всех отделов, но не сами сотрудники: память O(отделов)
+    yield from запрос_2_по_хранилищу(хранилище)
+
+
+def поток_запроса_3(хранилище, префикс="А", без_регистра=False):
+    for с in хранилище.индекс_фамилий(без_регистра).перебрать(префикс, по_порядку=True):
+        yield {"фамилия": с.фамилия, "отдел": хранилище.название_отдела(с.id_отдела)}
+
+
+def страница(поток, курсор=0, размер_страницы=100):
+    """Одна страница потока начиная со смещения курсор
+
+    Возвращает Страница(строки, курсор следующей страницы или None, если строк больше нет).
+    """
+    if not 0 < размер_страницы <= МАКС_РАЗМЕР_СТРАНИЦЫ:
+        raise ValueError(f"Размер страницы должен быть от 1 до {МАКС_РАЗМЕР_СТРАНИЦЫ}")
+    поток = islice(поток, курсор, None)
+    строки = list(islice(поток, размер_страницы))
+    if len(строки) < размер_страницы or next(поток, _КОНЕЦ) is _КОНЕЦ:
+        return Страница(строки, None)
+    return Страница(строки, курсор + размер_страницы)
+
+
+def постранично(поток, размер_страницы=100):
+    """Разбивает поток на страницы, не держа в памяти больше одной страницы"""
+    if not 0 < размер_страницы <= МАКС_РАЗМЕР_СТРАНИЦЫ:
+        raise ValueError(f"Размер страницы должен быть от 1 до {МАКС_РАЗМЕР_СТРАНИЦЫ}")
+    поток = iter(поток)
+    while True:
+        строки = list(islice(поток, размер_страницы))
+        if not строки:
+            return
+        yield строки
+
+
+_КОНЕЦ = object()
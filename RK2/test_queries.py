@@ -1,39 +1,880 @@
-import unittest
-from models import create_test_data
-from queries import запрос_1_отделы_со_словом_отдел, запрос_2_средняя_зарплата_по_отделам, запрос_3_сотрудники_на_а
-
-class TestQueries(unittest.TestCase):
-
-    def setUp(self):
-        self.отделы, self.сотрудники, _ = create_test_data()
-
-    def test_запрос_1_отделы_со_словом_отдел(self):
-        результат = запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники)
-        # Проверяем количество отделов
-        self.assertEqual(len(результат), 5, "Должно быть 5 отделов")
-        # Проверяем, что в каждом отделе есть сотрудники
-        for item in результат:
-            self.assertGreater(len(item["сотрудники"]), 0, f"В отделе {item['отдел']} нет сотрудников")
-
-    def test_запрос_2_средняя_зарплата_по_отделам(self):
-        результат = запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники)
-        # Проверяем, что список отсортирован по убыванию
-        зарплаты = [средняя for _, средняя in результат]
-        self.assertEqual(зарплаты, sorted(зарплаты, reverse=True))
-
-        # Проверяем конкретное значение для Отдела разработки
-        разработка = next((средняя for наим, средняя in результат if "разработки" in наим), None)
-        self.assertAlmostEqual(разработка, 80666.67, places=2, msg="Средняя зарплата в Отделе разработки должна быть ~80666.67")
-
-    def test_запрос_3_сотрудники_на_а(self):
-        результат = запрос_3_сотрудники_на_а(self.отделы, self.сотрудники)
-        фамилии = [s["фамилия"] for s in результат]
-        # Должны быть Алексеев, Андреева, Афанасьев
-        ожидаемые = {"Алексеев", "Андреева", "Афанасьев"}
-        self.assertEqual(set(фамилии), ожидаемые, "Не все сотрудники на 'А' найдены")
-        # Проверим, что у Алексеева указан правильный отдел
-        алексеев = next(s for s in результат if s["фамилия"] == "Алексеев")
-        self.assertEqual(алексеев["отдел"], "Отдел продаж", "Отдел Алексеева должен быть 'Отдел продаж'")
-
-if __name__ == '__main__':
+import unittest
+from models import create_test_data
+from models import Сотрудник, Отдел, ТаблицаСотрудников, СотрудникиОтдела
+from queries import запрос_1_отделы_со_словом_отдел, запрос_2_средняя_зарплата_по_отделам, запрос_3_сотрудники_на_а
+from queries import запрос_1_по_хранилищу, запрос_2_по_хранилищу, запрос_3_по_хранилищу
+from queries import запрос_1_многие_ко_многим, запрос_2_многие_ко_многим, запрос_3_многие_ко_многим
+from aggregation import статистика_по_отделам
+from views import ПредставлениеЗарплат, ДеревоПорядка
+from sqlite_store import SQLiteХранилище
+from indexes import ПрефиксныйИндекс, ТриграммныйИндекс
+from streaming import поток_запроса_1, поток_запроса_2, поток_запроса_3, страница, постранично
+from loader import загрузить
+from parallel import ПараллельныйИсполнитель
+from cache import КэшЗапросов
+from snapshots import ХранилищеСнимков
+from store import Хранилище, ИндексСвязей, пересечение
+from benchmark import сгенерировать_организацию, запустить, показатели_роста, отношения_к_хранилищу
+from query_builder import Запрос, запрос_1_построитель, запрос_2_построитель, запрос_3_построитель
+
+class TestQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+
+    def test_запрос_1_отделы_со_словом_отдел(self):
+        результат = запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники)
+        # Проверяем количество отделов
+        self.assertEqual(len(результат), 5, "Должно быть 5 отделов")
+        # Проверяем, что в каждом отделе есть сотрудники
+        for item in результат:
+            self.assertGreater(len(item["сотрудники"]), 0, f"В отделе {item['отдел']} нет сотрудников")
+
+    def test_запрос_2_средняя_зарплата_по_отделам(self):
+        результат = запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники)
+        # Проверяем, что список отсортирован по убыванию
+        зарплаты = [средняя for _, средняя in результат]
+        self.assertEqual(зарплаты, sorted(зарплаты, reverse=True))
+
+        # Проверяем конкретное значение для Отдела разработки
+        разработка = next((средняя for наим, средняя in результат if "разработки" in наим), None)
+        self.assertAlmostEqual(разработка, 80666.67, places=2, msg="Средняя зарплата в Отделе разработки должна быть ~80666.67")
+
+    def test_запрос_3_сотрудники_на_а(self):
+        результат = запрос_3_сотрудники_на_а(self.отделы, self.сотрудники)
+        фамилии = [s["фамилия"] for s in результат]
+        # Должны быть Алексеев, Андреева, Афанасьев
+        ожидаемые = {"Алексеев", "Андреева", "Афанасьев"}
+        self.assertEqual(set(фамилии), ожидаемые, "Не все сотрудники на 'А' найдены")
+        # Проверим, что у Алексеева указан правильный отдел
+        алексеев = next(s for s in результат if s["фамилия"] == "Алексеев")
+        self.assertEqual(алексеев["отдел"], "Отдел продаж", "Отдел Алексеева должен быть 'Отдел продаж'")
+
+class TestХранилище(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+        self.хранилище = Хранилище(self.отделы, self.сотрудники)
+
+    def test_запросы_совпадают_со_списками(self):
+        self.assertEqual(запрос_1_по_хранилищу(self.хранилище),
+                         запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники))
+        self.assertEqual(запрос_2_по_хранилищу(self.хранилище),
+                         запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        self.assertEqual(запрос_3_по_хранилищу(self.хранилище),
+                         запрос_3_сотрудники_на_а(self.отделы, self.сотрудники))
+
+    def test_индексы_по_id(self):
+        self.assertEqual(self.хранилище.сотрудник(4).фамилия, "Алексеев")
+        self.assertEqual(self.хранилище.отдел(3).наименование, "Отдел продаж")
+        фамилии = [с.фамилия for с in self.хранилище.сотрудники_отдела(1)]
+        self.assertEqual(фамилии, ["Иванов", "Петров", "Афанасьев"])
+
+    def test_изменение_сотрудника(self):
+        self.хранилище.удалить_сотрудника(6)
+        self.хранилище.добавить_сотрудника(Сотрудник(9, "Абрамов", 90000.0, 6))
+        self.хранилище.добавить_отдел(Отдел(6, "Отдел кадров"))
+        результат = запрос_3_по_хранилищу(self.хранилище)
+        self.assertIn({"фамилия": "Абрамов", "отдел": "Отдел кадров"}, результат)
+        названия = [название for название, _ in запрос_2_по_хранилищу(self.хранилище)]
+        self.assertNotIn("Отдел аналитики", названия)
+        self.assertEqual(названия[0], "Отдел кадров")
+
+class TestМногиеКоМногим(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, self.связи = create_test_data()
+
+    def test_запрос_1(self):
+        результат = запрос_1_многие_ко_многим(self.отделы, self.сотрудники, self.связи)
+        продажи = next(item for item in результат if item["отдел"] == "Отдел продаж")
+        self.assertEqual([s["id"] for s in продажи["сотрудники"]], [1, 4, 8])
+
+    def test_запрос_2(self):
+        результат = dict(запрос_2_многие_ко_многим(self.отделы, self.сотрудники, self.связи))
+        self.assertAlmostEqual(результат["Отдел продаж"], 73000.0, places=2)
+        self.assertAlmostEqual(результат["Отдел аналитики"], 69000.0, places=2)
+
+    def test_запрос_3(self):
+        результат = запрос_3_многие_ко_многим(self.отделы, self.сотрудники, ИндексСвязей(self.связи))
+        self.assertEqual([s["фамилия"] for s in результат], ["Алексеев", "Андреева", "Афанасьев"])
+
+    def test_пересечение_отделов(self):
+        индекс = ИндексСвязей(self.связи)
+        self.assertEqual(индекс.общие_сотрудники(3, 5), [8])
+        self.assertEqual(индекс.общие_сотрудники(1, 3), [1])
+        self.assertEqual(индекс.общие_сотрудники(2, 4), [])
+        self.assertEqual(list(пересечение(индекс.сотрудники(1), индекс.сотрудники(3))), [1])
+
+class TestТаблицаСотрудников(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, self.связи = create_test_data()
+        self.таблица = ТаблицаСотрудников(self.сотрудники)
+
+    def test_строки_читаются_как_сотрудники(self):
+        self.assertEqual(len(self.таблица), 8)
+        строка = self.таблица[3]
+        self.assertEqual((строка.id_сотрудника, строка.фамилия, строка.зарплата, строка.id_отдела),
+                         (4, "Алексеев", 71000.0, 3))
+        self.assertEqual(self.таблица[-1].фамилия, "Григорьева")
+
+    def test_пул_фамилий(self):
+        self.таблица.добавить(9, "Иванов", 50000.0, 2)
+        self.assertEqual(self.таблица.фамилии.count("Иванов"), 1)
+        self.assertEqual(self.таблица[8].фамилия, "Иванов")
+
+    def test_запросы_по_таблице(self):
+        self.assertEqual(запрос_1_отделы_со_словом_отдел(self.отделы, self.таблица),
+                         запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники))
+        self.assertEqual(запрос_2_средняя_зарплата_по_отделам(self.отделы, self.таблица),
+                         запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        self.assertEqual(запрос_3_сотрудники_на_а(self.отделы, self.таблица),
+                         запрос_3_сотрудники_на_а(self.отделы, self.сотрудники))
+        self.assertEqual(запрос_3_многие_ко_многим(self.отделы, self.таблица, self.связи),
+                         запрос_3_многие_ко_многим(self.отделы, self.сотрудники, self.связи))
+
+class TestСтатистикаПоОтделам(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+
+    def test_статистика(self):
+        статистика = статистика_по_отделам(self.сотрудники)
+        разработка = статистика[1]
+        self.assertEqual(разработка.количество, 3)
+        self.assertEqual(разработка.сумма, 242000.0)
+        self.assertEqual((разработка.минимум, разработка.максимум, разработка.медиана), (75000.0, 85000.0, 82000.0))
+        self.assertEqual(статистика[3].медиана, 72000.0)
+
+    def test_таблица_и_объекты_совпадают(self):
+        self.assertEqual(статистика_по_отделам(ТаблицаСотрудников(self.сотрудники)),
+                         статистика_по_отделам(self.сотрудники))
+
+    def test_неполная_статистика(self):
+        статистика = статистика_по_отделам(self.сотрудники, полная=False)
+        self.assertAlmostEqual(статистика[1].среднее, 80666.67, places=2)
+        self.assertIsNone(статистика[1].медиана)
+
+# Зарплаты в копейках, на которых сложение по одному значению и sum() из
+# Python 3.12+ дают разные округленные средние (124681.92 и 124681.93)
+ДРОБНЫЕ_ЗАРПЛАТЫ = [
+    [42348.18, 137249.71, 193752.96, 125376.85],
+    [133516.54, 123699.72, 124180.77, 48222.83],
+    [191656.19, 157437.77, 190542.94, 162105.48],
+    [57264.65, 64482.8, 86529.77, 35298.96],
+    [181360.6, 180880.17, 191011.8, 191840.53],
+]
+
+
+def дробные_данные():
+    """Отделы и сотрудники с ДРОБНЫМИ_ЗАРПЛАТАМИ; сотрудники отделов чередуются"""
+    отделы = [Отдел(i, f"Отдел {i}") for i in range(1, 6)]
+    сотрудники = [
+        Сотрудник(len(ДРОБНЫЕ_ЗАРПЛАТЫ) * шаг + i, f"Андреев {шаг}", зарплаты[шаг], i + 1)
+        for шаг in range(4) for i, зарплаты in enumerate(ДРОБНЫЕ_ЗАРПЛАТЫ)
+    ]
+    return отделы, сотрудники
+
+
+def запрос_2_исходный(отделы, сотрудники):
+    # Запрос 2 в исходном виде: эталон округления
+    результат = []
+    for отдел in отделы:
+        зарплаты = [с.зарплата for с in сотрудники if с.id_отдела == отдел.id_отдела]
+        if зарплаты:
+            результат.append((отдел.наименование, round(sum(зарплаты) / len(зарплаты), 2)))
+    результат.sort(key=lambda x: x[1], reverse=True)
+    return результат
+
+
+class TestДробныеЗарплаты(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники = дробные_данные()
+        self.эталон = запрос_2_исходный(self.отделы, self.сотрудники)
+
+    def test_запрос_2_совпадает_с_исходным(self):
+        хранилище = Хранилище(self.отделы, self.сотрудники)
+        связи = [СотрудникиОтдела(с.id_сотрудника, с.id_отдела) for с in self.сотрудники]
+        self.assertEqual(запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники), self.эталон)
+        self.assertEqual(запрос_2_средняя_зарплата_по_отделам(self.отделы, ТаблицаСотрудников(self.сотрудники)),
+                         self.эталон)
+        self.assertEqual(запрос_2_по_хранилищу(хранилище), self.эталон)
+        self.assertEqual(запрос_2_многие_ко_многим(self.отделы, self.сотрудники, связи), self.эталон)
+        self.assertEqual(запрос_2_построитель(хранилище), self.эталон)
+        self.assertEqual(ХранилищеСнимков(self.отделы, self.сотрудники).снимок().запрос_2(), self.эталон)
+
+    def test_параллельный_запрос_2(self):
+        with ПараллельныйИсполнитель(self.отделы, self.сотрудники, шардов=2, процессов=2) as исполнитель:
+            self.assertEqual(исполнитель.запрос_2_средняя_зарплата_по_отделам(), self.эталон)
+
+    def test_sqlite_запрос_2(self):
+        with SQLiteХранилище() as хранилище:
+            хранилище.загрузить(self.отделы, self.сотрудники)
+            self.assertEqual(хранилище.запрос_2_средняя_зарплата_по_отделам(), self.эталон)
+
+
+class TestПредставлениеЗарплат(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+        self.представление = ПредставлениеЗарплат(self.отделы, self.сотрудники)
+
+    def test_рейтинг_совпадает_с_запросом_2(self):
+        self.assertEqual(self.представление.рейтинг(),
+                         запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        self.assertEqual(self.представление.рейтинг(1, 2),
+                         запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники)[1:3])
+
+    def test_изменения_сотрудников(self):
+        import random
+        for отделы, исходные, зарплата in [
+            (self.отделы, self.сотрудники, lambda случайные: float(случайные.randrange(50, 100) * 1000)),
+            # Копейки: накопленная сумма расходилась бы с sum() из запроса 2
+            (*дробные_данные(), lambda случайные: случайные.randrange(5000000, 20000000) / 100),
+        ]:
+            with self.subTest(отделов=len(отделы), сотрудников=len(исходные)):
+                представление = ПредставлениеЗарплат(отделы, исходные)
+                случайные = random.Random(7)
+                сотрудники = {с.id_сотрудника: с for с in исходные}
+                for шаг in range(200):
+                    id_сотрудника = случайные.choice(list(сотрудники))
+                    действие = случайные.randrange(4)
+                    if действие == 0 and len(сотрудники) > 1:
+                        представление.удалить_сотрудника(id_сотрудника)
+                        del сотрудники[id_сотрудника]
+                    elif действие == 1:
+                        новый = Сотрудник(100 + шаг, "Новиков", зарплата(случайные), случайные.randint(1, 5))
+                        представление.добавить_сотрудника(новый)
+                        сотрудники[новый.id_сотрудника] = новый
+                    elif действие == 2:
+                        сотрудники[id_сотрудника].зарплата = зарплата(случайные)
+                        представление.изменить_зарплату(id_сотрудника, сотрудники[id_сотрудника].зарплата)
+                    else:
+                        сотрудники[id_сотрудника].id_отдела = случайные.randint(1, 5)
+                        представление.перевести(id_сотрудника, сотрудники[id_сотрудника].id_отдела)
+                    self.assertEqual(представление.рейтинг(),
+                                     запрос_2_исходный(отделы, list(сотрудники.values())))
+
+    def test_место_отдела(self):
+        self.assertEqual(self.представление.место(1), 0)
+        self.представление.изменить_зарплату(6, 200000.0)
+        self.assertEqual(self.представление.место(5), 0)
+
+    def test_дерево_порядка(self):
+        дерево = ДеревоПорядка()
+        for x in [5, 1, 4, 2, 3]:
+            дерево.вставить(x)
+        дерево.удалить(4)
+        self.assertEqual(list(дерево), [1, 2, 3, 5])
+        self.assertEqual((дерево.k_й(2), дерево.ранг(5), len(дерево)), (3, 3, 4))
+        self.assertEqual(list(дерево.срез(1, 2)), [2, 3])
+
+class TestSQLiteХранилище(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, self.связи = create_test_data()
+        self.отделы.append(Отдел(6, "Бухгалтерия"))
+        self.сотрудники.append(Сотрудник(9, "Аксенов", 60000.0, 7))
+        self.хранилище = SQLiteХранилище()
+        self.хранилище.загрузить(self.отделы, self.сотрудники, self.связи, размер_пакета=3)
+
+    def tearDown(self):
+        self.хранилище.close()
+
+    def test_запросы_совпадают_с_памятью(self):
+        self.assertEqual(self.хранилище.запрос_1_отделы_со_словом_отдел(),
+                         запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники))
+        self.assertEqual(self.хранилище.запрос_2_средняя_зарплата_по_отделам(),
+                         запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        self.assertEqual(self.хранилище.запрос_3_сотрудники_на_а(),
+                         запрос_3_сотрудники_на_а(self.отделы, self.сотрудники))
+
+    def test_запрос_3_использует_индекс(self):
+        план = self.хранилище.соединение.execute(
+            "EXPLAIN QUERY PLAN SELECT rowid FROM сотрудники WHERE фамилия >= 'А' AND фамилия < 'Б'"
+        ).fetchall()
+        self.assertIn("сотрудники_по_фамилии", " ".join(str(строка) for строка in план))
+
+    def test_файл(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as каталог:
+            путь = os.path.join(каталог, "rk2.sqlite")
+            with SQLiteХранилище(путь) as хранилище:
+                хранилище.загрузить(self.отделы, self.сотрудники)
+            with SQLiteХранилище(путь) as хранилище:
+                self.assertEqual(хранилище.запрос_2_средняя_зарплата_по_отделам(),
+                                 запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+
+class TestПрефиксныйИндекс(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+        self.хранилище = Хранилище(self.отделы, self.сотрудники)
+
+    def test_поиск_по_префиксу(self):
+        индекс = ПрефиксныйИндекс()
+        for позиция, с in enumerate(self.сотрудники):
+            индекс.добавить(с.фамилия, позиция, с.id_сотрудника)
+        self.assertEqual(индекс.найти("А"), [4, 5, 7])
+        self.assertEqual(индекс.найти("Ан"), [5])
+        self.assertEqual(индекс.количество("Б"), 1)
+        self.assertEqual(индекс.найти("Я"), [])
+        индекс.удалить("Андреева", 4)
+        self.assertEqual(индекс.найти("А"), [4, 7])
+
+    def test_массовое_добавление(self):
+        индекс = ПрефиксныйИндекс()
+        индекс.добавить("Петров", 0, "п")
+        индекс.добавить_все([("Алексеев", 2, "а2"), ("Андреева", 1, "а1")])
+        self.assertEqual(len(индекс), 3)
+        self.assertEqual(индекс.найти("А"), ["а2", "а1"])
+        self.assertEqual(индекс.найти("А", по_порядку=True), ["а1", "а2"])
+        индекс.добавить("Агеев", 3, "а3")
+        индекс.удалить("Алексеев", 2)
+        self.assertEqual(индекс.найти("А"), ["а3", "а1"])
+
+    def test_число_сравнений(self):
+        сравнения = [0]
+
+        class Строка(str):
+            # Считает сравнения строк: ключи индекса - кортежи (строка, позиция)
+            def __eq__(self, другая):
+                сравнения[0] += 1
+                return str.__eq__(self, другая)
+
+            def __lt__(self, другая):
+                сравнения[0] += 1
+                return str.__lt__(self, другая)
+
+            __hash__ = str.__hash__
+
+        n = 20000
+        индекс = ПрефиксныйИндекс()
+        for i in range(n):
+            индекс.добавить(Строка(f"ф{(i * 7919) % n:07d}"), i, i)
+        self.assertEqual(индекс.количество("ф"), n)
+        # Построение по одной строке - одна сортировка, O(n log n) сравнений
+        self.assertLess(сравнения[0], 4 * n * n.bit_length())
+
+        # Изменение построенного индекса и поиск после него - O(log n), без пересортировки
+        сравнения[0] = 0
+        for i in range(100):
+            индекс.удалить(f"ф{(i * 7919) % n:07d}", i)
+            индекс.добавить(Строка(f"ф{(i * 7919) % n:07d}"), n + i, n + i)
+            self.assertEqual(индекс.найти(f"ф{(i * 7919) % n:07d}"), [n + i])
+        self.assertLess(сравнения[0], 100 * 8 * n.bit_length())
+
+    def test_перебор_по_порядку_добавления(self):
+        import random
+        случай = random.Random(5)
+        индекс = ПрефиксныйИндекс()
+        строки = {}
+        for позиция in случай.sample(range(3000), 2000):
+            строки[позиция] = случай.choice("АБВ") + случай.choice("абвгд") + str(случай.randrange(50))
+            индекс.добавить(строки[позиция], позиция, позиция)
+        for позиция in случай.sample(sorted(строки), 300):
+            индекс.удалить(строки.pop(позиция), позиция)
+        # "А" - частый префикс (проход по позициям), "Ба1" - редкий (слияние серий)
+        for префикс in ("", "А", "Ба", "Ба1", "Вд7", "Г"):
+            ожидаемые = sorted(п for п, с in строки.items() if с.startswith(префикс))
+            self.assertEqual(list(индекс.перебрать(префикс, по_порядку=True)), ожидаемые, префикс)
+
+    def test_первая_страница_не_просматривает_все(self):
+        from itertools import islice
+        операции = [0]
+
+        class Фамилия(str):
+            # Считает проверки префикса при проходе по позициям
+            def startswith(self, *аргументы):
+                операции[0] += 1
+                return str.startswith(self, *аргументы)
+
+        class Позиция(int):
+            # Считает сравнения позиций: сортировка всех совпадений дала бы O(k log k)
+            def __eq__(self, другая):
+                операции[0] += 1
+                return int.__eq__(self, другая)
+
+            def __lt__(self, другая):
+                операции[0] += 1
+                return int.__lt__(self, другая)
+
+            __hash__ = int.__hash__
+
+        индекс = ПрефиксныйИндекс()
+        for i in range(200000):
+            индекс.добавить(Фамилия("А" + str(i % 1000)), Позиция(i), i)
+        индекс.количество("А")
+        # "А" - все строки (проход по позициям), "А12" - 11 серий по 200 строк (слияние серий)
+        for префикс in ("А", "А12"):
+            операции[0] = 0
+            первые = list(islice(индекс.перебрать(префикс, по_порядку=True), 100))
+            self.assertLess(операции[0], 2000, префикс)
+            ожидаемые = [i for i in range(200000) if str(i % 1000).startswith(префикс[1:])][:100]
+            self.assertEqual(первые, ожидаемые)
+
+    def test_без_регистра(self):
+        self.хранилище.добавить_сотрудника(Сотрудник(9, "аксенова", 50000.0, 2))
+        self.assertEqual([с.фамилия for с in self.хранилище.найти_по_фамилии("а")], ["аксенова"])
+        фамилии = [с.фамилия for с in self.хранилище.найти_по_фамилии("а", без_регистра=True)]
+        self.assertEqual(фамилии, ["Алексеев", "Андреева", "Афанасьев", "аксенова"])
+
+    def test_запрос_3_обновляется_при_вставке(self):
+        self.assertEqual(запрос_3_по_хранилищу(self.хранилище),
+                         запрос_3_сотрудники_на_а(self.отделы, self.сотрудники))
+        self.хранилище.добавить_сотрудника(Сотрудник(9, "Агеев", 50000.0, 2))
+        self.хранилище.удалить_сотрудника(5)
+        self.assertEqual([s["фамилия"] for s in запрос_3_по_хранилищу(self.хранилище)],
+                         ["Алексеев", "Афанасьев", "Агеев"])
+        self.assertEqual(запрос_3_по_хранилищу(self.хранилище, "Пет"),
+                         [{"фамилия": "Петров", "отдел": "Отдел разработки"}])
+
+class TestТриграммныйИндекс(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+        self.хранилище = Хранилище(self.отделы, self.сотрудники)
+
+    def test_поиск_подстроки(self):
+        индекс = ТриграммныйИндекс()
+        for позиция, отдел in enumerate(self.отделы):
+            индекс.добавить(отдел.id_отдела, отдел.наименование, позиция)
+        self.assertEqual(индекс.найти("ОТДЕЛ"), [1, 2, 3, 4, 5])
+        self.assertEqual(индекс.найти("продаж"), [3])
+        self.assertEqual(индекс.найти("ки"), [1, 4, 5])
+        self.assertEqual(индекс.найти("кадров"), [])
+        self.assertEqual(индекс.кандидаты("продаж"), {3})
+
+    def test_синхронизация_с_отделами(self):
+        self.assertEqual(len(запрос_1_по_хранилищу(self.хранилище)), 5)
+        self.хранилище.добавить_отдел(Отдел(3, "Служба продаж"))
+        self.хранилище.удалить_отдел(5)
+        self.хранилище.добавить_отдел(Отдел(6, "Отдел кадров"))
+        self.assertEqual([item["отдел"] for item in запрос_1_по_хранилищу(self.хранилище)],
+                         ["Отдел разработки", "Отдел маркетинга", "Отдел поддержки", "Отдел кадров"])
+        self.assertEqual([о.id_отдела for о in self.хранилище.найти_отделы("продаж")], [3])
+
+    def test_удаление_и_добавление_отдела(self):
+        self.хранилище.удалить_отдел(1)
+        self.хранилище.добавить_отдел(Отдел(100, "Отдел кадров"))
+        self.assertEqual([о.id_отдела for о in self.хранилище.найти_отделы("отдел")], [2, 3, 4, 5, 100])
+        self.assertEqual([о.id_отдела for о in self.хранилище.найти_отделы("отдел")], list(self.хранилище.отделы))
+
+class TestПотоки(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+        self.хранилище = Хранилище(self.отделы, self.сотрудники)
+
+    def test_поток_запроса_1_совпадает_с_запросом(self):
+        собранный = {}
+        for строка in поток_запроса_1(self.хранилище):
+            собранный.setdefault(строка["отдел"], []).append(строка["сотрудник"])
+        ожидаемый = запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники)
+        self.assertEqual([{"отдел": к, "сотрудники": v} for к, v in собранный.items()], ожидаемый)
+
+    def test_пустой_отдел(self):
+        self.хранилище.добавить_отдел(Отдел(6, "Отдел кадров"))
+        последняя = list(поток_запроса_1(self.хранилище))[-1]
+        self.assertEqual(последняя, {"отдел": "Отдел кадров", "сотрудник": None})
+
+    def test_страницы(self):
+        первая = страница(поток_запроса_1(self.хранилище), 0, 3)
+        вторая = страница(поток_запроса_1(self.хранилище), первая.курсор, 3)
+        последняя = страница(поток_запроса_1(self.хранилище), 6, 3)
+        self.assertEqual((первая.курсор, вторая.курсор, последняя.курсор), (3, 6, None))
+        self.assertEqual(первая.строки + вторая.строки + последняя.строки, list(поток_запроса_1(self.хранилище)))
+        self.assertEqual(len(последняя.строки), 2)
+        with self.assertRaises(ValueError):
+            страница(поток_запроса_2(self.хранилище), 0, 0)
+
+    def test_постранично(self):
+        страницы = list(постранично(поток_запроса_2(self.хранилище), 2))
+        self.assertEqual([len(с) for с in страницы], [2, 2, 1])
+        self.assertEqual(sum(страницы, []), запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        self.assertEqual(list(поток_запроса_3(self.хранилище)), запрос_3_сотрудники_на_а(self.отделы, self.сотрудники))
+
+class TestЗагрузка(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.отделы, self.сотрудники, self.связи = create_test_data()
+        self.каталог = tempfile.TemporaryDirectory()
+        self.addCleanup(self.каталог.cleanup)
+
+    def _файл(self, имя, текст):
+        import os
+        путь = os.path.join(self.каталог.name, имя)
+        with open(путь, "w", encoding="utf-8") as f:
+            f.write(текст)
+        return путь
+
+    def _файлы(self):
+        import json
+        отделы = self._файл("отделы.csv", "наименование,id_отдела\n" + "".join(
+            f"{о.наименование},{о.id_отдела}\n" for о in self.отделы))
+        сотрудники = self._файл("сотрудники.jsonl", "".join(
+            json.dumps([с.id_сотрудника, с.фамилия, с.зарплата, с.id_отдела], ensure_ascii=False) + "\n"
+            for с in self.сотрудники))
+        связи = self._файл("связи.jsonl", "".join(
+            json.dumps({"id_отдела": с.id_отдела, "id_сотрудника": с.id_сотрудника}) + "\n"
+            for с in self.связи))
+        return отделы, сотрудники, связи
+
+    def test_загрузка_из_файлов(self):
+        отделы, сотрудники, связи = self._файлы()
+        напечатано = []
+        загрузка = загрузить(отделы, сотрудники, связи, размер_пакета=3, печать=напечатано.append)
+        self.assertEqual(запрос_1_по_хранилищу(загрузка.хранилище),
+                         запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники))
+        self.assertEqual(загрузка.связи.общие_сотрудники(3, 5), [8])
+        self.assertEqual([(о.таблица, о.строк) for о in загрузка.отчеты],
+                         [("отделы", 5), ("сотрудники", 8), ("связи", 10)])
+        self.assertEqual(len(напечатано), 3)
+
+    def test_компактная_загрузка(self):
+        _, сотрудники, _ = self._файлы()
+        загрузка = загрузить(сотрудники=сотрудники, хранилище=Хранилище(self.отделы), компактно=True)
+        self.assertEqual(запрос_2_по_хранилищу(загрузка.хранилище),
+                         запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        self.assertEqual(запрос_3_по_хранилищу(загрузка.хранилище),
+                         запрос_3_сотрудники_на_а(self.отделы, self.сотрудники))
+        # Ключи индексов - один объект int на сотрудника, а не новый при каждом чтении строки
+        таблица = ТаблицаСотрудников()
+        хранилище = Хранилище((), [таблица.добавить(100000, "Абрамов", 90000.0, 1000)])
+        self.assertIs(next(iter(хранилище.сотрудники)), next(iter(хранилище.сотрудники_по_отделам[1000])))
+
+    def test_пути_pathlib(self):
+        import pathlib
+        отделы, сотрудники, связи = map(pathlib.Path, self._файлы())
+        загрузка = загрузить(отделы, сотрудники, связи, компактно=True)
+        self.assertEqual(запрос_1_по_хранилищу(загрузка.хранилище),
+                         запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники))
+        with self.assertRaises(ValueError):
+            загрузить(отделы=pathlib.Path(self._файл("отделы.txt", "")))
+
+    def test_пустые_строки_csv(self):
+        путь = self._файл("отделы.csv", "\nid_отдела,наименование\n1,Отдел разработки\n\n  \n2,Отдел продаж\n\n")
+        загрузка = загрузить(отделы=путь)
+        self.assertEqual([о.наименование for о in загрузка.хранилище.отделы.values()],
+                         ["Отдел разработки", "Отдел продаж"])
+
+    def test_bom_в_начале_файла(self):
+        путь = self._файл("отделы.csv", "\ufeffid_отдела,наименование\n1,Отдел разработки\n")
+        связи = self._файл("связи.jsonl", '\ufeff{"id_сотрудника": 1, "id_отдела": 1}\n')
+        загрузка = загрузить(отделы=путь, связи=связи)
+        self.assertEqual(загрузка.хранилище.отдел(1).наименование, "Отдел разработки")
+        self.assertEqual(list(загрузка.связи.сотрудники(1)), [1])
+
+    def test_неизвестный_столбец(self):
+        путь = self._файл("отделы.csv", "id,имя\n1,Отдел\n")
+        with self.assertRaises(ValueError):
+            загрузить(отделы=путь)
+
+class TestПараллельныйИсполнитель(unittest.TestCase):
+
+    def test_результаты_совпадают_с_последовательными(self):
+        import random
+        случайные = random.Random(3)
+        отделы, сотрудники, _ = create_test_data()
+        отделы.append(Отдел(6, "Бухгалтерия"))
+        фамилии = ["Абрамов", "Борисов", "Алиева", "Васильев", "Яковлев"]
+        for i in range(9, 500):
+            сотрудники.append(Сотрудник(i, случайные.choice(фамилии), случайные.randrange(30000, 90000) / 3, случайные.randint(1, 7)))
+        with ПараллельныйИсполнитель(отделы, сотрудники, шардов=3, процессов=2) as исполнитель:
+            self.assertEqual(исполнитель.запрос_1_отделы_со_словом_отдел(),
+                             запрос_1_отделы_со_словом_отдел(отделы, сотрудники))
+            self.assertEqual(исполнитель.запрос_2_средняя_зарплата_по_отделам(),
+                             запрос_2_средняя_зарплата_по_отделам(отделы, сотрудники))
+            self.assertEqual(исполнитель.запрос_3_сотрудники_на_а(),
+                             запрос_3_сотрудники_на_а(отделы, сотрудники))
+
+class TestКэшЗапросов(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+        self.хранилище = Хранилище(self.отделы, self.сотрудники)
+        self.кэш = КэшЗапросов(self.хранилище, размер=3)
+
+    def test_попадания_и_промахи(self):
+        первый = self.кэш.запрос_2()
+        self.assertIs(self.кэш.запрос_2(), первый)
+        self.assertEqual(первый, запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        статистика = self.кэш.статистика()
+        self.assertEqual((статистика["попадания"], статистика["промахи"]), (1, 1))
+
+    def test_сбрасываются_только_затронутые(self):
+        self.кэш.запрос_1("продаж")
+        self.кэш.запрос_3("А")
+        self.кэш.запрос_2()
+        версия = self.хранилище.версия
+        # Новый сотрудник отдела разработки на "П" не затрагивает запросы 1 ("продаж") и 3 ("А")
+        self.хранилище.добавить_сотрудника(Сотрудник(9, "Павлов", 90000.0, 1))
+        self.assertEqual(self.хранилище.версия, версия + 1)
+        self.assertEqual(self.кэш.статистика()["сбросы"], 1)
+        self.кэш.запрос_1("продаж")
+        self.кэш.запрос_3("А")
+        self.assertEqual(self.кэш.статистика()["попадания"], 2)
+        # Сотрудник на "А" в отделе продаж затрагивает оба
+        self.хранилище.добавить_сотрудника(Сотрудник(10, "Аникин", 50000.0, 3))
+        self.assertEqual(self.кэш.запрос_3("А"), запрос_3_по_хранилищу(self.хранилище))
+        self.assertEqual(len(self.кэш.запрос_1("продаж")[0]["сотрудники"]), 3)
+
+    def test_переименование_отдела(self):
+        self.кэш.запрос_1("отдел")
+        self.хранилище.добавить_отдел(Отдел(5, "Служба аналитики"))
+        self.assertEqual(len(self.кэш.запрос_1("отдел")), 4)
+        self.assertEqual(self.кэш.статистика()["сбросы"], 1)
+
+    def test_вытеснение_lru(self):
+        for префикс in ["А", "Б", "В"]:
+            self.кэш.запрос_3(префикс)
+        self.кэш.запрос_3("А")
+        self.кэш.запрос_3("Г")
+        self.assertEqual(self.кэш.статистика()["вытеснения"], 1)
+        self.кэш.запрос_3("А")
+        self.кэш.запрос_3("Б")
+        self.assertEqual(self.кэш.статистика()["промахи"], 5)
+
+class TestХранилищеСнимков(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, _ = create_test_data()
+        self.хранилище = ХранилищеСнимков(self.отделы, self.сотрудники)
+
+    def test_запросы_по_снимку(self):
+        снимок = self.хранилище.снимок()
+        self.assertEqual(снимок.запрос_1(), запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники))
+        self.assertEqual(снимок.запрос_2(), запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        self.assertEqual(снимок.запрос_3(), запрос_3_сотрудники_на_а(self.отделы, self.сотрудники))
+
+    def test_снимок_не_видит_изменений(self):
+        старый = self.хранилище.снимок()
+        self.хранилище.удалить_сотрудника(4)
+        self.хранилище.добавить_сотрудника(Сотрудник(9, "Агеев", 50000.0, 2))
+        новый = self.хранилище.снимок()
+        self.assertEqual(новый.версия, старый.версия + 2)
+        self.assertEqual(len(старый), 8)
+        self.assertEqual([s["фамилия"] for s in старый.запрос_3()], ["Алексеев", "Андреева", "Афанасьев"])
+        self.assertEqual([s["фамилия"] for s in новый.запрос_3()], ["Андреева", "Афанасьев", "Агеев"])
+        self.assertIsNone(новый.сотрудник(4))
+        self.assertIs(старый.куски[0][0], новый.куски[0][0])
+
+    def test_транзакция_публикуется_целиком(self):
+        версия = self.хранилище.снимок().версия
+        with self.assertRaises(KeyError):
+            with self.хранилище.транзакция() as т:
+                т.удалить_сотрудника(1)
+                т.удалить_сотрудника(100)
+        self.assertEqual(self.хранилище.снимок().версия, версия)
+        self.assertIsNotNone(self.хранилище.снимок().сотрудник(1))
+
+    def test_отделы_в_транзакции(self):
+        старый = self.хранилище.снимок()
+        with self.хранилище.транзакция() as т:
+            т.добавить_отдел(Отдел(6, "Отдел кадров"))
+            т.удалить_отдел(2)
+            т.добавить_отдел(Отдел(3, "Служба продаж"))
+            т.удалить_отдел(6)
+            т.добавить_отдел(Отдел(6, "Отдел закупок"))
+            т.удалить_отдел(100)
+        self.assertEqual([о.наименование for о in self.хранилище.снимок().отделы],
+                         ["Отдел разработки", "Служба продаж", "Отдел поддержки",
+                          "Отдел аналитики", "Отдел закупок"])
+        self.assertEqual(старый.отделы, tuple(self.отделы))
+
+    def test_много_отделов_в_одной_транзакции(self):
+        операции = [0]
+
+        class Id(int):
+            # Считает сравнения и хеши id: поиск отдела перебором дал бы O(n²) сравнений
+            def __eq__(self, другой):
+                операции[0] += 1
+                return int.__eq__(self, другой)
+
+            def __hash__(self):
+                операции[0] += 1
+                return int.__hash__(self)
+
+        n = 4000
+        хранилище = ХранилищеСнимков()
+        with хранилище.транзакция() as т:
+            for i in range(n):
+                т.добавить_отдел(Отдел(Id(i), f"Отдел {i}"))
+            for i in range(0, n, 2):
+                т.добавить_отдел(Отдел(Id(i), f"Служба {i}"))
+        self.assertEqual(len(хранилище.снимок().отделы), n)
+        self.assertEqual(хранилище.снимок().отделы[2].наименование, "Служба 2")
+        self.assertLess(операции[0], 10 * n)
+
+    def test_чтение_во_время_записи(self):
+        import threading
+        ошибки = []
+
+        def читатель():
+            for _ in range(200):
+                снимок = self.хранилище.снимок()
+                # Снимок согласован: число сотрудников при обходе совпадает с его длиной
+                if len(list(снимок.сотрудники())) != len(снимок):
+                    ошибки.append(снимок.версия)
+
+        потоки = [threading.Thread(target=читатель) for _ in range(4)]
+        for поток in потоки:
+            поток.start()
+        for i in range(300):
+            self.хранилище.добавить_сотрудника(Сотрудник(100 + i % 50, "Новиков", 60000.0, i % 5 + 1))
+        for поток in потоки:
+            поток.join()
+        self.assertEqual(ошибки, [])
+        self.assertEqual(len(self.хранилище.снимок()), 58)
+
+class TestПостроительЗапросов(unittest.TestCase):
+
+    def setUp(self):
+        self.отделы, self.сотрудники, self.связи = create_test_data()
+        self.хранилище = Хранилище(self.отделы, self.сотрудники)
+
+    def test_запросы_1_3_через_построитель(self):
+        self.assertEqual(запрос_1_построитель(self.хранилище),
+                         запрос_1_отделы_со_словом_отдел(self.отделы, self.сотрудники))
+        self.assertEqual(запрос_2_построитель(self.хранилище),
+                         запрос_2_средняя_зарплата_по_отделам(self.отделы, self.сотрудники))
+        self.assertEqual(запрос_3_построитель(self.хранилище),
+                         запрос_3_сотрудники_на_а(self.отделы, self.сотрудники))
+
+    def test_план_использует_индексы(self):
+        запрос = (Запрос(self.хранилище)
+                  .из_("отделы", "о").где("о.наименование", "содержит", "отдел")
+                  .соединить("сотрудники", "с", "о.id_отдела", "с.id_отдела")
+                  .где("с.зарплата", ">", 80000))
+        план = запрос.план()
+        self.assertIn("триграммный индекс", план[0])
+        # Фильтр по зарплате опущен под соединение
+        self.assertIn("хеш-индекс с.id_отдела, фильтр с.зарплата > 80000", план[1])
+        self.assertEqual(sorted(с["с"].фамилия for с in запрос), ["Афанасьев", "Петров"])
+
+        префикс = (Запрос(self.хранилище)
+                   .из_("отделы", "о")
+                   .соединить("сотрудники", "с", "о.id_отдела", "с.id_отдела")
+                   .где("с.фамилия", "начинается", "А"))
+        self.assertIn("хеш-соединение с сотрудники с: префиксный индекс", префикс.план()[1])
+        self.assertEqual(len(префикс.выполнить()), 3)
+
+    def test_группировка_сортировка_ограничение(self):
+        запрос = (Запрос(self.хранилище)
+                  .из_("сотрудники", "с")
+                  .сгруппировать("с.id_отдела", количество=("количество", "с.id_сотрудника"),
+                                 максимум=("максимум", "с.зарплата"))
+                  .выбрать(отдел="с.id_отдела", количество="количество", максимум="максимум")
+                  .упорядочить("максимум", по_убыванию=True)
+                  .ограничить(2))
+        self.assertIn("группировка хешированием", запрос.план())
+        self.assertEqual(запрос.выполнить(), [
+            {"отдел": 1, "количество": 3, "максимум": 85000.0},
+            {"отдел": 4, "количество": 1, "максимум": 79000.0},
+        ])
+
+    def test_связи_многие_ко_многим(self):
+        индекс = ИндексСвязей(self.связи)
+        запрос = (Запрос(self.хранилище, индекс)
+                  .из_("связи", "л").где("л.id_отдела", "==", 1)
+                  .соединить("сотрудники", "с", "л.id_сотрудника", "с.id_сотрудника")
+                  .выбрать(фамилия="с.фамилия"))
+        self.assertEqual(запрос.план()[0], "связи л: хеш-индекс л.id_отдела == 1")
+        ожидаемые = {с.фамилия for с in self.сотрудники if с.id_сотрудника in индекс.сотрудники(1)}
+        self.assertEqual({с["фамилия"] for с in запрос}, ожидаемые)
+
+    def test_фильтр_справа_у_левого_соединения(self):
+        self.хранилище.добавить_сотрудника(Сотрудник(9, "Аксенов", 60000.0, 99))
+        запрос = (Запрос(self.хранилище)
+                  .из_("сотрудники", "с").где("с.фамилия", "начинается", "А")
+                  .соединить("отделы", "о", "с.id_отдела", "о.id_отдела", левое=True)
+                  .где("о.наименование", "содержит", "продаж")
+                  .выбрать(фамилия="с.фамилия", отдел="о.наименование"))
+        # Фильтр остается над соединением (WHERE): строки без пары отбрасываются, а не дополняются None
+        self.assertIn("затем фильтр о.наименование содержит 'продаж'", запрос.план()[1])
+        self.assertEqual(запрос.выполнить(), [{"фамилия": "Алексеев", "отдел": "Отдел продаж"}])
+
+        по_строкам = (Запрос(self.хранилище)
+                      .из_("отделы", "о")
+                      .соединить("сотрудники", "с", "о.id_отдела", "с.id_отдела", левое=True)
+                      .где("с.зарплата", ">", 80000))
+        self.assertIn("затем фильтр с.зарплата > 80000", по_строкам.план()[1])
+        self.assertEqual([(с["о"].id_отдела, с["с"].фамилия) for с in по_строкам],
+                         [(1, "Петров"), (1, "Афанасьев")])
+
+        # Без фильтра строка без пары остается; все строки - через словарь значений отделов
+        for префикс in ("А", ""):
+            self.assertEqual(запрос_3_построитель(self.хранилище, префикс),
+                             запрос_3_по_хранилищу(self.хранилище, префикс))
+
+    def test_совпадает_с_ручными_запросами(self):
+        # Скорость построителя сравнивает benchmark.py (--макс-отношение), здесь - только результаты
+        отделы, сотрудники, _ = сгенерировать_организацию(20000, зерно=1)
+        хранилище = Хранилище(отделы, сотрудники)
+        пары = ((запрос_1_по_хранилищу, запрос_1_построитель), (запрос_2_по_хранилищу, запрос_2_построитель),
+                (запрос_3_по_хранилищу, запрос_3_построитель))
+        for ручной, построитель in пары:
+            self.assertEqual(построитель(хранилище), ручной(хранилище), построитель.__name__)
+
+    def test_ошибки(self):
+        with self.assertRaises(ValueError):
+            Запрос(self.хранилище).из_("связи", "л")
+        with self.assertRaises(ValueError):
+            Запрос(self.хранилище).из_("отделы", "о").где("о.наименование", "~", "x")
+        with self.assertRaises(ValueError):
+            Запрос(self.хранилище).из_("отделы", "о").где("х.id_отдела", "==", 1).выполнить()
+
+class TestЗамеры(unittest.TestCase):
+
+    def test_генератор_воспроизводим(self):
+        первый = сгенерировать_организацию(500, отделов=20, связей_на_сотрудника=2.5, фамилии="зипф", зерно=7)
+        второй = сгенерировать_организацию(500, отделов=20, связей_на_сотрудника=2.5, фамилии="зипф", зерно=7)
+        def поля(объекты):
+            return [tuple(getattr(х, п) for п in х.__slots__) for х in объекты]
+        for a, b in zip(первый, второй):
+            self.assertEqual(поля(a), поля(b))
+        отделы, сотрудники, связи = первый
+        self.assertEqual(len(отделы), 20)
+        self.assertEqual(len(сотрудники), 500)
+        self.assertTrue(2 * 500 <= len(связи) <= 3 * 500)
+        # Связи сотрудника ведут в разные отделы
+        пары = {(с.id_сотрудника, с.id_отдела) for с in связи}
+        self.assertEqual(len(пары), len(связи))
+
+    def test_уникальные_фамилии(self):
+        _, сотрудники, _ = сгенерировать_организацию(300, фамилии="уникальные")
+        self.assertEqual(len({с.фамилия for с in сотрудники}), 300)
+
+    def test_запуск(self):
+        отчет = запустить((200, 2000), повторов=1)
+        запросы = {(р["реализация"], р["запрос"]) for р in отчет["результаты"]}
+        self.assertIn(("хранилище", "запрос_3"), запросы)
+        self.assertIn(("многие_ко_многим", "подготовка"), запросы)
+        for р in отчет["результаты"]:
+            self.assertGreaterEqual(р["секунд"], 0)
+            self.assertGreaterEqual(р["пик_памяти"], 0)
+
+    def test_показатели_роста(self):
+        результаты = [
+            {"реализация": "р", "запрос": "з", "сотрудников": 1000, "секунд": 0.01},
+            {"реализация": "р", "запрос": "з", "сотрудников": 10000, "секунд": 1.0},
+        ]
+        self.assertEqual(показатели_роста(результаты)[0]["наклон"], 2.0)
+
+    def test_отношения_к_хранилищу(self):
+        результаты = [
+            {"реализация": "хранилище", "запрос": "запрос_2", "сотрудников": 1000, "секунд": 0.02},
+            {"реализация": "построитель", "запрос": "запрос_2", "сотрудников": 1000, "секунд": 0.025},
+            {"реализация": "хранилище", "запрос": "запрос_3", "сотрудников": 1000, "секунд": 0.0001},
+            {"реализация": "построитель", "запрос": "запрос_3", "сотрудников": 1000, "секунд": 0.01},
+        ]
+        self.assertEqual(отношения_к_хранилищу(результаты), [
+            {"реализация": "построитель", "запрос": "запрос_2", "сотрудников": 1000, "отношение": 1.25},
+        ])
+
+if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
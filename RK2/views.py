@@ -0,0 +1,231 @@
+import random
+
+
+class _Узел:
+    __slots__ = ("ключ", "приоритет", "размер", "левый", "правый")
+
+    def __init__(self, ключ, приоритет):
+        self.ключ = ключ
+        self.приоритет = приоритет
+        self.размер = 1
+        self.левый = None
+        self.правый = None
+
+
+def _размер(узел):
+    return узел.размер if узел else 0
+
+
+def _обновить(узел):
+    узел.размер = 1 + _размер(узел.левый) + _размер(узел.правый)
+    return узел
+
+
+def _разделить(узел, ключ):
+    # (ключи < ключ, ключи >= ключ)
+    if узел is None:
+        return None, None
+    if узел.ключ < ключ:
+        левый, правый = _разделить(узел.правый, ключ)
+        узел.правый = левый
+        return _обновить(узел), правый
+    левый, правый = _разделить(узел.левый, ключ)
+    узел.левый = правый
+    return левый, _обновить(узел)
+
+
+def _слить(левый, правый):
+    if левый is None:
+        return правый
+    if правый is None:
+        return левый
+    if левый.приоритет > правый.приоритет:
+        левый.правый = _слить(левый.правый, правый)
+        return _обновить(левый)
+    правый.левый = _слить(левый, правый.левый)
+    return _обновить(правый)
+
+
+def _разделить_первый(узел):
+    # Отделяет наименьший элемент поддерева
+    if узел is None:
+        return None, None
+    if узел.левый is None:
+        правый = узел.правый
+        узел.правый = None
+        return _обновить(узел), правый
+    первый, узел.левый = _разделить_первый(узел.левый)
+    return первый, _обновить(узел)
+
+
+class ДеревоПорядка:
+    """Декартово дерево с размерами поддеревьев: вставка, удаление и k-й элемент за O(log n)"""
+
+    def __init__(self, seed=0):
+        self._корень = None
+        self._случайные = random.Random(seed)
+
+    def __len__(self):
+        return _размер(self._корень)
+
+    def вставить(self, ключ):
+        левый, правый = _разделить(self._корень, ключ)
+        узел = _Узел(ключ, self._случайные.random())
+        self._корень = _слить(_слить(левый, узел), правый)
+
+    def удалить(self, ключ):
+        левый, правый = _разделить(self._корень, ключ)
+        _, правый = _разделить_первый(правый)
+        self._корень = _слить(левый, правый)
+
+    def k_й(self, k):
+        узел = self._корень
+        while узел:
+            слева = _размер(узел.левый)
+            if k < слева:
+                узел = узел.левый
+            elif k == слева:
+                return узел.ключ
+            else:
+                k -= слева + 1
+                узел = узел.правый
+        raise IndexError(k)
+
+    def ранг(self, ключ):
+        # Количество ключей меньше заданного
+        ранг = 0
+        узел = self._корень
+        while узел:
+            if узел.ключ < ключ:
+                ранг += _размер(узел.левый) + 1
+                узел = узел.правый
+            else:
+                узел = узел.левый
+        return ранг
+
+    def срез(self, начало=0, количество=None):
+        # Ключи по порядку начиная с позиции начало: O(log n + k)
+        конец = len(self) if количество is None else min(len(self), начало + количество)
+        стек = []
+        узел = self._корень
+        пропустить = начало
+        while узел:
+            слева = _размер(узел.левый)
+            if пропустить < слева:
+                стек.append(узел)
+                узел = узел.левый
+            elif пропустить == слева:
+                стек.append(узел)
+                break
+            else:
+                пропустить -= слева + 1
+                узел = узел.правый
+        позиция = начало
+        while стек and позиция < конец:
+            узел = стек.pop()
+            yield узел.ключ
+            позиция += 1
+            узел = узел.правый
+            while узел:
+                стек.append(узел)
+                узел = узел.левый
+
+    def __iter__(self):
+        return self.срез()
+
+
+class ПредставлениеЗарплат:
+    """Материализованное представление для запроса 2
+
+    Для каждого отдела хранятся зарплаты сотрудников по их позиции в общем
+    порядке добавления, а отделы упорядочены в ДеревеПорядка по
+    (-средняя, порядок добавления отдела) - тот же порядок, что дает
+    устойчивая сортировка в запросе 2. Изменение сотрудника только помечает
+    отдел; при чтении рейтинга сумма помеченного отдела пересчитывается
+    через sum() по зарплатам в порядке позиций, как в запросе 2, и отдел
+    переставляется в дереве за O(log n).
+    """
+
+    def __init__(self, отделы=(), сотрудники=()):
+        self._отделы = {}  # id_отдела -> (порядок, наименование)
+        self._зарплаты = {}  # id_отдела -> {позиция сотрудника: зарплата}
+        self._ключи = {}  # id_отдела -> ключ в дереве
+        self._сотрудники = {}  # id_сотрудника -> (позиция, id_отдела)
+        self._следующая_позиция = 0
+        self._измененные = set()
+        self._рейтинг = ДеревоПорядка()
+        for отдел in отделы:
+            self.добавить_отдел(отдел)
+        for сотрудник in сотрудники:
+            self.добавить_сотрудника(сотрудник)
+
+    def добавить_отдел(self, отдел):
+        порядок = self._отделы[отдел.id_отдела][0] if отдел.id_отдела in self._отделы else len(self._отделы)
+        self._отделы[отдел.id_отдела] = (порядок, отдел.наименование)
+        self._измененные.add(отдел.id_отдела)
+
+    def добавить_сотрудника(self, сотрудник):
+        if сотрудник.id_сотрудника in self._сотрудники:
+            # Замена сотрудника сохраняет его место в общем порядке
+            позиция = self._сотрудники[сотрудник.id_сотрудника][0]
+            self.удалить_сотрудника(сотрудник.id_сотрудника)
+        else:
+            позиция = self._следующая_позиция
+            self._следующая_позиция += 1
+        self._сотрудники[сотрудник.id_сотрудника] = (позиция, сотрудник.id_отдела)
+        self._зарплаты.setdefault(сотрудник.id_отдела, {})[позиция] = сотрудник.зарплата
+        self._измененные.add(сотрудник.id_отдела)
+
+    def удалить_сотрудника(self, id_сотрудника):
+        позиция, id_отдела = self._сотрудники.pop(id_сотрудника)
+        зарплаты = self._зарплаты[id_отдела]
+        del зарплаты[позиция]
+        if not зарплаты:
+            del self._зарплаты[id_отдела]
+        self._измененные.add(id_отдела)
+
+    def изменить_зарплату(self, id_сотрудника, зарплата):
+        позиция, id_отдела = self._сотрудники[id_сотрудника]
+        self._зарплаты[id_отдела][позиция] = зарплата
+        self._измененные.add(id_отдела)
+
+    def перевести(self, id_сотрудника, id_отдела):
+        позиция, старый = self._сотрудники[id_сотрудника]
+        зарплаты = self._зарплаты[старый]
+        зарплата = зарплаты.pop(позиция)
+        if not зарплаты:
+            del self._зарплаты[старый]
+        self._сотрудники[id_сотрудника] = (позиция, id_отдела)
+        self._зарплаты.setdefault(id_отдела, {})[позиция] = зарплата
+        self._измененные.update((старый, id_отдела))
+
+    def _применить(self):
+        for id_отдела in self._измененные:
+            self._переставить(id_отдела)
+        self._измененные.clear()
+
+    def _переставить(self, id_отдела):
+        старый = self._ключи.pop(id_отдела, None)
+        if старый is not None:
+            self._рейтинг.удалить(старый)
+        if id_отдела in self._отделы and id_отдела in self._зарплаты:
+            ключ = (-self.средняя(id_отдела), self._отделы[id_отдела][0], id_отдела)
+            self._ключи[id_отдела] = ключ
+            self._рейтинг.вставить(ключ)
+
+    def средняя(self, id_отдела):
+        зарплаты = self._зарплаты[id_отдела]
+        return round(sum([зарплаты[позиция] for позиция in sorted(зарплаты)]) / len(зарплаты), 2)
+
+    def место(self, id_отдела):
+        # Позиция отдела в рейтинге, начиная с 0
+        self._применить()
+        return self._рейтинг.ранг(self._ключи[id_отдела])
+
+    def рейтинг(self, начало=0, количество=None):
+        """Результат запроса 2 (или его страница) без просмотра сотрудников"""
+        self._применить()
+        return [
+            (self._отделы[id_отдела][1], -минус_средняя)
+            for минус_средняя, _, id_отдела in self._рейтинг.срез(начало, количество)
+        ]
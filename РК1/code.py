@@ -1,3 +1,8 @@
+import argparse
+import random
+import sys
+from itertools import islice
+
 class Сотрудник:
     def __init__(self, id_сотрудника, фамилия, зарплата, id_отдела):
         self.id_сотрудника = id_сотрудника
@@ -15,74 +20,154 @@ class СотрудникиОтдела:
         self.id_сотрудника = id_сотрудника
         self.id_отдела = id_отдела
 
-# Тестовые данные для Отделов
-отделы = [
-    Отдел(1, "Отдел разработки"),
-    Отдел(2, "Отдел маркетинга"),
-    Отдел(3, "Отдел продаж"),
-    Отдел(4, "Отдел поддержки"),
-    Отдел(5, "Отдел аналитики")
-]
-
-# Тестовые данные для Сотрудников
-сотрудники = [
-    Сотрудник(1, "Иванов", 75000.0, 1),
-    Сотрудник(2, "Петров", 82000.0, 1),
-    Сотрудник(3, "Сидоров", 68000.0, 2),
-    Сотрудник(4, "Алексеев", 71000.0, 3),
-    Сотрудник(5, "Андреева", 79000.0, 4),
-    Сотрудник(6, "Белов", 65000.0, 5),
-    Сотрудник(7, "Афанасьев", 85000.0, 1),
-    Сотрудник(8, "Григорьева", 73000.0, 3)
-]
-
-сотрудники_отдела = [
-    СотрудникиОтдела(1, 1),
-    СотрудникиОтдела(1, 3),
-    СотрудникиОтдела(2, 1),
-    СотрудникиОтдела(3, 2),
-    СотрудникиОтдела(4, 3),
-    СотрудникиОтдела(5, 4),
-    СотрудникиОтдела(6, 5),
-    СотрудникиОтдела(7, 1),
-    СотрудникиОтдела(8, 3),
-    СотрудникиОтдела(8, 5)
-]
-
-print("=== Запрос 1 ===")
-отделы_с_словом_отдел = [отдел for отдел in отделы if "отдел" in отдел.наименование.lower()]
-print("Отделы, содержащие слово 'отдел':")
-for отдел in отделы_с_словом_отдел:
-    print(f"  - {отдел.наименование}")
-
-print("\nСотрудники, работающие в этих отделах:")
-for отдел in отделы_с_словом_отдел:
-    сотрудники_в_отделе = [сотр for сотр in сотрудники if сотр.id_отдела == отдел.id_отдела]
-    print(f"  {отдел.наименование}:")
-    for сотр in сотрудники_в_отделе:
-        print(f"    {сотр.фамилия} (ID: {сотр.id_сотрудника}, Зарплата: {сотр.зарплата})")
-
-print("\n=== Запрос 2 ===")
-# Группировка сотрудников по отделам и вычисление средней зарплаты
-средняя_зарплата_по_отделам = []
-for отдел in отделы:
-    зарплаты_в_отделе = [сотр.зарплата for сотр in сотрудники if сотр.id_отдела == отдел.id_отдела]
-    if зарплаты_в_отделе:  # Проверка, что в отделе есть сотрудники
-        средняя_зарплата = sum(зарплаты_в_отделе) / len(зарплаты_в_отделе)
-        средняя_зарплата = round(средняя_зарплата, 2)  # Округление до 2 знаков
-        средняя_зарплата_по_отделам.append((отдел.наименование, средняя_зарплата))
-
-# Сортировка по средней зарплате (по убыванию)
-средняя_зарплата_по_отделам.sort(key=lambda x: x[1], reverse=True)
-
-print("Отделы, отсортированные по средней зарплате (убывание):")
-for название, средняя in средняя_зарплата_по_отделам:
-    print(f"  {название}: {средняя}")
-
-print("\n=== Запрос 3 ===")
-сотрудники_с_а = [сотр for сотр in сотрудники if сотр.фамилия.startswith("А")]
-print("Сотрудники, чья фамилия начинается с 'А':")
-for сотр in сотрудники_с_а:
-    отдел = next((отд for отд in отделы if отд.id_отдела == сотр.id_отдела), None)
-    отдел_название = отдел.наименование if отдел else "Неизвестный отдел"
-    print(f"  {сотр.фамилия} (Отдел: {отдел_название})")
+def create_test_data():
+    # Тестовые данные для Отделов
+    отделы = [
+        Отдел(1, "Отдел разработки"),
+        Отдел(2, "Отдел маркетинга"),
+        Отдел(3, "Отдел продаж"),
+        Отдел(4, "Отдел поддержки"),
+        Отдел(5, "Отдел аналитики")
+    ]
+
+    # Тестовые данные для Сотрудников
+    сотрудники = [
+        Сотрудник(1, "Иванов", 75000.0, 1),
+        Сотрудник(2, "Петров", 82000.0, 1),
+        Сотрудник(3, "Сидоров", 68000.0, 2),
+        Сотрудник(4, "Алексеев", 71000.0, 3),
+        Сотрудник(5, "Андреева", 79000.0, 4),
+        Сотрудник(6, "Белов", 65000.0, 5),
+        Сотрудник(7, "Афанасьев", 85000.0, 1),
+        Сотрудник(8, "Григорьева", 73000.0, 3)
+    ]
+
+    сотрудники_отдела = [
+        СотрудникиОтдела(1, 1),
+        СотрудникиОтдела(1, 3),
+        СотрудникиОтдела(2, 1),
+        СотрудникиОтдела(3, 2),
+        СотрудникиОтдела(4, 3),
+        СотрудникиОтдела(5, 4),
+        СотрудникиОтдела(6, 5),
+        СотрудникиОтдела(7, 1),
+        СотрудникиОтдела(8, 3),
+        СотрудникиОтдела(8, 5)
+    ]
+
+    return отделы, сотрудники, сотрудники_отдела
+
+def сгенерировать_данные(сотрудников, отделов=None, зерно=0):
+    """Большой набор данных той же структуры; одно зерно - одни и те же данные"""
+    rng = random.Random(зерно)
+    отделов = отделов or max(1, сотрудников // 100)
+    названия = ["Отдел", "Группа", "Служба"]
+    список_отделов = [Отдел(i, f"{rng.choice(названия)} {i}") for i in range(1, отделов + 1)]
+    фамилии = ["Иванов", "Петров", "Сидоров", "Алексеев", "Андреева", "Белов", "Афанасьев", "Григорьева"]
+    список_сотрудников = [
+        Сотрудник(i, rng.choice(фамилии), float(rng.randrange(30000, 200000, 500)), rng.randint(1, отделов))
+        for i in range(1, сотрудников + 1)
+    ]
+    связи = [СотрудникиОтдела(с.id_сотрудника, с.id_отдела) for с in список_сотрудников]
+    return список_отделов, список_сотрудников, связи
+
+class Отчеты:
+    """Три запроса РК1 по требованию: ничего не вычисляется до обращения
+
+    Сотрудники группируются по отделам, а отделы - по id один раз, при
+    первом запросе, которому это нужно; дальше поиск - по словарю, а не
+    перебором списков. Запросы возвращают генераторы строк вывода.
+    """
+
+    def __init__(self, отделы, сотрудники):
+        self.отделы = отделы
+        self.сотрудники = сотрудники
+        self._отделы_по_id = None
+        self._сотрудники_по_отделам = None
+
+    def отделы_по_id(self):
+        if self._отделы_по_id is None:
+            self._отделы_по_id = {отд.id_отдела: отд for отд in self.отделы}
+        return self._отделы_по_id
+
+    def сотрудники_по_отделам(self):
+        if self._сотрудники_по_отделам is None:
+            группы = {}
+            for сотр in self.сотрудники:
+                группы.setdefault(сотр.id_отдела, []).append(сотр)
+            self._сотрудники_по_отделам = группы
+        return self._сотрудники_по_отделам
+
+    def запрос_1(self):
+        отделы_с_словом_отдел = [отдел for отдел in self.отделы if "отдел" in отдел.наименование.lower()]
+        yield "=== Запрос 1 ==="
+        yield "Отделы, содержащие слово 'отдел':"
+        for отдел in отделы_с_словом_отдел:
+            yield f"  - {отдел.наименование}"
+
+        yield "\nСотрудники, работающие в этих отделах:"
+        по_отделам = self.сотрудники_по_отделам()
+        for отдел in отделы_с_словом_отдел:
+            yield f"  {отдел.наименование}:"
+            for сотр in по_отделам.get(отдел.id_отдела, ()):
+                yield f"    {сотр.фамилия} (ID: {сотр.id_сотрудника}, Зарплата: {сотр.зарплата})"
+
+    def запрос_2(self):
+        # Группировка сотрудников по отделам и вычисление средней зарплаты
+        по_отделам = self.сотрудники_по_отделам()
+        средняя_зарплата_по_отделам = []
+        for отдел in self.отделы:
+            зарплаты_в_отделе = [сотр.зарплата for сотр in по_отделам.get(отдел.id_отдела, ())]
+            if зарплаты_в_отделе:  # Проверка, что в отделе есть сотрудники
+                средняя_зарплата = sum(зарплаты_в_отделе) / len(зарплаты_в_отделе)
+                средняя_зарплата = round(средняя_зарплата, 2)  # Округление до 2 знаков
+                средняя_зарплата_по_отделам.append((отдел.наименование, средняя_зарплата))
+
+        # Сортировка по средней зарплате (по убыванию)
+        средняя_зарплата_по_отделам.sort(key=lambda x: x[1], reverse=True)
+
+        yield "\n=== Запрос 2 ==="
+        yield "Отделы, отсортированные по средней зарплате (убывание):"
+        for название, средняя in средняя_зарплата_по_отделам:
+            yield f"  {название}: {средняя}"
+
+    def запрос_3(self, префикс="А"):
+        отделы_по_id = self.отделы_по_id()
+        yield "\n=== Запрос 3 ==="
+        yield f"Сотрудники, чья фамилия начинается с '{префикс}':"
+        for сотр in self.сотрудники:
+            if сотр.фамилия.startswith(префикс):
+                отдел = отделы_по_id.get(сотр.id_отдела)
+                отдел_название = отдел.наименование if отдел else "Неизвестный отдел"
+                yield f"  {сотр.фамилия} (Отдел: {отдел_название})"
+
+    def все(self):
+        yield from self.запрос_1()
+        yield from self.запрос_2()
+        yield from self.запрос_3()
+
+def вывести(строки, файл=None, строк_в_блоке=1000):
+    """Пишет строки блоками: один write на блок вместо print на каждую строку"""
+    файл = файл or sys.stdout
+    строки = iter(строки)
+    while True:
+        блок = list(islice(строки, строк_в_блоке))
+        if not блок:
+            break
+        файл.write("\n".join(блок) + "\n")
+    файл.flush()
+
+def main(аргументы=None):
+    разбор = argparse.ArgumentParser(description="Запросы РК1")
+    разбор.add_argument("--сотрудников", type=int, help="сгенерировать столько сотрудников вместо тестовых данных")
+    разбор.add_argument("--отделов", type=int)
+    разбор.add_argument("--зерно", type=int, default=0)
+    а = разбор.parse_args(аргументы)
+    if а.сотрудников is None:
+        отделы, сотрудники, _ = create_test_data()
+    else:
+        отделы, сотрудники, _ = сгенерировать_данные(а.сотрудников, а.отделов, а.зерно)
+    вывести(Отчеты(отделы, сотрудники).все())
+
+if __name__ == "__main__":
+    main()